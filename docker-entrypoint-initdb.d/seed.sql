@@ -1,6 +1,7 @@
 -- Создание расширения и необходимых типов
 CREATE
 EXTENSION IF NOT EXISTS "uuid-ossp";
+CREATE EXTENSION IF NOT EXISTS btree_gist;
 
 CREATE TYPE userrole AS ENUM ('USER', 'ADMIN');
 CREATE TYPE workplacestatus AS ENUM ('FREE', 'BOOKED', 'INACTIVE');
@@ -58,6 +59,7 @@ CREATE TABLE IF NOT EXISTS coworkings
     photo_url VARCHAR NOT NULL,
     cover_url VARCHAR NOT NULL,
     description VARCHAR,
+    floor_plan_version INT NOT NULL DEFAULT 1,
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
     );
 
@@ -75,6 +77,7 @@ CREATE TABLE IF NOT EXISTS coworking_tariffs
     name VARCHAR NOT NULL,
     color VARCHAR NOT NULL,
     price_per_hour INT NOT NULL,
+    pricing_rules JSONB NULL,
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     FOREIGN KEY
 (
@@ -121,6 +124,20 @@ CREATE TABLE IF NOT EXISTS workplaces
   ON DELETE CASCADE
     );
 
+CREATE TABLE IF NOT EXISTS booking_series
+(
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    user_id BIGINT NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    workplace_ids UUID [] NOT NULL,
+    start_time TIMESTAMP NOT NULL,
+    end_time TIMESTAMP NOT NULL,
+    weekdays INT [] NOT NULL,
+    interval INT NOT NULL DEFAULT 1,
+    until TIMESTAMP NULL,
+    count INT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
 CREATE TABLE IF NOT EXISTS bookings
 (
     id
@@ -132,10 +149,13 @@ CREATE TABLE IF NOT EXISTS bookings
 (
 ),
     user_id BIGINT NOT NULL,
+    coworking_id UUID NOT NULL REFERENCES coworkings (id) ON DELETE CASCADE,
     start_time TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
     end_time TIMESTAMP NOT NULL,
     total_price INT NOT NULL,
     created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP,
+    notified_at TIMESTAMP,
+    series_id UUID NULL REFERENCES booking_series (id) ON DELETE SET NULL,
     FOREIGN KEY
 (
     user_id
@@ -155,12 +175,14 @@ CREATE TABLE IF NOT EXISTS booking_workplaces
     UUID
     NOT
     NULL,
+    period TSRANGE NOT NULL,
     PRIMARY
     KEY
 (
     booking_id,
     workplace_id
 ),
+    CONSTRAINT booking_workplaces_no_overlap EXCLUDE USING gist (workplace_id WITH =, period WITH &&),
     FOREIGN KEY
 (
     booking_id
@@ -178,6 +200,29 @@ CREATE TABLE IF NOT EXISTS booking_workplaces
   ON DELETE CASCADE
     );
 
+CREATE TABLE IF NOT EXISTS waitlist_entries
+(
+    id UUID PRIMARY KEY DEFAULT uuid_generate_v4(),
+    user_id BIGINT NOT NULL REFERENCES users (id) ON DELETE CASCADE,
+    workplace_id UUID NOT NULL REFERENCES workplaces (id) ON DELETE CASCADE,
+    start_time TIMESTAMP NOT NULL,
+    end_time TIMESTAMP NOT NULL,
+    period TSRANGE NOT NULL,
+    created_at TIMESTAMP NOT NULL DEFAULT CURRENT_TIMESTAMP
+);
+
+CREATE INDEX IF NOT EXISTS ix_bookings_start_time_id ON bookings (start_time, id);
+CREATE INDEX IF NOT EXISTS ix_bookings_user_id_start_time_id ON bookings (user_id, start_time, id);
+CREATE INDEX IF NOT EXISTS ix_bookings_end_time ON bookings (end_time);
+CREATE INDEX IF NOT EXISTS ix_bookings_notified_at ON bookings (notified_at);
+CREATE INDEX IF NOT EXISTS ix_bookings_start_time_not_notified ON bookings (start_time) WHERE notified_at IS NULL;
+CREATE INDEX IF NOT EXISTS ix_bookings_series_id ON bookings (series_id);
+CREATE INDEX IF NOT EXISTS ix_bookings_coworking_id_start_time_id ON bookings (coworking_id, start_time, id);
+CREATE INDEX IF NOT EXISTS ix_booking_workplaces_workplace_id ON booking_workplaces (workplace_id);
+CREATE INDEX IF NOT EXISTS ix_workplaces_coworking_id ON workplaces (coworking_id);
+CREATE INDEX IF NOT EXISTS ix_coworking_tariffs_coworking_id_name ON coworking_tariffs (coworking_id, name);
+CREATE INDEX IF NOT EXISTS ix_waitlist_entries_workplace_id_period ON waitlist_entries USING gist (workplace_id, period);
+
 ----------------------------------------------------
 -- Вставка данных для "Основной коворкинг", тарифов и рабочих мест
 ----------------------------------------------------
@@ -2,22 +2,69 @@ from typing import Annotated, List, Optional
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, Response, Query, Body, status, Depends
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Response, Query, Body, Header, status, Depends
+from fastapi.responses import StreamingResponse
 
 from api.v1.filters.auth import oauth2_scheme
-from core.exceptions import UserUnauthorizedError, EntityNotFoundError, AccessDeniedError
-from domain.dto.booking import BookingDTO, BookingCreateDTO
-from domain.dto.misc import TgId, CoworkingId, BookingId
+from core.exceptions import UserUnauthorizedError, EntityNotFoundError, AccessDeniedError, ConflictError
+from core.responses import FastJSONResponse
+from domain.dto.booking import (
+    BookingDTO,
+    BookingPageDTO,
+    BookingCreateDTO,
+    BookingFilterDTO,
+    BookingBulkCreateDTO,
+    BookingBulkResultDTO,
+    BookingQuoteCreateDTO,
+    BookingQuoteResultDTO,
+    BookingSeriesCreateDTO,
+    BookingSeriesDTO,
+    BookingSuggestionsDTO,
+    PendingBookingsDTO,
+    HoldDTO,
+    WaitlistEntryCreateDTO,
+    WaitlistEntryDTO,
+)
+from domain.dto.misc import (
+    TgId,
+    CoworkingId,
+    BookingId,
+    BookingStatus,
+    BookingStartTime,
+    BookingEndTime,
+    PageLimit,
+    PageCursor,
+    ExportFormat,
+    IdempotencyKey,
+    ReminderWindowMinutes,
+    NotifiedAt,
+    HoldId,
+    SeriesId,
+    WorkplaceId,
+    SuggestionLimit,
+    WaitlistEntryId,
+)
 from domain.interactors.auth import OAuth2PasswordBearerInteractor
 from domain.interactors.booking import (
     GetBookingInteractor,
     ListUserBookingsInteractor,
     ListCoworkingBookingsInteractor,
     ListAllBookingsInteractor,
+    ExportBookingsInteractor,
+    AddHoldInteractor,
+    DeleteHoldInteractor,
+    SuggestBookingSlotsInteractor,
     AddBookingInteractor,
+    AddBookingsBulkInteractor,
+    QuoteBookingsInteractor,
+    AddBookingSeriesInteractor,
+    DeleteBookingSeriesInteractor,
     UpdateBookingInteractor,
     DeleteBookingInteractor,
+    AddWaitlistEntryInteractor,
+    DeleteWaitlistEntryInteractor,
+    PromotedBookingsInteractor,
+    AckPromotedBookingsInteractor,
     ActivateBookingInteractor,
     PendingBookingsInteractor,
 )
@@ -57,17 +104,17 @@ async def get_booking(
     try:
         tg_id, _ = await oauth_interactor(token)
         booking = await booking_interactor(booking_id)
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
             content=booking,
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail},
         )
     except EntityNotFoundError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"detail": exc.detail},
         )
@@ -75,7 +122,7 @@ async def get_booking(
 
 @router.get(
     "/list/user",
-    response_model=List[BookingDTO],
+    response_model=BookingPageDTO,
     responses={
         status.HTTP_401_UNAUTHORIZED: {
             "description": "Not authenticate",
@@ -100,7 +147,12 @@ async def list_user_bookings(
         token: Annotated[str, Depends(oauth2_scheme)],
         auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
         booking_interactor: FromDishka[ListUserBookingsInteractor],
-        user_id: Optional[TgId] = Query(default=None)
+        user_id: Optional[TgId] = Query(default=None),
+        limit: PageLimit = Query(default=50),
+        cursor: Optional[PageCursor] = Query(default=None),
+        booking_status: Optional[BookingStatus] = Query(default=None, alias="status"),
+        start: Optional[BookingStartTime] = Query(default=None),
+        end: Optional[BookingEndTime] = Query(default=None),
 ) -> Response:
     try:
         tg_id, is_admin = await auth_interactor(token)
@@ -108,19 +160,20 @@ async def list_user_bookings(
         if user_id:
             tg_id = user_id
             admin = True
-        user_bookings = await booking_interactor(tg_id=tg_id, admin=admin,
-                                                 is_admin=is_admin)
-        return JSONResponse(
+        filters = BookingFilterDTO(status=booking_status, start_time=start, end_time=end)
+        user_bookings = await booking_interactor(tg_id=tg_id, admin=admin, is_admin=is_admin,
+                                                 limit=limit, cursor=cursor, filters=filters)
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
             content=user_bookings,
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail},
         )
     except AccessDeniedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
             content={"detail": exc.detail}
         )
@@ -128,7 +181,7 @@ async def list_user_bookings(
 
 @router.get(
     "/list/coworking",
-    response_model=List[BookingDTO],
+    response_model=BookingPageDTO,
     responses={
         status.HTTP_401_UNAUTHORIZED: {
             "description": "Not authenticate",
@@ -153,22 +206,29 @@ async def list_coworking_bookings(
         token: Annotated[str, Depends(oauth2_scheme)],
         oauth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
         booking_interactor: FromDishka[ListCoworkingBookingsInteractor],
-        coworking_id: CoworkingId = Query()
+        coworking_id: CoworkingId = Query(),
+        limit: PageLimit = Query(default=50),
+        cursor: Optional[PageCursor] = Query(default=None),
+        booking_status: Optional[BookingStatus] = Query(default=None, alias="status"),
+        start: Optional[BookingStartTime] = Query(default=None),
+        end: Optional[BookingEndTime] = Query(default=None),
 ) -> Response:
     try:
         tg_id, _ = await oauth_interactor(token)
-        user_bookings = await booking_interactor(coworking_id=coworking_id)
-        return JSONResponse(
+        filters = BookingFilterDTO(status=booking_status, start_time=start, end_time=end)
+        user_bookings = await booking_interactor(coworking_id=coworking_id, limit=limit, cursor=cursor,
+                                                 filters=filters)
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
             content=user_bookings,
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail},
         )
     except EntityNotFoundError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"detail": exc.detail},
         )
@@ -176,7 +236,7 @@ async def list_coworking_bookings(
 
 @router.get(
     "/list/all",
-    response_model=List[BookingDTO],
+    response_model=BookingPageDTO,
     responses={
         status.HTTP_401_UNAUTHORIZED: {
             "description": "Not authenticate",
@@ -201,24 +261,250 @@ async def get_all_bookings(
         token: Annotated[str, Depends(oauth2_scheme)],
         auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
         booking_interactor: FromDishka[ListAllBookingsInteractor],
+        limit: PageLimit = Query(default=50),
+        cursor: Optional[PageCursor] = Query(default=None),
+        booking_status: Optional[BookingStatus] = Query(default=None, alias="status"),
+        start: Optional[BookingStartTime] = Query(default=None),
+        end: Optional[BookingEndTime] = Query(default=None),
 ) -> Response:
     try:
         tg_id, is_admin = await auth_interactor(token)
-        all_bookings = await booking_interactor(is_admin=is_admin)
-        return JSONResponse(
+        filters = BookingFilterDTO(status=booking_status, start_time=start, end_time=end)
+        all_bookings = await booking_interactor(is_admin=is_admin, limit=limit, cursor=cursor, filters=filters)
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
             content=all_bookings,
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail},
         )
     except AccessDeniedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content={"detail": exc.detail}
+        )
+
+
+@router.get(
+    "/export",
+    responses={
+        status.HTTP_200_OK: {
+            "description": "Bookings export",
+            "content": {
+                "application/x-ndjson": {
+                    "example": '{"id": "f3047cd8-56e6-46e4-ac2d-757550c1f62a", "user_id": 1522105862, ...}'
+                },
+                "text/csv": {
+                    "example": "id,user_id,workplaces,start_time,end_time,status,total_price,created_at"
+                }
+            }
+        },
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Not authenticate",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Not authenticate"}
+                }
+            }
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "Access denied",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Access denied"}
+                }
+            }
+        },
+    },
+    status_code=status.HTTP_200_OK,
+)
+async def export_bookings(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        booking_interactor: FromDishka[ExportBookingsInteractor],
+        export_format: ExportFormat = Query(default=ExportFormat.NDJSON, alias="format"),
+) -> Response:
+    try:
+        tg_id, is_admin = await auth_interactor(token)
+        content = await booking_interactor(is_admin=is_admin, export_format=export_format)
+        media_type = "text/csv" if export_format == ExportFormat.CSV else "application/x-ndjson"
+        return StreamingResponse(
+            content=content,
+            status_code=status.HTTP_200_OK,
+            media_type=media_type,
+            headers={"Content-Disposition": f'attachment; filename="bookings.{export_format}"'},
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail},
+        )
+    except AccessDeniedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content={"detail": exc.detail}
+        )
+
+
+@router.get(
+    "/suggest",
+    response_model=BookingSuggestionsDTO,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Unauthorized"}
+                }
+            }
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Workplaces not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Workplaces not found"}
+                }
+            }
+        },
+    },
+    status_code=status.HTTP_200_OK,
+)
+async def suggest_booking_slots(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        booking_interactor: FromDishka[SuggestBookingSlotsInteractor],
+        workplaces: List[WorkplaceId] = Query(),
+        start: BookingStartTime = Query(),
+        end: BookingEndTime = Query(),
+        limit: SuggestionLimit = Query(default=5),
+) -> Response:
+    try:
+        tg_id, _ = await auth_interactor(token)
+        suggestions = await booking_interactor(workplaces=workplaces, start_time=start, end_time=end,
+                                               user_id=tg_id, limit=limit)
+        return FastJSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=suggestions,
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail}
+        )
+    except EntityNotFoundError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"detail": exc.detail}
+        )
+
+
+@router.post(
+    "/hold",
+    response_model=HoldDTO,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Unauthorized"}
+                }
+            }
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "Workplace is already booked or held",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Workplace is held by another user"}
+                }
+            }
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Workplace not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Workplace not found"}
+                }
+            }
+        },
+    },
+    status_code=status.HTTP_201_CREATED,
+)
+async def add_hold(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        hold_interactor: FromDishka[AddHoldInteractor],
+        data: BookingCreateDTO = Body(),
+) -> Response:
+    try:
+        tg_id, _ = await auth_interactor(token)
+        hold = await hold_interactor(data, tg_id)
+        return FastJSONResponse(
+            status_code=status.HTTP_201_CREATED,
+            content=hold,
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail}
+        )
+    except AccessDeniedError as exc:
+        return FastJSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
             content={"detail": exc.detail}
         )
+    except EntityNotFoundError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"detail": exc.detail}
+        )
+
+
+@router.delete(
+    "/hold",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Unauthorized"}
+                }
+            }
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Hold not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Hold not found"}
+                }
+            }
+        },
+    },
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def delete_hold(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        hold_interactor: FromDishka[DeleteHoldInteractor],
+        hold_id: HoldId = Query(),
+) -> Response:
+    try:
+        tg_id, _ = await auth_interactor(token)
+        await hold_interactor(hold_id, tg_id)
+        return Response(
+            status_code=status.HTTP_204_NO_CONTENT,
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail}
+        )
+    except EntityNotFoundError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"detail": exc.detail}
+        )
 
 
 @router.post(
@@ -248,7 +534,15 @@ async def get_all_bookings(
                     "example": {"detail": "Booking not found"}
                 }
             }
-        }
+        },
+        status.HTTP_409_CONFLICT: {
+            "description": "Idempotency-Key conflict",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Request with this Idempotency-Key is still in progress"}
+                }
+            }
+        },
     },
     status_code=status.HTTP_201_CREATED,
 )
@@ -256,27 +550,223 @@ async def add_bookings(
         token: Annotated[str, Depends(oauth2_scheme)],
         auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
         booking_interactor: FromDishka[AddBookingInteractor],
-        data: BookingCreateDTO = Body()
+        data: BookingCreateDTO = Body(),
+        idempotency_key: Optional[IdempotencyKey] = Header(default=None, alias="Idempotency-Key"),
 ) -> Response:
     try:
         tg_id, _ = await auth_interactor(token)
-        bookings = await booking_interactor(data, tg_id)
-        return JSONResponse(
+        bookings = await booking_interactor(data, tg_id, idempotency_key=idempotency_key)
+        return FastJSONResponse(
             status_code=status.HTTP_201_CREATED,
             content=bookings.dict(),
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail}
         )
     except AccessDeniedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
             content={"detail": exc.detail}
         )
     except EntityNotFoundError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"detail": exc.detail}
+        )
+    except ConflictError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={"detail": exc.detail}
+        )
+
+
+@router.post(
+    "/bulk",
+    response_model=BookingBulkResultDTO,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Unauthorized"}
+                }
+            }
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "Access denied",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Workplace is already booked"}
+                }
+            }
+        },
+    },
+    status_code=status.HTTP_200_OK,
+)
+async def add_bookings_bulk(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        booking_interactor: FromDishka[AddBookingsBulkInteractor],
+        data: BookingBulkCreateDTO = Body(),
+) -> Response:
+    try:
+        tg_id, _ = await auth_interactor(token)
+        result = await booking_interactor(data, tg_id)
+        return FastJSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=result,
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail}
+        )
+    except AccessDeniedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content={"detail": exc.detail}
+        )
+
+
+@router.post(
+    "/quote",
+    response_model=BookingQuoteResultDTO,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Unauthorized"}
+                }
+            }
+        },
+    },
+    status_code=status.HTTP_200_OK,
+)
+async def quote_bookings(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        booking_interactor: FromDishka[QuoteBookingsInteractor],
+        data: BookingQuoteCreateDTO = Body(),
+) -> Response:
+    try:
+        await auth_interactor(token)
+        result = await booking_interactor(data)
+        return FastJSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=result,
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail}
+        )
+
+
+@router.post(
+    "/series",
+    response_model=BookingSeriesDTO,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Unauthorized"}
+                }
+            }
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "Access denied",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Workplace is already booked on 2025-03-05"}
+                }
+            }
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Workplaces not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Workplaces not found"}
+                }
+            }
+        },
+    },
+    status_code=status.HTTP_201_CREATED,
+)
+async def add_booking_series(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        booking_interactor: FromDishka[AddBookingSeriesInteractor],
+        data: BookingSeriesCreateDTO = Body(),
+) -> Response:
+    try:
+        tg_id, _ = await auth_interactor(token)
+        series = await booking_interactor(data, tg_id)
+        return FastJSONResponse(
+            status_code=status.HTTP_201_CREATED,
+            content=series,
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail}
+        )
+    except AccessDeniedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content={"detail": exc.detail}
+        )
+    except EntityNotFoundError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"detail": exc.detail}
+        )
+
+
+@router.delete(
+    "/series",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Unauthorized"}
+                }
+            }
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Series not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Series not found"}
+                }
+            }
+        },
+    },
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def delete_booking_series(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        booking_interactor: FromDishka[DeleteBookingSeriesInteractor],
+        series_id: SeriesId = Query(),
+) -> Response:
+    try:
+        tg_id, _ = await auth_interactor(token)
+        await booking_interactor(series_id, tg_id)
+        return Response(
+            status_code=status.HTTP_204_NO_CONTENT,
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail}
+        )
+    except EntityNotFoundError as exc:
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"detail": exc.detail}
         )
@@ -323,22 +813,22 @@ async def update_bookings(
     try:
         tg_id, _ = await auth_interactor(token)
         bookings = await booking_interactor(data, booking_id, tg_id)
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
             content=bookings.dict(),
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail}
         )
     except AccessDeniedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
             content={"detail": exc.detail}
         )
     except EntityNotFoundError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"detail": exc.detail}
         )
@@ -378,7 +868,7 @@ async def delete_bookings(
         token: Annotated[str, Depends(oauth2_scheme)],
         auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
         booking_interactor: FromDishka[DeleteBookingInteractor],
-        booking_id: TgId = Query()
+        booking_id: BookingId = Query()
 ) -> Response:
     try:
         tg_id, _ = await auth_interactor(token)
@@ -387,22 +877,222 @@ async def delete_bookings(
             status_code=status.HTTP_204_NO_CONTENT,
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail}
         )
     except AccessDeniedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
             content={"detail": exc.detail}
         )
     except EntityNotFoundError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"detail": exc.detail}
         )
 
 
+@router.post(
+    "/waitlist",
+    response_model=WaitlistEntryDTO,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Unauthorized"}
+                }
+            }
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "Workplace is not booked",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Workplace is not booked"}
+                }
+            }
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Workplace not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Workplace not found"}
+                }
+            }
+        },
+    },
+    status_code=status.HTTP_201_CREATED,
+)
+async def add_waitlist_entry(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        waitlist_interactor: FromDishka[AddWaitlistEntryInteractor],
+        data: WaitlistEntryCreateDTO = Body(),
+) -> Response:
+    try:
+        tg_id, _ = await auth_interactor(token)
+        entry = await waitlist_interactor(data, tg_id)
+        return FastJSONResponse(
+            status_code=status.HTTP_201_CREATED,
+            content=entry,
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail}
+        )
+    except AccessDeniedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content={"detail": exc.detail}
+        )
+    except EntityNotFoundError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"detail": exc.detail}
+        )
+
+
+@router.delete(
+    "/waitlist",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Unauthorized"}
+                }
+            }
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Waitlist entry not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Waitlist entry not found"}
+                }
+            }
+        },
+    },
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def delete_waitlist_entry(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        waitlist_interactor: FromDishka[DeleteWaitlistEntryInteractor],
+        entry_id: WaitlistEntryId = Query(),
+) -> Response:
+    try:
+        tg_id, _ = await auth_interactor(token)
+        await waitlist_interactor(entry_id, tg_id)
+        return Response(
+            status_code=status.HTTP_204_NO_CONTENT,
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail}
+        )
+    except EntityNotFoundError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"detail": exc.detail}
+        )
+
+
+@router.get(
+    "/waitlist/promoted",
+    response_model=List[BookingDTO],
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Unauthorized"}
+                }
+            }
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "Access denied",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Access denied"}
+                }
+            }
+        },
+    },
+    status_code=status.HTTP_200_OK,
+)
+async def promoted_bookings(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        booking_interactor: FromDishka[PromotedBookingsInteractor],
+) -> Response:
+    try:
+        _, is_admin = await auth_interactor(token)
+        bookings = await booking_interactor(is_admin=is_admin)
+        return FastJSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=bookings
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail}
+        )
+    except AccessDeniedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content={"detail": exc.detail}
+        )
+
+
+@router.delete(
+    "/waitlist/promoted",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Unauthorized"}
+                }
+            }
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "Access denied",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Access denied"}
+                }
+            }
+        },
+    },
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def ack_promoted_bookings(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        booking_interactor: FromDishka[AckPromotedBookingsInteractor],
+        booking_id: List[BookingId] = Query(),
+) -> Response:
+    try:
+        _, is_admin = await auth_interactor(token)
+        await booking_interactor(booking_ids=booking_id, is_admin=is_admin)
+        return Response(
+            status_code=status.HTTP_204_NO_CONTENT,
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail}
+        )
+    except AccessDeniedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content={"detail": exc.detail}
+        )
+
+
 @router.post(
     "/activate",
     responses={
@@ -444,25 +1134,25 @@ async def activate_booking(
             status_code=status.HTTP_204_NO_CONTENT,
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail}
         )
     except AccessDeniedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
             content={"detail": exc.detail}
         )
     except EntityNotFoundError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"detail": exc.detail}
         )
 
 
-@router.get(
+@router.post(
     "/pending",
-    response_model=List[BookingDTO],
+    response_model=PendingBookingsDTO,
     responses={
         status.HTTP_401_UNAUTHORIZED: {
             "description": "Unauthorized",
@@ -484,10 +1174,26 @@ async def activate_booking(
     status_code=status.HTTP_200_OK,
 )
 async def pending_bookings(
-        booking_interactor: FromDishka[PendingBookingsInteractor]
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        booking_interactor: FromDishka[PendingBookingsInteractor],
+        minutes: ReminderWindowMinutes = Query(default=60),
+        since: Optional[NotifiedAt] = Query(default=None),
 ) -> Response:
-    bookings = await booking_interactor()
-    return JSONResponse(
-        status_code=status.HTTP_200_OK,
-        content=bookings
-    )
+    try:
+        _, is_admin = await auth_interactor(token)
+        bookings = await booking_interactor(minutes=minutes, since=since, is_admin=is_admin)
+        return FastJSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=bookings
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail}
+        )
+    except AccessDeniedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content={"detail": exc.detail}
+        )
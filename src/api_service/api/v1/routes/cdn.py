@@ -3,9 +3,10 @@ import os
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter, Response, UploadFile, File, Path, status
-from fastapi.responses import JSONResponse, FileResponse
+from fastapi.responses import FileResponse
 
 from core.exceptions import EntityNotFoundError
+from core.responses import FastJSONResponse
 from domain.dto.cdn import ImageLinkDTO
 from domain.interactors.cdn import (
     SaveImageInteractor,
@@ -45,7 +46,7 @@ async def upload_image(
 ) -> Response:
     os.makedirs('cdn/storage', exist_ok=True)
     image_link = await cdn_interactor(file)
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status.HTTP_201_CREATED,
         content=image_link,
     )
@@ -81,7 +82,7 @@ async def get_image(
         file_path = await cdn_interactor(filename)
         return FileResponse(file_path)
     except EntityNotFoundError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"detail": exc.detail},
         )
@@ -3,22 +3,24 @@ from typing import Annotated, List
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter, Response, Depends, Path, Query, Body, status
-from fastapi.responses import JSONResponse
 
 from api.v1.filters.auth import oauth2_scheme
 from core.exceptions import (
     UserUnauthorizedError,
     AccessDeniedError,
     EntityNotFoundError,
+    ConflictError,
 )
+from core.responses import FastJSONResponse
 from domain.dto.coworking import (
     CoworkingDTO,
     CoworkingCreateDTO,
     CoworkingUpdateDTO,
     CoworkingTariffDTO,
     CoworkingTariffCreateDTO,
+    CoworkingTimelineDTO,
 )
-from domain.dto.misc import CoworkingId
+from domain.dto.misc import CoworkingId, TimelineDate, TimelineSlotMinutes
 from domain.interactors.auth import OAuth2PasswordBearerInteractor
 from domain.interactors.coworking import (
     GetCoworkingInteractor,
@@ -28,6 +30,7 @@ from domain.interactors.coworking import (
     DeleteCoworkingInteractor,
     AddCoworkingTariffsInteractor,
     ListCoworkingTariffsInteractor,
+    GetCoworkingTimelineInteractor,
 )
 
 router = APIRouter(route_class=DishkaRoute, prefix="/coworking", tags=["Coworking"])
@@ -65,17 +68,17 @@ async def get_coworking(
     try:
         tg_id, _ = await auth_interactor(token)
         coworking = await coworking_interactor(coworking_id=coworking_id)
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
             content=coworking,
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail},
         )
     except EntityNotFoundError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"detail": exc.detail},
         )
@@ -106,12 +109,12 @@ async def list_coworkings(
     try:
         await auth_interactor(token)
         coworkings = await coworking_interactor(offset=offset, limit=limit)
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
             content=coworkings
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail},
         )
@@ -149,17 +152,17 @@ async def add_coworking(
     try:
         _, is_admin = await auth_interactor(token)
         coworking = await coworking_interactor(coworking=coworking, is_admin=is_admin)
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_201_CREATED,
             content=coworking,
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail},
         )
     except AccessDeniedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
             content={"detail": exc.detail},
         )
@@ -206,22 +209,22 @@ async def update_coworking(
     try:
         _, is_admin = await auth_interactor(token)
         coworking = await coworking_interactor(coworking=coworking, coworking_id=coworking_id, is_admin=is_admin)
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
             content=coworking,
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail},
         )
     except AccessDeniedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
             content={"detail": exc.detail},
         )
     except EntityNotFoundError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"detail": exc.detail},
         )
@@ -253,7 +256,15 @@ async def update_coworking(
                     "example": {"detail": "Entity not found"}
                 }
             }
-        }
+        },
+        status.HTTP_409_CONFLICT: {
+            "description": "Coworking has bookings",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Coworking has bookings"}
+                }
+            }
+        },
     },
     status_code=status.HTTP_204_NO_CONTENT,
 )
@@ -270,20 +281,25 @@ async def delete_coworking(
             status_code=status.HTTP_204_NO_CONTENT,
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail},
         )
     except AccessDeniedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
             content={"detail": exc.detail},
         )
     except EntityNotFoundError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"detail": exc.detail},
         )
+    except ConflictError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_409_CONFLICT,
+            content={"detail": exc.detail},
+        )
 
 
 @router.post(
@@ -326,22 +342,22 @@ async def add_tariffs(
     try:
         _, is_admin = await auth_interactor(token)
         coworking_tariffs = await coworking_interactor(tariffs=tariffs, is_admin=is_admin)
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_201_CREATED,
             content=coworking_tariffs,
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail},
         )
     except AccessDeniedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
             content={"detail": exc.detail},
         )
     except EntityNotFoundError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"detail": exc.detail},
         )
@@ -371,12 +387,62 @@ async def list_tariffs(
     try:
         await auth_interactor(token)
         coworking_tariffs = await coworking_interactor(coworking_id=coworking_id)
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
             content=coworking_tariffs,
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail},
+        )
+
+
+@router.get(
+    "/{coworking_id}/timeline",
+    response_model=CoworkingTimelineDTO,
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Not authenticate",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Not authenticate"}
+                }
+            }
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Entity not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Entity not found"}
+                }
+            }
+        }
+    },
+    status_code=status.HTTP_200_OK,
+)
+async def get_coworking_timeline(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        coworking_interactor: FromDishka[GetCoworkingTimelineInteractor],
+        coworking_id: CoworkingId = Path(),
+        date: TimelineDate = Query(),
+        slot_minutes: TimelineSlotMinutes = Query(default=30),
+) -> Response:
+    try:
+        await auth_interactor(token)
+        timeline = await coworking_interactor(coworking_id=coworking_id, date=date, slot_minutes=slot_minutes)
+        return FastJSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=timeline,
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail},
         )
+    except EntityNotFoundError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"detail": exc.detail},
+        )
@@ -1,9 +1,14 @@
+from typing import Annotated
+
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
-from fastapi import APIRouter, Response, Query, status
-from fastapi.responses import JSONResponse
+from fastapi import APIRouter, Response, Query, status, Depends
 
+from api.v1.filters.auth import oauth2_scheme
+from core.exceptions import UserUnauthorizedError, AccessDeniedError
+from core.responses import FastJSONResponse
 from domain.dto.misc import TgId
+from domain.interactors.auth import OAuth2PasswordBearerInteractor
 from domain.interactors.external import (
     AddTgAdminInteractor,
     RemoveTgAdminInteractor,
@@ -22,18 +27,48 @@ router = APIRouter(route_class=DishkaRoute, prefix="/external", tags=["External"
                     "example": [1282629807, 1522105862, 5367427116, 946082604, 256086824]
                 }
             }
-        }
+        },
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Unauthorized"}
+                }
+            }
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "Access denied",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Access denied"}
+                }
+            }
+        },
     }
 )
 async def add_tg_admin(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
         external_interactor: FromDishka[AddTgAdminInteractor],
         tg_id: TgId = Query()
 ) -> Response:
-    tg_admins = await external_interactor(tg_id=tg_id)
-    return JSONResponse(
-        status_code=status.HTTP_200_OK,
-        content=tg_admins
-    )
+    try:
+        _, is_admin = await auth_interactor(token)
+        tg_admins = await external_interactor(tg_id=tg_id, is_admin=is_admin)
+        return FastJSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=tg_admins
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail}
+        )
+    except AccessDeniedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content={"detail": exc.detail}
+        )
 
 
 @router.delete(
@@ -46,15 +81,45 @@ async def add_tg_admin(
                     "example": [1282629807, 1522105862, 5367427116, 946082604]
                 }
             }
-        }
+        },
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Unauthorized",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Unauthorized"}
+                }
+            }
+        },
+        status.HTTP_403_FORBIDDEN: {
+            "description": "Access denied",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Access denied"}
+                }
+            }
+        },
     }
 )
 async def remove_tg_admin(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
         external_interactor: FromDishka[RemoveTgAdminInteractor],
         tg_id: TgId = Query()
 ) -> Response:
-    tg_admins = await external_interactor(tg_id=tg_id)
-    return JSONResponse(
-        status_code=status.HTTP_200_OK,
-        content=tg_admins
-    )
+    try:
+        _, is_admin = await auth_interactor(token)
+        tg_admins = await external_interactor(tg_id=tg_id, is_admin=is_admin)
+        return FastJSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=tg_admins
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail}
+        )
+    except AccessDeniedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_403_FORBIDDEN,
+            content={"detail": exc.detail}
+        )
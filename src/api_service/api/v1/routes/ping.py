@@ -1,5 +1,6 @@
 from fastapi import APIRouter, Response, status
-from fastapi.responses import JSONResponse
+
+from core.responses import FastJSONResponse
 
 router = APIRouter(tags=["Ping"])
 
@@ -18,7 +19,7 @@ router = APIRouter(tags=["Ping"])
     }
 )
 async def ping() -> Response:
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status.HTTP_200_OK,
         content={"ping": "pong-pong-pong"}
     )
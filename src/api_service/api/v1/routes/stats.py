@@ -1,8 +1,8 @@
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter, Response, status
-from fastapi.responses import JSONResponse
 
+from core.responses import FastJSONResponse
 from domain.interactors.stats import (
     StatsCoworkingCountInteractor,
     StatsWorkplacesCountInteractor,
@@ -28,7 +28,7 @@ async def get_coworking_count(
         stats_interactor: FromDishka[StatsCoworkingCountInteractor]
 ) -> Response:
     coworking_count = await stats_interactor()
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status.HTTP_200_OK,
         content=coworking_count
     )
@@ -49,7 +49,7 @@ async def get_workplaces_count(
         stats_interactor: FromDishka[StatsWorkplacesCountInteractor]
 ) -> Response:
     workplaces_count = await stats_interactor()
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status.HTTP_200_OK,
         content=workplaces_count
     )
@@ -70,7 +70,7 @@ async def get_medium_price_per_hour(
         stats_interactor: FromDishka[StatsMediumPricePerHourInteractor]
 ) -> Response:
     medium_price_per_hour = await stats_interactor()
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status.HTTP_200_OK,
         content=medium_price_per_hour
     )
@@ -91,7 +91,7 @@ async def get_occupancy_rate(
         stats_interactor: FromDishka[StatsOccupancyRateInteractor]
 ) -> Response:
     occupancy_rate = await stats_interactor()
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status.HTTP_200_OK,
         content=occupancy_rate
     )
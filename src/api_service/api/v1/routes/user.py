@@ -3,17 +3,18 @@ from typing import Annotated, List
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter, Response, Depends, Query, Body, status
-from fastapi.responses import JSONResponse
 
 from api.v1.filters.auth import oauth2_scheme
 from core.exceptions import (
     EntityNotFoundError,
     UserUnauthorizedError,
 )
+from core.responses import FastJSONResponse
 from domain.dto.user import UserDTO, TelegramAuthDTO
 from domain.interactors.auth import (
     GenerateAccessTokenInteractor,
     OAuth2PasswordBearerInteractor,
+    RevokeAccessTokenInteractor,
 )
 from domain.interactors.user import (
     GetUserInteractor,
@@ -55,17 +56,17 @@ async def get_profile(
     try:
         tg_id, _ = await auth_interactor(token)
         user = await user_interactor(tg_id=tg_id)
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
             content=user,
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail},
         )
     except EntityNotFoundError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_404_NOT_FOUND,
             content={"detail": exc.detail},
         )
@@ -96,12 +97,12 @@ async def list_users(
     try:
         await auth_interactor(token)
         users = await user_interactor(offset=offset, limit=limit)
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
             content=users,
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail},
         )
@@ -126,9 +127,42 @@ async def auth_user(
         user_interactor: FromDishka[AddUserInteractor],
         user: TelegramAuthDTO = Body()
 ) -> Response:
+    # токен выдаётся только после записи профиля, чтобы при ошибке upsert не оставалось токена без пользователя
     await user_interactor(user=user)
     token = await auth_interactor(tg_id=user.id)
-    return JSONResponse(
+    return FastJSONResponse(
         status_code=status.HTTP_201_CREATED,
         content={"token": token},
     )
+
+
+@router.post(
+    "/logout",
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Not authenticate",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Not authenticate"}
+                }
+            }
+        },
+    },
+    status_code=status.HTTP_204_NO_CONTENT,
+)
+async def logout_user(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        revoke_interactor: FromDishka[RevokeAccessTokenInteractor],
+) -> Response:
+    try:
+        tg_id, _ = await auth_interactor(token)
+        await revoke_interactor(tg_id=tg_id)
+        return Response(
+            status_code=status.HTTP_204_NO_CONTENT,
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail},
+        )
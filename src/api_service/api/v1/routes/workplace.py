@@ -1,17 +1,19 @@
-from typing import Annotated, List
+from typing import Annotated, List, Optional
 
 from dishka import FromDishka
 from dishka.integrations.fastapi import DishkaRoute
 from fastapi import APIRouter, Response, Depends, Query, Body, status
-from fastapi.responses import JSONResponse
 
 from api.v1.filters.auth import oauth2_scheme
-from core.exceptions import UserUnauthorizedError, AccessDeniedError
-from domain.dto.misc import CoworkingId
+from core.exceptions import UserUnauthorizedError, AccessDeniedError, EntityNotFoundError
+from core.responses import FastJSONResponse
+from domain.dto.misc import CoworkingId, BookingStartTime, BookingEndTime, ClusterSize
 from domain.interactors.auth import OAuth2PasswordBearerInteractor
 from domain.interactors.workplace import (
     UpsertWorkplacesInteractor,
     ListWorkplacesInteractor,
+    ListAvailableWorkplacesInteractor,
+    FindWorkplaceClusterInteractor,
 )
 from domain.dto.workplace import (
     WorkplaceDTO,
@@ -53,17 +55,17 @@ async def upsert_workplaces(
     try:
         _, is_admin = await auth_interactor(token)
         workplaces = await workplace_interactor(workplaces=workplaces, is_admin=is_admin)
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_201_CREATED,
             content=workplaces,
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail},
         )
     except AccessDeniedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_403_FORBIDDEN,
             content={"detail": exc.detail},
         )
@@ -93,12 +95,104 @@ async def list_workplaces(
     try:
         await auth_interactor(token)
         workplaces = await workplace_interactor(coworking_id=coworking_id)
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_200_OK,
             content=workplaces,
         )
     except UserUnauthorizedError as exc:
-        return JSONResponse(
+        return FastJSONResponse(
             status_code=status.HTTP_401_UNAUTHORIZED,
             content={"detail": exc.detail},
         )
+
+
+@router.get(
+    "/available",
+    response_model=List[WorkplaceDTO],
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Not authenticate",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Not authenticate"}
+                }
+            }
+        },
+    },
+    status_code=status.HTTP_200_OK,
+)
+async def list_available_workplaces(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        workplace_interactor: FromDishka[ListAvailableWorkplacesInteractor],
+        coworking_id: CoworkingId = Query(),
+        start: BookingStartTime = Query(),
+        end: BookingEndTime = Query(),
+        tags: Optional[List[str]] = Query(default=None),
+) -> Response:
+    try:
+        tg_id, _ = await auth_interactor(token)
+        workplaces = await workplace_interactor(coworking_id=coworking_id, start_time=start, end_time=end,
+                                                user_id=tg_id, tags=tags)
+        return FastJSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=workplaces,
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail},
+        )
+
+
+@router.get(
+    "/cluster",
+    response_model=List[WorkplaceDTO],
+    responses={
+        status.HTTP_401_UNAUTHORIZED: {
+            "description": "Not authenticate",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Not authenticate"}
+                }
+            }
+        },
+        status.HTTP_404_NOT_FOUND: {
+            "description": "Coworking not found",
+            "content": {
+                "application/json": {
+                    "example": {"detail": "Coworking not found"}
+                }
+            }
+        },
+    },
+    status_code=status.HTTP_200_OK,
+)
+async def find_workplace_cluster(
+        token: Annotated[str, Depends(oauth2_scheme)],
+        auth_interactor: FromDishka[OAuth2PasswordBearerInteractor],
+        workplace_interactor: FromDishka[FindWorkplaceClusterInteractor],
+        coworking_id: CoworkingId = Query(),
+        size: ClusterSize = Query(),
+        start: BookingStartTime = Query(),
+        end: BookingEndTime = Query(),
+        tags: Optional[List[str]] = Query(default=None),
+) -> Response:
+    try:
+        tg_id, _ = await auth_interactor(token)
+        workplaces = await workplace_interactor(coworking_id=coworking_id, size=size, start_time=start, end_time=end,
+                                                user_id=tg_id, tags=tags)
+        return FastJSONResponse(
+            status_code=status.HTTP_200_OK,
+            content=workplaces,
+        )
+    except UserUnauthorizedError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            content={"detail": exc.detail},
+        )
+    except EntityNotFoundError as exc:
+        return FastJSONResponse(
+            status_code=status.HTTP_404_NOT_FOUND,
+            content={"detail": exc.detail},
+        )
@@ -0,0 +1,50 @@
+import json
+import timeit
+import uuid
+from datetime import datetime, timedelta
+
+from fastapi.responses import JSONResponse
+
+from core.responses import FastJSONResponse
+from domain.dto.booking import BookingDTO
+from domain.dto.coworking import CoworkingTariffDTO
+from domain.dto.workplace import WorkplaceDTO
+
+# python -m benchmarks.serialization из src/api_service
+
+
+def make_bookings(count: int):
+    now = datetime(2025, 3, 4, 9, 0)
+    tariff = CoworkingTariffDTO(id=uuid.uuid4(), name="VIP", color="#4CA50F", price_per_hour=750, created_at=now)
+    workplaces = [
+        WorkplaceDTO(id=uuid.uuid4(), number=number, name=f"Стол {number}", status="FREE", x_cor=10.0 * number,
+                     y_cor=20.0, tariff=tariff, created_at=now)
+        for number in range(1, 3)
+    ]
+    return [
+        BookingDTO(id=uuid.uuid4(), user_id=1522105862, workplaces=workplaces,
+                   start_time=now + timedelta(hours=idx), end_time=now + timedelta(hours=idx + 1),
+                   status="WAITING", total_price=1500, created_at=now)
+        for idx in range(count)
+    ]
+
+
+def round_trip(bookings) -> bytes:
+    return JSONResponse([json.loads(booking.json(exclude_none=True)) for booking in bookings]).body
+
+
+def single_pass(bookings) -> bytes:
+    return FastJSONResponse([booking.dict() for booking in bookings]).body
+
+
+def main(count: int = 1000, repeat: int = 20) -> None:
+    bookings = make_bookings(count)
+    assert json.loads(round_trip(bookings)) == json.loads(single_pass(bookings))
+
+    for name, serialize in (("json round trip", round_trip), ("single pass", single_pass)):
+        seconds = min(timeit.repeat(lambda: serialize(bookings), number=1, repeat=repeat))
+        print(f"{name:>16}: {seconds * 1000:7.2f} ms per {count} bookings, {count / seconds:10.0f} rows/s")
+
+
+if __name__ == "__main__":
+    main()
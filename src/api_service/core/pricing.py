@@ -0,0 +1,80 @@
+import json
+from collections import Counter
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Optional, Sequence, Tuple
+
+# понедельник, от него отсчитываются недели
+EPOCH = datetime(2024, 1, 1)
+HOURS_PER_WEEK = 7 * 24
+SECONDS_PER_HOUR = 60 * 60
+SECONDS_PER_WEEK = HOURS_PER_WEEK * SECONDS_PER_HOUR
+PERCENT = 100
+
+
+class CompiledTariff:
+    def __init__(self, price_per_hour: int, rules: dict):
+        peak_start, peak_end = rules.get("peak_start"), rules.get("peak_end")
+        peak_percent = rules.get("peak_percent", PERCENT)
+        off_peak_percent = rules.get("off_peak_percent", PERCENT)
+        weekend_percent = rules.get("weekend_percent", PERCENT)
+
+        # ставка на каждый час недели в единицах price_per_hour * процент
+        self.hourly = []
+        for hour in range(HOURS_PER_WEEK):
+            weekday, hour_of_day = divmod(hour, 24)
+            if weekday >= 5:
+                percent = weekend_percent
+            elif peak_start is not None and peak_end is not None and peak_start <= hour_of_day < peak_end:
+                percent = peak_percent
+            else:
+                percent = off_peak_percent
+            self.hourly.append(price_per_hour * percent)
+
+        self.prefix = [0]
+        for rate in self.hourly:
+            self.prefix.append(self.prefix[-1] + rate * SECONDS_PER_HOUR)
+
+        self.min_seconds = rules.get("min_minutes", 0) * 60
+        self.seat_discounts = sorted(
+            ((discount["min_seats"], discount["percent"]) for discount in rules.get("seat_discounts", [])),
+            reverse=True,
+        )
+
+    def _cumulative(self, seconds: int) -> int:
+        weeks, offset = divmod(seconds, SECONDS_PER_WEEK)
+        hour, within = divmod(offset, SECONDS_PER_HOUR)
+        return weeks * self.prefix[-1] + self.prefix[hour] + self.hourly[hour] * within
+
+    def cost(self, start_time: datetime, end_time: datetime) -> int:
+        # стоимость в единицах price_per_hour * процент * секунда, без округлений
+        start = (start_time - EPOCH) // timedelta(seconds=1)
+        end = max((end_time - EPOCH) // timedelta(seconds=1), start + self.min_seconds)
+        return self._cumulative(end) - self._cumulative(start)
+
+    def discount(self, seats: int) -> int:
+        for min_seats, percent in self.seat_discounts:
+            if seats >= min_seats:
+                return percent
+        return 0
+
+
+@lru_cache(maxsize=1024)
+def _compile(price_per_hour: int, rules: str) -> CompiledTariff:
+    return CompiledTariff(price_per_hour, json.loads(rules))
+
+
+def compile_tariff(price_per_hour: int, rules: Optional[dict]) -> CompiledTariff:
+    return _compile(price_per_hour, json.dumps(rules or {}, sort_keys=True))
+
+
+def quote_price(tariffs: Sequence[Tuple[int, Optional[dict]]], start_time: datetime, end_time: datetime) -> int:
+    seats = len(tariffs)
+    # места с одинаковым тарифом считаются один раз
+    groups = Counter(compile_tariff(price_per_hour, rules) for price_per_hour, rules in tariffs)
+
+    total = sum(
+        count * tariff.cost(start_time, end_time) * (PERCENT - tariff.discount(seats))
+        for tariff, count in groups.items()
+    )
+    return total // (SECONDS_PER_HOUR * PERCENT * PERCENT)
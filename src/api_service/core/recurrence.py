@@ -0,0 +1,32 @@
+from datetime import datetime, timedelta
+from typing import List, Optional, Sequence, Tuple
+
+
+def expand_weekly(start_time: datetime, end_time: datetime, weekdays: Sequence[int], interval: int,
+                  until: Optional[datetime] = None, count: Optional[int] = None,
+                  max_occurrences: int = 366) -> List[Tuple[datetime, datetime]]:
+    if until is None and count is None:
+        raise ValueError("until or count is required")
+    if not weekdays:
+        raise ValueError("weekdays must not be empty")
+
+    duration = end_time - start_time
+    week_start = start_time - timedelta(days=start_time.weekday())
+    days = sorted(set(weekdays))
+
+    occurrences = []
+    while True:
+        for weekday in days:
+            occurrence = week_start + timedelta(days=weekday)
+            if occurrence < start_time:
+                continue
+            if until is not None and occurrence > until:
+                return occurrences
+            if count is not None and len(occurrences) == count:
+                return occurrences
+            if len(occurrences) == max_occurrences:
+                raise ValueError(f"Series must not exceed {max_occurrences} occurrences")
+
+            occurrences.append((occurrence, occurrence + duration))
+
+        week_start += timedelta(weeks=interval)
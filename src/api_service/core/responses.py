@@ -0,0 +1,10 @@
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class FastJSONResponse(JSONResponse):
+    def render(self, content: Any) -> bytes:
+        # сериализация в байты за один проход в pydantic-core, без json.dumps
+        return to_json(content)
@@ -1,4 +1,6 @@
-from typing import Optional, Dict, Any
+import time
+from collections import OrderedDict
+from typing import Optional, Dict, Any, Set, Tuple
 from datetime import datetime, timedelta
 
 from passlib.context import CryptContext
@@ -33,3 +35,51 @@ class AuthManager:
             return payload
         except (JWTError, ExpiredSignatureError):
             return None
+
+
+class VerifiedTokenCache:
+    def __init__(self, max_size: int = 10000, ttl: float = 300.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: "OrderedDict[str, Tuple[float, int]]" = OrderedDict()
+        self.tokens_by_user: Dict[int, Set[str]] = {}
+        self.generation = 0
+
+    def get(self, token: str) -> Optional[int]:
+        cached = self.entries.get(token)
+        if cached is None:
+            return None
+
+        expires_at, tg_id = cached
+        if expires_at <= time.time():
+            self._remove(token)
+            return None
+
+        self.entries.move_to_end(token)
+        return tg_id
+
+    def put(self, token: str, tg_id: int, exp: float) -> None:
+        # запись живёт не дольше самого токена
+        self.entries[token] = (min(exp, time.time() + self.ttl), tg_id)
+        self.entries.move_to_end(token)
+        self.tokens_by_user.setdefault(tg_id, set()).add(token)
+        while len(self.entries) > self.max_size:
+            self._remove(next(iter(self.entries)))
+
+    def revoke(self, tg_id: int) -> None:
+        self.generation += 1
+        for token in self.tokens_by_user.pop(tg_id, set()):
+            self.entries.pop(token, None)
+
+    def clear(self) -> None:
+        self.generation += 1
+        self.entries.clear()
+        self.tokens_by_user.clear()
+
+    def _remove(self, token: str) -> None:
+        _, tg_id = self.entries.pop(token)
+        tokens = self.tokens_by_user.get(tg_id)
+        if tokens is not None:
+            tokens.discard(token)
+            if not tokens:
+                del self.tokens_by_user[tg_id]
@@ -0,0 +1,98 @@
+import heapq
+import math
+from collections import OrderedDict
+from typing import Dict, Hashable, Iterable, List, Optional, Set, Tuple
+
+
+class SpatialGrid:
+    def __init__(self, points: Iterable[Tuple[Hashable, float, float]]):
+        self.points: Dict[Hashable, Tuple[float, float]] = {point_id: (x, y) for point_id, x, y in points}
+        self.cells: Dict[Tuple[int, int], List[Hashable]] = {}
+        if not self.points:
+            self.min_x = self.min_y = 0.0
+            self.cell_size = 1.0
+            self.max_ring = 0
+            return
+
+        xs = [x for x, _ in self.points.values()]
+        ys = [y for _, y in self.points.values()]
+        self.min_x, self.min_y = min(xs), min(ys)
+        width, height = max(xs) - self.min_x, max(ys) - self.min_y
+
+        # в среднем одно место на ячейку
+        area = width * height
+        self.cell_size = math.sqrt(area / len(self.points)) if area > 0 else max(width, height, 1.0)
+        for point_id, (x, y) in self.points.items():
+            self.cells.setdefault(self._cell(x, y), []).append(point_id)
+        self.max_ring = max(max(i for i, _ in self.cells), max(j for _, j in self.cells)) + 1
+
+    def _cell(self, x: float, y: float) -> Tuple[int, int]:
+        return math.floor((x - self.min_x) / self.cell_size), math.floor((y - self.min_y) / self.cell_size)
+
+    def _ring(self, ci: int, cj: int, ring: int) -> Iterable[Tuple[int, int]]:
+        if ring == 0:
+            yield ci, cj
+            return
+
+        for i in range(ci - ring, ci + ring + 1):
+            yield i, cj - ring
+            yield i, cj + ring
+        for j in range(cj - ring + 1, cj + ring):
+            yield ci - ring, j
+            yield ci + ring, j
+
+    def nearest(self, x: float, y: float, k: int, allowed: Set[Hashable]) -> List[Tuple[float, Hashable]]:
+        ci, cj = self._cell(x, y)
+        best: List[Tuple[float, Hashable]] = []
+        for ring in range(self.max_ring + 1):
+            for cell in self._ring(ci, cj, ring):
+                for point_id in self.cells.get(cell, ()):
+                    if point_id not in allowed:
+                        continue
+                    px, py = self.points[point_id]
+                    item = (-math.hypot(px - x, py - y), point_id)
+                    if len(best) < k:
+                        heapq.heappush(best, item)
+                    elif item > best[0]:
+                        heapq.heapreplace(best, item)
+
+            # всё, что лежит за текущим кольцом, не ближе ring * cell_size
+            if len(best) == k and -best[0][0] <= ring * self.cell_size:
+                break
+
+        return sorted((-distance, point_id) for distance, point_id in best)
+
+    def find_cluster(self, allowed: Set[Hashable], size: int) -> List[Hashable]:
+        allowed = {point_id for point_id in allowed if point_id in self.points}
+        if len(allowed) < size:
+            return []
+
+        best_spread, best_cluster = math.inf, []
+        for seed in sorted(allowed):
+            x, y = self.points[seed]
+            neighbours = self.nearest(x, y, size, allowed)
+            spread = neighbours[-1][0]
+            if spread < best_spread:
+                best_spread, best_cluster = spread, [point_id for _, point_id in neighbours]
+
+        return best_cluster
+
+
+class FloorPlanCache:
+    def __init__(self, max_size: int = 128):
+        self.max_size = max_size
+        self.grids: "OrderedDict[Hashable, Tuple[int, SpatialGrid]]" = OrderedDict()
+
+    def get(self, coworking_id: Hashable, version: int) -> Optional[SpatialGrid]:
+        cached = self.grids.get(coworking_id)
+        if cached is None or cached[0] != version:
+            return None
+
+        self.grids.move_to_end(coworking_id)
+        return cached[1]
+
+    def put(self, coworking_id: Hashable, version: int, grid: SpatialGrid) -> None:
+        self.grids[coworking_id] = (version, grid)
+        self.grids.move_to_end(coworking_id)
+        while len(self.grids) > self.max_size:
+            self.grids.popitem(last=False)
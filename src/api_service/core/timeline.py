@@ -0,0 +1,64 @@
+import base64
+import math
+from datetime import datetime, timedelta
+from typing import Iterable, List, Tuple
+
+
+def slots_per_day(slot_minutes: int) -> int:
+    return math.ceil(24 * 60 / slot_minutes)
+
+
+def occupancy_bitmap(intervals: Iterable[Tuple[datetime, datetime]], day_start: datetime,
+                     slot_minutes: int, slots: int) -> int:
+    slot_seconds = slot_minutes * 60
+    mask = 0
+    for start, end in intervals:
+        first = max(0, math.floor((start - day_start).total_seconds() / slot_seconds))
+        last = min(slots, math.ceil((end - day_start).total_seconds() / slot_seconds))
+        if first < last:
+            # весь диапазон слотов интервала заполняется одной битовой операцией
+            mask |= ((1 << (last - first)) - 1) << first
+
+    return mask
+
+
+def encode_bitmap(mask: int, slots: int) -> str:
+    return base64.b64encode(mask.to_bytes((slots + 7) // 8, "little")).decode()
+
+
+def free_intervals(busy: Iterable[Tuple[datetime, datetime]], window_start: datetime,
+                   window_end: datetime) -> List[Tuple[datetime, datetime]]:
+    # sweep-line: концы интервалов идут раньше начал, поэтому стыкующиеся брони не дают пустого окна
+    events = sorted(
+        [(start, 1) for start, _ in busy] + [(end, -1) for _, end in busy],
+        key=lambda event: (event[0], event[1]),
+    )
+
+    gaps = []
+    depth = 0
+    free_from = window_start
+    for moment, delta in events:
+        if delta == 1 and depth == 0 and moment > free_from:
+            gaps.append((free_from, min(moment, window_end)))
+        depth += delta
+        if depth == 0:
+            free_from = max(free_from, moment)
+
+    if free_from < window_end:
+        gaps.append((free_from, window_end))
+
+    return [(start, end) for start, end in gaps if start < end and start < window_end]
+
+
+def nearest_free_slots(busy: Iterable[Tuple[datetime, datetime]], window_start: datetime, window_end: datetime,
+                       duration: timedelta, anchor: datetime, limit: int) -> List[Tuple[datetime, datetime]]:
+    slots = []
+    for gap_start, gap_end in free_intervals(busy, window_start, window_end):
+        if gap_end - gap_start < duration:
+            continue
+        # из каждого свободного окна берём слот, ближайший к желаемому началу
+        start = min(max(anchor, gap_start), gap_end - duration)
+        slots.append((start, start + duration))
+
+    slots.sort(key=lambda slot: (abs(slot[0] - anchor), slot[0]))
+    return slots[:limit]
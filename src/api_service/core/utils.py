@@ -1,3 +1,7 @@
+import base64
+import uuid
+from datetime import datetime
+from typing import Tuple
 from urllib.parse import urlparse
 
 
@@ -7,3 +11,17 @@ def is_valid_postgres_uri(uri: str) -> bool:
         return parsed_uri.scheme.startswith("postgresql")
     except:  # noqa
         return False
+
+
+def encode_cursor(start_time: datetime, entity_id: uuid.UUID) -> str:
+    raw = f"{start_time.isoformat()}|{entity_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, uuid.UUID]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+        start_time, entity_id = raw.split("|")
+        return datetime.fromisoformat(start_time), uuid.UUID(entity_id)
+    except (ValueError, UnicodeDecodeError):
+        raise ValueError("Invalid cursor")
@@ -1,4 +1,3 @@
-import json
 from typing import Dict, Any
 
 from pydantic import BaseModel, ConfigDict, model_validator
@@ -8,7 +7,7 @@ class BaseDTO(BaseModel):
     model_config = ConfigDict(from_attributes=True)
 
     def dict(self, *args, **kwargs) -> Dict[str, Any]:
-        return json.loads(self.json(exclude_none=True))
+        return self.model_dump(mode="json", exclude_none=True)
 
     def dto_to_orm(self, *args, **kwargs) -> Any:
         return None
@@ -1,4 +1,7 @@
-from typing import List, Optional
+from typing import List, Optional, Annotated
+
+from pydantic import Field, model_validator
+
 from .base import BaseDTO
 from .misc import (
     TgId,
@@ -7,11 +10,22 @@ from .misc import (
     BookingStartTime,
     BookingEndTime,
     BookingStatus,
+    BulkBookingStatus,
     BookingTotalPrice,
+    PageCursor,
+    NotifiedAt,
+    HoldId,
+    HoldExpiresAt,
+    WaitlistEntryId,
+    SeriesId,
+    SeriesWeekday,
+    SeriesInterval,
+    SeriesUntil,
+    SeriesCount,
     CreatedAt,
 )
 from .workplace import WorkplaceDTO
-from infrastructure.database.postgres.models import BookingORM
+from infrastructure.database.postgres.models import BookingORM, BookingSeriesORM, WaitlistEntryORM
 
 
 class BookingDTO(BaseDTO):
@@ -38,12 +52,151 @@ class BookingDTO(BaseDTO):
         )
 
 
+class BookingPageDTO(BaseDTO):
+    items: List[BookingDTO]
+    next_cursor: Optional[PageCursor] = None
+
+
+class PendingBookingsDTO(BaseDTO):
+    items: List[BookingDTO]
+    since: NotifiedAt
+
+
+class HoldDTO(BaseDTO):
+    id: HoldId
+    user_id: TgId
+    workplaces: List[WorkplaceId]
+    start_time: BookingStartTime
+    end_time: BookingEndTime
+    expires_at: HoldExpiresAt
+
+
+class WaitlistEntryCreateDTO(BaseDTO):
+    workplace_id: WorkplaceId
+    start_time: BookingStartTime
+    end_time: BookingEndTime
+
+
+class WaitlistEntryDTO(BaseDTO):
+    id: WaitlistEntryId
+    user_id: TgId
+    workplace_id: WorkplaceId
+    start_time: BookingStartTime
+    end_time: BookingEndTime
+    created_at: CreatedAt
+
+    @classmethod
+    def orm_to_dto(cls, entry: WaitlistEntryORM, **kwargs) -> "WaitlistEntryDTO":
+        return cls(
+            id=entry.id,
+            user_id=entry.user_id,
+            workplace_id=entry.workplace_id,
+            start_time=entry.start_time,
+            end_time=entry.end_time,
+            created_at=entry.created_at,
+        )
+
+
+class SuggestedSlotDTO(BaseDTO):
+    start_time: BookingStartTime
+    end_time: BookingEndTime
+
+
+class BookingSuggestionsDTO(BaseDTO):
+    slots: List[SuggestedSlotDTO]
+    alternatives: List[WorkplaceDTO]
+
+
+class BookingFilterDTO(BaseDTO):
+    status: Optional[BookingStatus] = None
+    start_time: Optional[BookingStartTime] = None
+    end_time: Optional[BookingEndTime] = None
+
+
 class BookingCreateDTO(BaseDTO):
     workplaces: List[WorkplaceId]
     start_time: BookingStartTime
     end_time: BookingEndTime
 
+    @model_validator(mode="after")
+    def validate_workplaces(cls, values: "BookingCreateDTO"):
+        if len(set(values.workplaces)) != len(values.workplaces):
+            raise ValueError("workplaces must not contain duplicates")
+
+        return values
+
 
 class BookingUpdateDTO(BaseDTO):
     start_time: Optional[BookingStartTime] = None
     end_time: Optional[BookingEndTime] = None
+
+
+class BookingBulkCreateDTO(BaseDTO):
+    items: Annotated[List[BookingCreateDTO], Field(min_length=1, max_length=100)]
+    atomic: bool = True
+
+
+class BookingBulkItemDTO(BaseDTO):
+    status: BulkBookingStatus
+    booking: Optional[BookingDTO] = None
+    detail: Optional[str] = None
+
+
+class BookingBulkResultDTO(BaseDTO):
+    items: List[BookingBulkItemDTO]
+
+
+class BookingQuoteCreateDTO(BaseDTO):
+    items: Annotated[List[BookingCreateDTO], Field(min_length=1, max_length=500)]
+
+
+class BookingQuoteItemDTO(BaseDTO):
+    workplaces: List[WorkplaceId]
+    start_time: BookingStartTime
+    end_time: BookingEndTime
+    total_price: Optional[BookingTotalPrice] = None
+    detail: Optional[str] = None
+
+
+class BookingQuoteResultDTO(BaseDTO):
+    items: List[BookingQuoteItemDTO]
+
+
+class BookingSeriesCreateDTO(BaseDTO):
+    workplaces: List[WorkplaceId]
+    start_time: BookingStartTime
+    end_time: BookingEndTime
+    weekdays: Annotated[List[SeriesWeekday], Field(min_length=1, max_length=7)]
+    interval: SeriesInterval = 1
+    until: Optional[SeriesUntil] = None
+    count: Optional[SeriesCount] = None
+
+
+class BookingSeriesDTO(BaseDTO):
+    id: SeriesId
+    user_id: TgId
+    workplaces: List[WorkplaceId]
+    start_time: BookingStartTime
+    end_time: BookingEndTime
+    weekdays: List[SeriesWeekday]
+    interval: SeriesInterval
+    until: Optional[SeriesUntil] = None
+    count: Optional[SeriesCount] = None
+    bookings: List[BookingDTO]
+    created_at: CreatedAt
+
+    @classmethod
+    def orm_to_dto(cls, series: BookingSeriesORM, **kwargs) -> "BookingSeriesDTO":
+        return cls(
+            id=series.id,
+            user_id=series.user_id,
+            workplaces=series.workplace_ids,
+            start_time=series.start_time,
+            end_time=series.end_time,
+            weekdays=series.weekdays,
+            interval=series.interval,
+            until=series.until,
+            count=series.count,
+            bookings=[BookingDTO.orm_to_dto(booking) for booking in series.bookings],
+            created_at=series.created_at,
+        )
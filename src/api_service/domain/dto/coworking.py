@@ -1,4 +1,6 @@
-from typing import Optional
+from typing import Optional, List
+
+from pydantic import model_validator
 
 from .base import BaseDTO
 from .misc import (
@@ -12,6 +14,15 @@ from .misc import (
     TariffName,
     TariffColor,
     TariffPricePerHour,
+    TariffHour,
+    TariffPercent,
+    TariffDiscountPercent,
+    TariffMinMinutes,
+    TariffMinSeats,
+    WorkplaceId,
+    TimelineDate,
+    TimelineSlotMinutes,
+    TimelineOccupancy,
     CreatedAt,
 )
 from infrastructure.database.postgres.models import CoworkingORM, CoworkingTariffORM
@@ -96,11 +107,36 @@ class CoworkingUpdateDTO(BaseDTO):
         )
 
 
+class TariffSeatDiscountDTO(BaseDTO):
+    min_seats: TariffMinSeats
+    percent: TariffDiscountPercent
+
+
+class TariffPricingRulesDTO(BaseDTO):
+    peak_start: Optional[TariffHour] = None
+    peak_end: Optional[TariffHour] = None
+    peak_percent: TariffPercent = 100
+    off_peak_percent: TariffPercent = 100
+    weekend_percent: TariffPercent = 100
+    min_minutes: TariffMinMinutes = 0
+    seat_discounts: List[TariffSeatDiscountDTO] = []
+
+    @model_validator(mode="after")
+    def validate_peak(cls, values: "TariffPricingRulesDTO"):
+        if (values.peak_start is None) != (values.peak_end is None):
+            raise ValueError("peak_start and peak_end must be set together")
+        if values.peak_start is not None and values.peak_start >= values.peak_end:
+            raise ValueError("peak_start must be less than peak_end")
+
+        return values
+
+
 class CoworkingTariffDTO(BaseDTO):
     id: TariffId
     name: TariffName
     color: TariffColor
     price_per_hour: TariffPricePerHour
+    pricing_rules: Optional[TariffPricingRulesDTO] = None
     created_at: CreatedAt
 
     @classmethod
@@ -110,6 +146,7 @@ class CoworkingTariffDTO(BaseDTO):
             name=orm.name,
             color=orm.color,
             price_per_hour=orm.price_per_hour,
+            pricing_rules=orm.pricing_rules,
             created_at=int(orm.created_at.timestamp()),
         )
 
@@ -119,11 +156,26 @@ class CoworkingTariffCreateDTO(BaseDTO):
     name: TariffName
     color: TariffColor
     price_per_hour: TariffPricePerHour
+    pricing_rules: Optional[TariffPricingRulesDTO] = None
 
     def dto_to_orm(self) -> CoworkingTariffORM:
         return CoworkingTariffORM(
             coworking_id=self.coworking_id,
             name=self.name,
             color=self.color,
-            price_per_hour=self.price_per_hour
+            price_per_hour=self.price_per_hour,
+            pricing_rules=self.pricing_rules.dict() if self.pricing_rules is not None else None,
         )
+
+
+class WorkplaceTimelineDTO(BaseDTO):
+    workplace_id: WorkplaceId
+    occupancy: TimelineOccupancy
+
+
+class CoworkingTimelineDTO(BaseDTO):
+    coworking_id: CoworkingId
+    date: TimelineDate
+    slot_minutes: TimelineSlotMinutes
+    slots: int
+    workplaces: List[WorkplaceTimelineDTO]
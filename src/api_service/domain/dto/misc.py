@@ -1,5 +1,5 @@
 from enum import StrEnum
-from datetime import datetime
+from datetime import datetime, date
 from typing import Annotated, List
 
 from pydantic import Field, constr, conint, confloat, UUID4
@@ -22,6 +22,18 @@ class BookingStatus(StrEnum):
     FINISHED = 'FINISHED'
 
 
+class BulkBookingStatus(StrEnum):
+    CREATED = 'CREATED'
+    CONFLICT = 'CONFLICT'
+    NOT_FOUND = 'NOT_FOUND'
+    SKIPPED = 'SKIPPED'
+
+
+class ExportFormat(StrEnum):
+    NDJSON = 'ndjson'
+    CSV = 'csv'
+
+
 TgId = Annotated[
     conint(ge=1),
     Field(ge=1, examples=[1522105862])
@@ -98,6 +110,26 @@ TariffPricePerHour = Annotated[
     conint(ge=0),
     Field(ge=0, examples=[750])
 ]
+TariffHour = Annotated[
+    conint(ge=0, le=24),
+    Field(ge=0, le=24, examples=[9])
+]
+TariffPercent = Annotated[
+    conint(ge=0, le=1000),
+    Field(ge=0, le=1000, description="Процент от базовой цены", examples=[150])
+]
+TariffDiscountPercent = Annotated[
+    conint(ge=0, le=100),
+    Field(ge=0, le=100, examples=[10])
+]
+TariffMinMinutes = Annotated[
+    conint(ge=0, le=1440),
+    Field(ge=0, le=1440, examples=[60])
+]
+TariffMinSeats = Annotated[
+    conint(ge=2),
+    Field(ge=2, examples=[3])
+]
 
 WorkplaceId = Annotated[
     UUID4,
@@ -140,6 +172,79 @@ BookingTotalPrice = Annotated[
     conint(ge=0),
     Field(ge=0, examples=[1500])
 ]
+SeriesId = Annotated[
+    UUID4,
+    Field(examples=['5d2b9c1e-7a4f-4b8e-9c3d-1e6f2a8b7c40'])
+]
+SeriesWeekday = Annotated[
+    conint(ge=0, le=6),
+    Field(ge=0, le=6, description="0 - понедельник, 6 - воскресенье", examples=[0])
+]
+SeriesInterval = Annotated[
+    conint(ge=1, le=52),
+    Field(ge=1, le=52, examples=[1])
+]
+SeriesUntil = Annotated[
+    datetime,
+    Field(examples=[datetime.now()])
+]
+SeriesCount = Annotated[
+    conint(ge=1, le=366),
+    Field(ge=1, le=366, examples=[20])
+]
+HoldId = Annotated[
+    UUID4,
+    Field(examples=['0b7e5f0c-3c1a-4f5e-9d7a-8f2e1c6b4a90'])
+]
+HoldExpiresAt = Annotated[
+    datetime,
+    Field(examples=[datetime.now()])
+]
+WaitlistEntryId = Annotated[
+    UUID4,
+    Field(examples=['9a4c2e71-5b8d-4f3a-8e6c-3d7b1f0a2c58'])
+]
+IdempotencyKey = Annotated[
+    constr(min_length=1, max_length=255),
+    Field(min_length=1, max_length=255, examples=['6f1d3c2a-8b3e-4d0f-9a51-2f4c9e7b1d20'])
+]
+ClusterSize = Annotated[
+    conint(ge=1, le=50),
+    Field(ge=1, le=50, examples=[4])
+]
+SuggestionLimit = Annotated[
+    conint(ge=1, le=20),
+    Field(ge=1, le=20, examples=[5])
+]
+PageLimit = Annotated[
+    conint(ge=1, le=200),
+    Field(ge=1, le=200, examples=[50])
+]
+PageCursor = Annotated[
+    str,
+    Field(examples=['MjAyNS0wMy0wNFQwOTowMDowMHxmMzA0N2NkOC01NmU2LTQ2ZTQtYWMyZC03NTc1NTBjMWY2MmE'])
+]
+ReminderWindowMinutes = Annotated[
+    conint(ge=1, le=1440),
+    Field(ge=1, le=1440, examples=[60])
+]
+NotifiedAt = Annotated[
+    datetime,
+    Field(examples=[datetime.now()])
+]
+
+TimelineDate = Annotated[
+    date,
+    Field(examples=[date(2025, 3, 4)])
+]
+TimelineSlotMinutes = Annotated[
+    conint(ge=5, le=1440),
+    Field(ge=5, le=1440, examples=[30])
+]
+TimelineOccupancy = Annotated[
+    str,
+    Field(examples=['AAAMAAAA'])
+]
 
 CreatedAt = Annotated[
     datetime,
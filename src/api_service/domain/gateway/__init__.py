@@ -3,3 +3,4 @@ from .coworking import CoworkingGateway
 from .workplace import WorkplaceGateway
 from .booking import BookingGateway
 from .stats import StatsGateway
+from .hold import HoldGateway
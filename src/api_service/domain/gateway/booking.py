@@ -1,9 +1,19 @@
+import uuid
 from abc import abstractmethod
-from typing import Protocol, List
+from datetime import datetime, timedelta
+from typing import Protocol, List, Optional, Tuple, AsyncIterator
 
-from domain.dto.booking import BookingCreateDTO, BookingUpdateDTO
-from domain.dto.misc import TgId, CoworkingId, BookingId
-from infrastructure.database.postgres.models import BookingORM
+from sqlalchemy import Row
+
+from domain.dto.booking import (
+    BookingCreateDTO,
+    BookingUpdateDTO,
+    BookingFilterDTO,
+    BookingSeriesCreateDTO,
+    WaitlistEntryCreateDTO,
+)
+from domain.dto.misc import TgId, CoworkingId, BookingId, BulkBookingStatus, SeriesId, WaitlistEntryId
+from infrastructure.database.postgres.models import BookingORM, BookingSeriesORM, WaitlistEntryORM
 
 
 class BookingGateway(Protocol):
@@ -12,27 +22,63 @@ class BookingGateway(Protocol):
         pass
 
     @abstractmethod
-    async def list_user_bookings(self, tg_id: TgId) -> List[BookingORM]:
+    async def list_user_bookings(self, tg_id: TgId, limit: int,
+                                 after: Optional[Tuple[datetime, uuid.UUID]] = None,
+                                 filters: Optional[BookingFilterDTO] = None) -> List[Row]:
+        pass
+
+    @abstractmethod
+    async def list_coworking_bookings(self, coworking_id: CoworkingId, limit: int,
+                                      after: Optional[Tuple[datetime, uuid.UUID]] = None,
+                                      filters: Optional[BookingFilterDTO] = None) -> List[Row]:
         pass
 
     @abstractmethod
-    async def list_coworking_bookings(self, coworking_id: CoworkingId) -> List[BookingORM]:
+    async def list_all_bookings(self, limit: int,
+                                after: Optional[Tuple[datetime, uuid.UUID]] = None,
+                                filters: Optional[BookingFilterDTO] = None) -> List[Row]:
         pass
 
     @abstractmethod
-    async def list_all_bookings(self) -> List[BookingORM]:
+    def stream_bookings(self) -> AsyncIterator[Row]:
+        pass
+
+    @abstractmethod
+    async def is_booked(self, workplaces: List[uuid.UUID], start_time: datetime, end_time: datetime) -> bool:
         pass
 
     @abstractmethod
     async def add_booking(self, booking: BookingCreateDTO, user_id: TgId) -> BookingORM:
         pass
 
+    @abstractmethod
+    async def add_bookings(self, bookings: List[BookingCreateDTO], user_id: TgId,
+                           atomic: bool) -> List[Tuple[BulkBookingStatus, Optional[BookingORM]]]:
+        pass
+
+    @abstractmethod
+    async def add_booking_series(self, series: BookingSeriesCreateDTO, bookings: List[BookingCreateDTO],
+                                 user_id: TgId) -> BookingSeriesORM:
+        pass
+
+    @abstractmethod
+    async def delete_booking_series(self, series_id: SeriesId, user_id: TgId) -> None:
+        pass
+
     @abstractmethod
     async def update_booking(self, booking: BookingUpdateDTO, booking_id: BookingId, user_id: TgId) -> BookingORM:
         pass
 
     @abstractmethod
-    async def delete_booking(self, booking_id: BookingId, user_id: TgId) -> None:
+    async def delete_booking(self, booking_id: BookingId, user_id: TgId) -> List[BookingORM]:
+        pass
+
+    @abstractmethod
+    async def add_waitlist_entry(self, entry: WaitlistEntryCreateDTO, user_id: TgId) -> WaitlistEntryORM:
+        pass
+
+    @abstractmethod
+    async def delete_waitlist_entry(self, entry_id: WaitlistEntryId, user_id: TgId) -> None:
         pass
 
     @abstractmethod
@@ -40,5 +86,5 @@ class BookingGateway(Protocol):
         pass
 
     @abstractmethod
-    async def pending_bookings(self) -> List[BookingORM]:
+    async def pending_bookings(self, window: timedelta, since: Optional[datetime] = None) -> List[BookingORM]:
         pass
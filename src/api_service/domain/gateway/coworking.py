@@ -1,8 +1,9 @@
 from abc import abstractmethod
-from typing import Protocol, Optional, List
+from datetime import datetime
+from typing import Protocol, Optional, List, Tuple
 
 from domain.dto.coworking import CoworkingCreateDTO, CoworkingUpdateDTO, CoworkingTariffCreateDTO
-from domain.dto.misc import CoworkingId
+from domain.dto.misc import CoworkingId, WorkplaceId
 from infrastructure.database.postgres.models import CoworkingORM, CoworkingTariffORM
 
 
@@ -12,7 +13,15 @@ class CoworkingGateway(Protocol):
         pass
 
     @abstractmethod
-    async def list_coworkings(self, offset: int, limit: int) -> List[CoworkingORM]:
+    async def get_coworking_json(self, coworking_id: CoworkingId) -> Optional[dict]:
+        pass
+
+    @abstractmethod
+    async def get_floor_plan_version(self, coworking_id: CoworkingId) -> Optional[int]:
+        pass
+
+    @abstractmethod
+    async def list_coworkings(self, offset: int, limit: int) -> List[dict]:
         pass
 
     @abstractmethod
@@ -32,5 +41,10 @@ class CoworkingGateway(Protocol):
         pass
 
     @abstractmethod
-    async def list_tariffs(self, coworking_id: CoworkingId) -> List[CoworkingTariffORM]:
+    async def list_tariffs(self, coworking_id: CoworkingId) -> List[dict]:
+        pass
+
+    @abstractmethod
+    async def list_workplace_occupancy(self, coworking_id: CoworkingId, start_time: datetime,
+                                       end_time: datetime) -> List[Tuple[WorkplaceId, Optional[datetime], Optional[datetime]]]:
         pass
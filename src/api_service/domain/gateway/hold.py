@@ -0,0 +1,33 @@
+import uuid
+from abc import abstractmethod
+from datetime import datetime
+from typing import Protocol, List, Set, Tuple
+
+from domain.dto.booking import HoldDTO
+from domain.dto.misc import TgId, HoldId
+
+
+class HoldGateway(Protocol):
+    @abstractmethod
+    async def add_hold(self, user_id: TgId, workplaces: List[uuid.UUID], start_time: datetime, end_time: datetime,
+                       ttl: int) -> HoldDTO:
+        pass
+
+    @abstractmethod
+    async def delete_hold(self, hold_id: HoldId, user_id: TgId) -> None:
+        pass
+
+    @abstractmethod
+    async def list_held_workplaces(self, workplaces: List[uuid.UUID], start_time: datetime, end_time: datetime,
+                                   user_id: TgId) -> Set[uuid.UUID]:
+        pass
+
+    @abstractmethod
+    async def list_held_periods(self, workplaces: List[uuid.UUID], start_time: datetime, end_time: datetime,
+                                user_id: TgId) -> List[Tuple[uuid.UUID, datetime, datetime]]:
+        pass
+
+    @abstractmethod
+    async def release_holds(self, user_id: TgId, workplaces: List[uuid.UUID], start_time: datetime,
+                            end_time: datetime) -> None:
+        pass
@@ -1,7 +1,7 @@
 from abc import abstractmethod
 from typing import Protocol, Optional, List
 
-from domain.dto.misc import TgId
+from domain.dto.misc import TgId, UserRole
 from domain.dto.user import TelegramAuthDTO
 from infrastructure.database.postgres.models import UserORM, BookingORM
 
@@ -18,3 +18,7 @@ class UserGateway(Protocol):
     @abstractmethod
     async def add_user(self, user: TelegramAuthDTO) -> None:
         pass
+
+    @abstractmethod
+    async def update_role(self, tg_id: TgId, role: UserRole) -> None:
+        pass
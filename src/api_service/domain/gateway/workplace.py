@@ -1,8 +1,8 @@
 from abc import abstractmethod
-from typing import Protocol, List
+from typing import Protocol, List, Optional, Tuple
 
 from domain.dto.workplace import WorkplaceUpsertDTO
-from domain.dto.misc import CoworkingId
+from domain.dto.misc import CoworkingId, WorkplaceId, BookingStartTime, BookingEndTime
 from infrastructure.database.postgres.models import WorkplaceORM
 
 
@@ -11,6 +11,23 @@ class WorkplaceGateway(Protocol):
     async def upsert_workplaces(self, workplaces: List[WorkplaceUpsertDTO]) -> List[WorkplaceORM]:
         pass
 
+    @abstractmethod
+    async def get_workplaces(self, workplace_ids: List[WorkplaceId]) -> List[WorkplaceORM]:
+        pass
+
     @abstractmethod
     async def list_workplaces(self, coworking_id: CoworkingId) -> List[WorkplaceORM]:
         pass
+
+    @abstractmethod
+    async def list_workplaces_json(self, coworking_id: CoworkingId) -> List[dict]:
+        pass
+
+    @abstractmethod
+    async def list_workplace_coordinates(self, coworking_id: CoworkingId) -> List[Tuple[WorkplaceId, float, float]]:
+        pass
+
+    @abstractmethod
+    async def list_available_workplaces(self, coworking_id: CoworkingId, start_time: BookingStartTime,
+                                        end_time: BookingEndTime, tags: Optional[List[str]]) -> List[WorkplaceORM]:
+        pass
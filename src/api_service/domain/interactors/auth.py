@@ -2,7 +2,9 @@ from typing import Tuple
 from redis.asyncio import Redis
 
 from core.exceptions import UserUnauthorizedError
-from core.security import AuthManager
+from core.security import AuthManager, VerifiedTokenCache
+from infrastructure.database.redis.admins import AdminRegistry
+from infrastructure.database.redis.bus import EventBus, TOKEN_REVOKED
 from infrastructure.database.redis.storage import RedisStorage
 from domain.dto.misc import TgId
 
@@ -13,22 +15,29 @@ class GenerateAccessTokenInteractor:
         self.redis_storage = RedisStorage(redis)
 
     async def __call__(self, tg_id: TgId) -> str:
-        exist_token = await self.redis_storage.get(tg_id)
-        if exist_token:
-            return exist_token
-
+        # подпись дешевле лишнего запроса: если токен уже выдан, Redis вернёт его, а новый отбросится
         token = self.auth_manager.create_access_token({"sub": str(tg_id)})
         ex_time = self.auth_manager.config.ACCESS_TOKEN_EXPIRE_MINUTES * 60
-        await self.redis_storage.set(tg_id, token, ex=ex_time)
-        return token
+        return await self.redis_storage.get_or_set(str(tg_id), token, ex=ex_time)
 
 
 class OAuth2PasswordBearerInteractor:
-    def __init__(self, auth_manager: AuthManager, redis: Redis):
+    def __init__(self, auth_manager: AuthManager, redis: Redis, token_cache: VerifiedTokenCache,
+                 admin_registry: AdminRegistry):
         self.auth_manager = auth_manager
         self.redis_storage = RedisStorage(redis)
+        self.token_cache = token_cache
+        self.admin_registry = admin_registry
 
     async def __call__(self, token: str) -> Tuple[int, bool]:
+        # уже проверенный токен не декодируется повторно и не сверяется с Redis
+        tg_id = self.token_cache.get(token)
+        if tg_id is None:
+            tg_id = await self._verify(token)
+
+        return tg_id, self.admin_registry.is_admin(tg_id)
+
+    async def _verify(self, token: str) -> int:
         decoded_token = self.auth_manager.decode_access_token(token)
         if not decoded_token:
             raise UserUnauthorizedError
@@ -39,11 +48,24 @@ class OAuth2PasswordBearerInteractor:
 
         tg_id = int(sub)
 
-        # admins = self.auth_manager.config.TG_ADMINS  # await self.redis_storage.get_list("tg_admins")
-        is_admin = True  # tg_id in admins  # sub in admins
-
+        generation = self.token_cache.generation
         exist_token = await self.redis_storage.get(sub)
         if exist_token != token:
             raise UserUnauthorizedError
 
-        return tg_id, is_admin
+        # пока шёл запрос в Redis, токен могли отозвать
+        if self.token_cache.generation == generation:
+            self.token_cache.put(token, tg_id, decoded_token["exp"])
+        return tg_id
+
+
+class RevokeAccessTokenInteractor:
+    def __init__(self, redis: Redis, token_cache: VerifiedTokenCache, bus: EventBus):
+        self.redis_storage = RedisStorage(redis)
+        self.token_cache = token_cache
+        self.bus = bus
+
+    async def __call__(self, tg_id: TgId) -> None:
+        await self.redis_storage.delete(tg_id)
+        self.token_cache.revoke(tg_id)
+        await self.bus.publish(TOKEN_REVOKED, {"tg_id": tg_id})
@@ -1,9 +1,90 @@
-from typing import List
+import asyncio
+import csv
+import hashlib
+import io
+import json
+import time
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Dict, Optional, AsyncIterator
 
-from core.exceptions import AccessDeniedError
+from redis.asyncio import Redis
+from sqlalchemy import Row
+
+from core.exceptions import AccessDeniedError, ConflictError, EntityNotFoundError
+from core.pricing import quote_price
+from core.recurrence import expand_weekly
+from core.timeline import nearest_free_slots
+from core.utils import encode_cursor, decode_cursor
 from domain.gateway.booking import BookingGateway
-from domain.dto.misc import TgId, CoworkingId, BookingId
-from domain.dto.booking import BookingDTO, BookingCreateDTO
+from domain.gateway.coworking import CoworkingGateway
+from domain.gateway.workplace import WorkplaceGateway
+from domain.gateway.hold import HoldGateway
+from infrastructure.database.redis.storage import RedisStorage
+from domain.dto.misc import (
+    TgId,
+    CoworkingId,
+    BookingId,
+    PageLimit,
+    PageCursor,
+    ExportFormat,
+    IdempotencyKey,
+    ReminderWindowMinutes,
+    NotifiedAt,
+    HoldId,
+    BulkBookingStatus,
+    SeriesId,
+    WorkplaceId,
+    WorkplaceStatus,
+    BookingStartTime,
+    BookingEndTime,
+    SuggestionLimit,
+    WaitlistEntryId,
+)
+from domain.dto.booking import (
+    BookingDTO,
+    BookingPageDTO,
+    BookingCreateDTO,
+    BookingFilterDTO,
+    BookingBulkCreateDTO,
+    BookingBulkItemDTO,
+    BookingBulkResultDTO,
+    BookingQuoteCreateDTO,
+    BookingQuoteItemDTO,
+    BookingQuoteResultDTO,
+    BookingSeriesCreateDTO,
+    BookingSeriesDTO,
+    BookingSuggestionsDTO,
+    SuggestedSlotDTO,
+    PendingBookingsDTO,
+    HoldDTO,
+    WaitlistEntryCreateDTO,
+    WaitlistEntryDTO,
+)
+from domain.dto.workplace import WorkplaceDTO
+
+
+WAITLIST_NOTIFICATIONS_KEY = "notifications:waitlist"
+WAITLIST_PROCESSING_KEY = "notifications:waitlist:processing"
+
+BULK_BOOKING_DETAILS = {
+    BulkBookingStatus.CONFLICT: "Workplace is already booked",
+    BulkBookingStatus.NOT_FOUND: "Workplaces not found",
+    BulkBookingStatus.SKIPPED: "Not created because another item failed",
+}
+
+
+def to_booking_page(rows: List[Row], limit: PageLimit) -> BookingPageDTO:
+    next_cursor = None
+    if len(rows) > limit:
+        rows = rows[:limit]
+        next_cursor = encode_cursor(rows[-1].start_time, rows[-1].id)
+
+    # брони уже собраны в JSON на стороне Postgres
+    page = {"items": [row.data for row in rows]}
+    if next_cursor is not None:
+        page["next_cursor"] = next_cursor
+    return page
 
 
 class GetBookingInteractor:
@@ -19,43 +100,374 @@ class ListUserBookingsInteractor:
     def __init__(self, booking_gateway: BookingGateway):
         self.booking_gateway = booking_gateway
 
-    async def __call__(self, tg_id: TgId, admin: bool, is_admin: bool) -> List[BookingDTO]:
+    async def __call__(self, tg_id: TgId, admin: bool, is_admin: bool, limit: PageLimit,
+                       cursor: Optional[PageCursor] = None,
+                       filters: Optional[BookingFilterDTO] = None) -> BookingPageDTO:
         if admin and not is_admin:
             raise AccessDeniedError
 
-        user_bookings = await self.booking_gateway.list_user_bookings(tg_id=tg_id)
-        return [BookingDTO.orm_to_dto(booking).dict() for booking in user_bookings]
+        after = decode_cursor(cursor) if cursor else None
+        user_bookings = await self.booking_gateway.list_user_bookings(tg_id=tg_id, limit=limit + 1, after=after,
+                                                                        filters=filters)
+        return to_booking_page(user_bookings, limit)
 
 
 class ListCoworkingBookingsInteractor:
     def __init__(self, booking_gateway: BookingGateway):
         self.booking_gateway = booking_gateway
 
-    async def __call__(self, coworking_id: CoworkingId) -> List[BookingDTO]:
-        coworking_bookings = await self.booking_gateway.list_coworking_bookings(coworking_id)
-        return [BookingDTO.orm_to_dto(booking).dict() for booking in coworking_bookings]
+    async def __call__(self, coworking_id: CoworkingId, limit: PageLimit,
+                       cursor: Optional[PageCursor] = None,
+                       filters: Optional[BookingFilterDTO] = None) -> BookingPageDTO:
+        after = decode_cursor(cursor) if cursor else None
+        coworking_bookings = await self.booking_gateway.list_coworking_bookings(coworking_id, limit=limit + 1,
+                                                                                after=after, filters=filters)
+        return to_booking_page(coworking_bookings, limit)
 
 
 class ListAllBookingsInteractor:
     def __init__(self, booking_gateway: BookingGateway):
         self.booking_gateway = booking_gateway
 
-    async def __call__(self, is_admin: bool) -> List[BookingDTO]:
+    async def __call__(self, is_admin: bool, limit: PageLimit, cursor: Optional[PageCursor] = None,
+                       filters: Optional[BookingFilterDTO] = None) -> BookingPageDTO:
         if not is_admin:
             raise AccessDeniedError
 
-        all_bookings = await self.booking_gateway.list_all_bookings()
-        return [BookingDTO.orm_to_dto(booking).dict() for booking in all_bookings]
+        after = decode_cursor(cursor) if cursor else None
+        all_bookings = await self.booking_gateway.list_all_bookings(limit=limit + 1, after=after, filters=filters)
+        return to_booking_page(all_bookings, limit)
 
 
-class AddBookingInteractor:
+class ExportBookingsInteractor:
+    columns = ("id", "user_id", "workplaces", "start_time", "end_time", "status", "total_price", "created_at")
+    chunk_size = 500
+
     def __init__(self, booking_gateway: BookingGateway):
         self.booking_gateway = booking_gateway
 
-    async def __call__(self, booking: BookingCreateDTO, user_id: TgId) -> BookingDTO:
+    async def __call__(self, is_admin: bool, export_format: ExportFormat) -> AsyncIterator[str]:
+        if not is_admin:
+            raise AccessDeniedError
+
+        rows = self.booking_gateway.stream_bookings()
+        if export_format == ExportFormat.CSV:
+            return self._to_csv(rows)
+
+        return self._to_ndjson(rows)
+
+    @staticmethod
+    def _row_values(row: Row) -> tuple:
+        return (
+            str(row.id),
+            row.user_id,
+            [str(workplace_id) for workplace_id in row.workplaces or []],
+            row.start_time.isoformat(),
+            row.end_time.isoformat(),
+            row.status,
+            row.total_price,
+            row.created_at.isoformat(),
+        )
+
+    async def _to_ndjson(self, rows: AsyncIterator[Row]) -> AsyncIterator[str]:
+        lines = []
+        async for row in rows:
+            lines.append(json.dumps(dict(zip(self.columns, self._row_values(row))), ensure_ascii=False) + "\n")
+            if len(lines) >= self.chunk_size:
+                yield "".join(lines)
+                lines.clear()
+
+        if lines:
+            yield "".join(lines)
+
+    async def _to_csv(self, rows: AsyncIterator[Row]) -> AsyncIterator[str]:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(self.columns)
+
+        written = 0
+        async for row in rows:
+            values = self._row_values(row)
+            writer.writerow((*values[:2], ";".join(values[2]), *values[3:]))
+            written += 1
+            if written % self.chunk_size == 0:
+                yield buffer.getvalue()
+                buffer.seek(0)
+                buffer.truncate()
+
+        yield buffer.getvalue()
+
+
+class AddHoldInteractor:
+    hold_ttl = 5 * 60
+
+    def __init__(self, booking_gateway: BookingGateway, hold_gateway: HoldGateway,
+                 workplace_gateway: WorkplaceGateway):
+        self.booking_gateway = booking_gateway
+        self.hold_gateway = hold_gateway
+        self.workplace_gateway = workplace_gateway
+
+    async def __call__(self, hold: BookingCreateDTO, user_id: TgId) -> HoldDTO:
+        if not hold.workplaces:
+            raise ValueError("Hold must contain at least one workplace")
+
+        workplaces = await self.workplace_gateway.get_workplaces(hold.workplaces)
+        if len(workplaces) != len(set(hold.workplaces)):
+            raise EntityNotFoundError("Workplace")
+
+        # место, которое уже забронировано, держать бессмысленно
+        if await self.booking_gateway.is_booked(hold.workplaces, hold.start_time, hold.end_time):
+            raise AccessDeniedError("Workplace is already booked")
+
+        hold_dto = await self.hold_gateway.add_hold(user_id, hold.workplaces, hold.start_time, hold.end_time,
+                                                    ttl=self.hold_ttl)
+        return hold_dto.dict()
+
+
+class DeleteHoldInteractor:
+    def __init__(self, hold_gateway: HoldGateway):
+        self.hold_gateway = hold_gateway
+
+    async def __call__(self, hold_id: HoldId, user_id: TgId) -> None:
+        await self.hold_gateway.delete_hold(hold_id, user_id)
+
+
+class SuggestBookingSlotsInteractor:
+    def __init__(self, workplace_gateway: WorkplaceGateway, coworking_gateway: CoworkingGateway,
+                 hold_gateway: HoldGateway):
+        self.workplace_gateway = workplace_gateway
+        self.coworking_gateway = coworking_gateway
+        self.hold_gateway = hold_gateway
+
+    async def __call__(self, workplaces: List[WorkplaceId], start_time: BookingStartTime, end_time: BookingEndTime,
+                       user_id: TgId, limit: SuggestionLimit) -> BookingSuggestionsDTO:
+        if start_time >= end_time:
+            raise ValueError("start_time must be less than end_time")
+
+        requested = await self.workplace_gateway.get_workplaces(workplaces)
+        if not requested or len(requested) != len(set(workplaces)):
+            raise EntityNotFoundError("Workplaces")
+
+        coworking_ids = {workplace.coworking_id for workplace in requested}
+        if len(coworking_ids) > 1:
+            raise ValueError("Workplaces must belong to one coworking")
+        coworking_id = coworking_ids.pop()
+
+        # окно поиска — сутки желаемого начала (и хвост брони, если она переходит через полночь)
+        window_start = datetime.combine(start_time.date(), datetime.min.time())
+        window_end = max(window_start + timedelta(days=1), end_time)
+        rows = await self.coworking_gateway.list_workplace_occupancy(coworking_id, window_start, window_end)
+
+        busy: Dict[WorkplaceId, list] = {}
+        for workplace_id, busy_start, busy_end in rows:
+            workplace_busy = busy.setdefault(workplace_id, [])
+            if busy_start is not None:
+                workplace_busy.append((busy_start, busy_end))
+        held_periods = await self.hold_gateway.list_held_periods(list(busy), window_start, window_end, user_id)
+        for workplace_id, held_start, held_end in held_periods:
+            busy[workplace_id].append((held_start, held_end))
+
+        requested_busy = [interval for workplace in requested for interval in busy.get(workplace.id, [])]
+        slots = nearest_free_slots(requested_busy, window_start, window_end, end_time - start_time, start_time, limit)
+
+        requested_ids = {workplace.id for workplace in requested}
+        tariff_ids = {workplace.tariff_id for workplace in requested}
+        alternatives = [
+            workplace
+            for workplace in await self.workplace_gateway.list_workplaces(coworking_id)
+            if workplace.id not in requested_ids
+            and workplace.tariff_id in tariff_ids
+            and workplace.status != WorkplaceStatus.INACTIVE
+            and not any(s < end_time and start_time < e for s, e in busy.get(workplace.id, []))
+        ]
+        alternatives.sort(key=lambda workplace: workplace.number)
+
+        return BookingSuggestionsDTO(
+            slots=[SuggestedSlotDTO(start_time=start, end_time=end) for start, end in slots],
+            alternatives=[WorkplaceDTO.orm_to_dto(workplace) for workplace in alternatives[:limit]],
+        ).dict()
+
+
+class AddBookingInteractor:
+    idempotency_ttl = 24 * 60 * 60
+    lock_ttl = 10
+    lock_poll_interval = 0.05
+
+    def __init__(self, booking_gateway: BookingGateway, hold_gateway: HoldGateway, redis: Redis):
+        self.booking_gateway = booking_gateway
+        self.hold_gateway = hold_gateway
+        self.redis_storage = RedisStorage(redis)
+
+    async def __call__(self, booking: BookingCreateDTO, user_id: TgId,
+                       idempotency_key: Optional[IdempotencyKey] = None) -> BookingDTO:
+        if idempotency_key is None:
+            return await self._add_booking(booking, user_id)
+
+        key = f"idempotency:bookings:add:{user_id}:{idempotency_key}"
+        lock_key = f"{key}:lock"
+        fingerprint = hashlib.sha256(booking.json().encode()).hexdigest()
+        lock_token = uuid.uuid4().hex
+
+        # повтор с тем же ключом ждёт, пока первый запрос не сохранит ответ или не отпустит блокировку
+        deadline = time.monotonic() + self.lock_ttl
+        while True:
+            stored = await self.redis_storage.get(key)
+            if stored:
+                return self._replay(json.loads(stored), fingerprint)
+
+            if await self.redis_storage.set_if_absent(lock_key, lock_token, ex=self.lock_ttl):
+                break
+
+            if time.monotonic() >= deadline:
+                raise ConflictError("Request with this Idempotency-Key is still in progress")
+            await asyncio.sleep(self.lock_poll_interval)
+
+        try:
+            stored = await self.redis_storage.get(key)
+            if stored:
+                return self._replay(json.loads(stored), fingerprint)
+
+            booking_dto = await self._add_booking(booking, user_id)
+            await self.redis_storage.set(
+                key,
+                json.dumps({"fingerprint": fingerprint, "response": booking_dto.dict()}),
+                ex=self.idempotency_ttl,
+            )
+            return booking_dto
+        finally:
+            # блокировка могла истечь и перейти к другому запросу — чужую не снимаем
+            await self.redis_storage.delete_if_equals(lock_key, lock_token)
+
+    async def _add_booking(self, booking: BookingCreateDTO, user_id: TgId) -> BookingDTO:
+        held = await self.hold_gateway.list_held_workplaces(booking.workplaces, booking.start_time, booking.end_time,
+                                                            user_id)
+        if held:
+            raise AccessDeniedError("Workplace is held by another user")
+
         booking_orm = await self.booking_gateway.add_booking(booking, user_id)
+        await self.hold_gateway.release_holds(user_id, booking.workplaces, booking.start_time, booking.end_time)
         return BookingDTO.orm_to_dto(booking_orm)
 
+    @staticmethod
+    def _replay(stored: dict, fingerprint: str) -> BookingDTO:
+        if stored["fingerprint"] != fingerprint:
+            raise ConflictError("Idempotency-Key is already used with another request")
+
+        return BookingDTO(**stored["response"])
+
+
+class AddBookingsBulkInteractor:
+    def __init__(self, booking_gateway: BookingGateway, hold_gateway: HoldGateway):
+        self.booking_gateway = booking_gateway
+        self.hold_gateway = hold_gateway
+
+    async def __call__(self, bulk: BookingBulkCreateDTO, user_id: TgId) -> BookingBulkResultDTO:
+        bookings = bulk.items
+        workplaces = list({w for booking in bookings for w in booking.workplaces})
+        start_time = min(booking.start_time for booking in bookings)
+        end_time = max(booking.end_time for booking in bookings)
+
+        # холды других пользователей читаются одним запросом на всё окно запроса
+        held_periods = await self.hold_gateway.list_held_periods(workplaces, start_time, end_time, user_id)
+        held = {
+            idx
+            for idx, booking in enumerate(bookings)
+            for workplace_id, held_start, held_end in held_periods
+            if workplace_id in booking.workplaces and held_start < booking.end_time and booking.start_time < held_end
+        }
+
+        if held and bulk.atomic:
+            outcomes = [(BulkBookingStatus.SKIPPED, None)] * len(bookings)
+        else:
+            free = [booking for idx, booking in enumerate(bookings) if idx not in held]
+            free_outcomes = iter(await self.booking_gateway.add_bookings(free, user_id, bulk.atomic) if free else [])
+            outcomes = [
+                (BulkBookingStatus.CONFLICT, None) if idx in held else next(free_outcomes)
+                for idx in range(len(bookings))
+            ]
+
+        # холды снимаются только под созданными бронями, остальные остаются за пользователем
+        for booking, (_, booking_orm) in zip(bookings, outcomes):
+            if booking_orm is not None:
+                await self.hold_gateway.release_holds(user_id, booking.workplaces, booking.start_time, booking.end_time)
+
+        items = []
+        for idx, (status, booking_orm) in enumerate(outcomes):
+            if idx in held:
+                status, detail = BulkBookingStatus.CONFLICT, "Workplace is held by another user"
+            else:
+                detail = BULK_BOOKING_DETAILS.get(status)
+            items.append(BookingBulkItemDTO(
+                status=status,
+                booking=BookingDTO.orm_to_dto(booking_orm) if booking_orm is not None else None,
+                detail=detail,
+            ))
+
+        return BookingBulkResultDTO(items=items).dict()
+
+
+class QuoteBookingsInteractor:
+    def __init__(self, workplace_gateway: WorkplaceGateway):
+        self.workplace_gateway = workplace_gateway
+
+    async def __call__(self, quote: BookingQuoteCreateDTO) -> BookingQuoteResultDTO:
+        # тарифы всех мест из запроса читаются одним запросом, в базу ничего не пишется
+        workplace_ids = list({w for item in quote.items for w in item.workplaces})
+        workplaces = {w.id: w for w in await self.workplace_gateway.get_workplaces(workplace_ids)}
+
+        items = []
+        for item in quote.items:
+            total_price, detail = None, "Workplaces not found"
+            if item.workplaces and all(w in workplaces for w in item.workplaces):
+                tariffs = [(workplaces[w].tariff.price_per_hour, workplaces[w].tariff.pricing_rules)
+                           for w in item.workplaces]
+                total_price, detail = quote_price(tariffs, item.start_time, item.end_time), None
+
+            items.append(BookingQuoteItemDTO(
+                workplaces=item.workplaces,
+                start_time=item.start_time,
+                end_time=item.end_time,
+                total_price=total_price,
+                detail=detail,
+            ))
+
+        return BookingQuoteResultDTO(items=items).dict()
+
+
+class AddBookingSeriesInteractor:
+    def __init__(self, booking_gateway: BookingGateway, hold_gateway: HoldGateway):
+        self.booking_gateway = booking_gateway
+        self.hold_gateway = hold_gateway
+
+    async def __call__(self, series: BookingSeriesCreateDTO, user_id: TgId) -> BookingSeriesDTO:
+        occurrences = expand_weekly(series.start_time, series.end_time, series.weekdays, series.interval,
+                                    until=series.until, count=series.count)
+        if not occurrences:
+            raise ValueError("Series has no occurrences")
+
+        bookings = [
+            BookingCreateDTO(workplaces=series.workplaces, start_time=start_time, end_time=end_time)
+            for start_time, end_time in occurrences
+        ]
+        start_time, end_time = occurrences[0][0], occurrences[-1][1]
+
+        held_periods = await self.hold_gateway.list_held_periods(series.workplaces, start_time, end_time, user_id)
+        for _, held_start, held_end in held_periods:
+            if any(held_start < booking.end_time and booking.start_time < held_end for booking in bookings):
+                raise AccessDeniedError("Workplace is held by another user")
+
+        series_orm = await self.booking_gateway.add_booking_series(series, bookings, user_id)
+        await self.hold_gateway.release_holds(user_id, series.workplaces, start_time, end_time)
+        return BookingSeriesDTO.orm_to_dto(series_orm).dict()
+
+
+class DeleteBookingSeriesInteractor:
+    def __init__(self, booking_gateway: BookingGateway):
+        self.booking_gateway = booking_gateway
+
+    async def __call__(self, series_id: SeriesId, user_id: TgId) -> None:
+        await self.booking_gateway.delete_booking_series(series_id, user_id)
+
 
 class UpdateBookingInteractor:
     def __init__(self, booking_gateway: BookingGateway):
@@ -67,11 +479,68 @@ class UpdateBookingInteractor:
 
 
 class DeleteBookingInteractor:
+    def __init__(self, booking_gateway: BookingGateway, redis: Redis):
+        self.booking_gateway = booking_gateway
+        self.redis_storage = RedisStorage(redis)
+
+    async def __call__(self, booking_id: BookingId, user_id: TgId) -> None:
+        promoted = await self.booking_gateway.delete_booking(booking_id, user_id)
+        for booking in promoted:
+            await self.redis_storage.add_to_list(WAITLIST_NOTIFICATIONS_KEY, BookingDTO.orm_to_dto(booking).json())
+
+
+class AddWaitlistEntryInteractor:
+    def __init__(self, booking_gateway: BookingGateway):
+        self.booking_gateway = booking_gateway
+
+    async def __call__(self, entry: WaitlistEntryCreateDTO, user_id: TgId) -> WaitlistEntryDTO:
+        # свободное место нужно бронировать, а не ждать
+        if not await self.booking_gateway.is_booked([entry.workplace_id], entry.start_time, entry.end_time):
+            raise AccessDeniedError("Workplace is not booked")
+
+        entry_orm = await self.booking_gateway.add_waitlist_entry(entry, user_id)
+        return WaitlistEntryDTO.orm_to_dto(entry_orm).dict()
+
+
+class DeleteWaitlistEntryInteractor:
     def __init__(self, booking_gateway: BookingGateway):
         self.booking_gateway = booking_gateway
 
-    async def __call__(self, booking_id: TgId, user_id: TgId) -> None:
-        await self.booking_gateway.delete_booking(booking_id, user_id)
+    async def __call__(self, entry_id: WaitlistEntryId, user_id: TgId) -> None:
+        await self.booking_gateway.delete_waitlist_entry(entry_id, user_id)
+
+
+class PromotedBookingsInteractor:
+    batch_size = 100
+
+    def __init__(self, redis: Redis):
+        self.redis_storage = RedisStorage(redis)
+
+    async def __call__(self, is_admin: bool) -> List[BookingDTO]:
+        if not is_admin:
+            raise AccessDeniedError
+
+        # уведомления остаются в списке обработки, пока бот не подтвердит доставку
+        promoted = await self.redis_storage.claim_from_list(
+            WAITLIST_NOTIFICATIONS_KEY, WAITLIST_PROCESSING_KEY, self.batch_size
+        )
+        return [json.loads(booking) for booking in promoted]
+
+
+class AckPromotedBookingsInteractor:
+    def __init__(self, redis: Redis):
+        self.redis_storage = RedisStorage(redis)
+
+    async def __call__(self, booking_ids: List[BookingId], is_admin: bool) -> None:
+        if not is_admin:
+            raise AccessDeniedError
+
+        ids = {str(booking_id) for booking_id in booking_ids}
+        delivered = [
+            booking for booking in await self.redis_storage.get_list(WAITLIST_PROCESSING_KEY)
+            if json.loads(booking)["id"] in ids
+        ]
+        await self.redis_storage.remove_from_list(WAITLIST_PROCESSING_KEY, delivered)
 
 
 class ActivateBookingInteractor:
@@ -86,6 +555,19 @@ class PendingBookingsInteractor:
     def __init__(self, booking_gateway: BookingGateway):
         self.booking_gateway = booking_gateway
 
-    async def __call__(self) -> List[BookingDTO]:
-        bookings_orm = await self.booking_gateway.pending_bookings()
-        return [BookingDTO.orm_to_dto(booking).dict() for booking in bookings_orm]
+    async def __call__(self, minutes: ReminderWindowMinutes, is_admin: bool,
+                       since: Optional[NotifiedAt] = None) -> PendingBookingsDTO:
+        if not is_admin:
+            raise AccessDeniedError
+
+        # брони помечаются отправленными при выдаче, поэтому забирать их может только бот
+        bookings_orm = await self.booking_gateway.pending_bookings(window=timedelta(minutes=minutes), since=since)
+        if bookings_orm:
+            since = bookings_orm[-1].notified_at
+        elif since is None:
+            since = datetime.now()
+
+        return PendingBookingsDTO(
+            items=[BookingDTO.orm_to_dto(booking) for booking in bookings_orm],
+            since=since,
+        ).dict()
@@ -1,10 +1,12 @@
-from typing import List
+from datetime import datetime, timedelta
+from typing import List, Dict
 
 from core.exceptions import EntityNotFoundError, AccessDeniedError
+from core.timeline import slots_per_day, occupancy_bitmap, encode_bitmap
 from domain.gateway.coworking import CoworkingGateway
 from domain.dto.coworking import CoworkingDTO, CoworkingCreateDTO, CoworkingUpdateDTO, CoworkingTariffCreateDTO, \
-    CoworkingTariffDTO
-from domain.dto.misc import CoworkingId
+    CoworkingTariffDTO, CoworkingTimelineDTO, WorkplaceTimelineDTO
+from domain.dto.misc import CoworkingId, WorkplaceId, TimelineDate, TimelineSlotMinutes
 
 
 class GetCoworkingInteractor:
@@ -12,11 +14,11 @@ class GetCoworkingInteractor:
         self.coworking_gateway = coworking_gateway
 
     async def __call__(self, coworking_id: CoworkingId) -> CoworkingDTO:
-        coworking_orm = await self.coworking_gateway.get_coworking(coworking_id)
-        if not coworking_orm:
+        coworking = await self.coworking_gateway.get_coworking_json(coworking_id)
+        if coworking is None:
             raise EntityNotFoundError("Coworking")
 
-        return CoworkingDTO.orm_to_dto(coworking_orm).dict()
+        return coworking
 
 
 class ListCoworkingsInteractor:
@@ -24,8 +26,7 @@ class ListCoworkingsInteractor:
         self.coworking_gateway = coworking_gateway
 
     async def __call__(self, offset: int, limit: int) -> List[CoworkingDTO]:
-        coworkings = await self.coworking_gateway.list_coworkings(offset, limit)
-        return [CoworkingDTO.orm_to_dto(coworking).dict() for coworking in coworkings]
+        return await self.coworking_gateway.list_coworkings(offset, limit)
 
 
 class AddCoworkingInteractor:
@@ -80,5 +81,39 @@ class ListCoworkingTariffsInteractor:
         self.coworking_gateway = coworking_gateway
 
     async def __call__(self, coworking_id: CoworkingId) -> List[CoworkingTariffDTO]:
-        tariffs = await self.coworking_gateway.list_tariffs(coworking_id)
-        return [CoworkingTariffDTO.orm_to_dto(tariff).dict() for tariff in tariffs]
+        return await self.coworking_gateway.list_tariffs(coworking_id)
+
+
+class GetCoworkingTimelineInteractor:
+    def __init__(self, coworking_gateway: CoworkingGateway):
+        self.coworking_gateway = coworking_gateway
+
+    async def __call__(self, coworking_id: CoworkingId, date: TimelineDate,
+                       slot_minutes: TimelineSlotMinutes) -> CoworkingTimelineDTO:
+        day_start = datetime.combine(date, datetime.min.time())
+        day_end = day_start + timedelta(days=1)
+        rows = await self.coworking_gateway.list_workplace_occupancy(coworking_id, day_start, day_end)
+        if not rows and not await self.coworking_gateway.get_coworking(coworking_id):
+            raise EntityNotFoundError("Coworking")
+
+        intervals: Dict[WorkplaceId, list] = {}
+        for workplace_id, start_time, end_time in rows:
+            workplace_intervals = intervals.setdefault(workplace_id, [])
+            if start_time is not None:
+                workplace_intervals.append((start_time, end_time))
+
+        slots = slots_per_day(slot_minutes)
+        return CoworkingTimelineDTO(
+            coworking_id=coworking_id,
+            date=date,
+            slot_minutes=slot_minutes,
+            slots=slots,
+            workplaces=[
+                WorkplaceTimelineDTO(
+                    workplace_id=workplace_id,
+                    occupancy=encode_bitmap(occupancy_bitmap(workplace_intervals, day_start, slot_minutes, slots),
+                                            slots),
+                )
+                for workplace_id, workplace_intervals in intervals.items()
+            ],
+        ).dict()
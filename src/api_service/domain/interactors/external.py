@@ -1,26 +1,36 @@
 from typing import List
 
-from core.config import SecurityConfig
-from domain.dto.misc import TgId
+from core.exceptions import AccessDeniedError
+from domain.gateway.user import UserGateway
+from domain.dto.misc import TgId, UserRole
+from infrastructure.database.redis.admins import AdminRegistry
 
 
 class AddTgAdminInteractor:
-    def __init__(self, config: SecurityConfig):
-        self.config = config
+    def __init__(self, admin_registry: AdminRegistry, user_gateway: UserGateway):
+        self.admin_registry = admin_registry
+        self.user_gateway = user_gateway
 
-    async def __call__(self, tg_id: TgId) -> List[int]:
-        if tg_id not in self.config.TG_ADMINS:
-            self.config.TG_ADMINS.append(tg_id)
+    async def __call__(self, tg_id: TgId, is_admin: bool) -> List[int]:
+        if not is_admin:
+            raise AccessDeniedError
 
-        return self.config.TG_ADMINS
+        await self.admin_registry.add(tg_id)
+        await self.user_gateway.update_role(tg_id, UserRole.ADMIN)
+
+        return self.admin_registry.list_admins()
 
 
 class RemoveTgAdminInteractor:
-    def __init__(self, config: SecurityConfig):
-        self.config = config
+    def __init__(self, admin_registry: AdminRegistry, user_gateway: UserGateway):
+        self.admin_registry = admin_registry
+        self.user_gateway = user_gateway
+
+    async def __call__(self, tg_id: TgId, is_admin: bool) -> List[int]:
+        if not is_admin:
+            raise AccessDeniedError
 
-    async def __call__(self, tg_id: TgId) -> List[int]:
-        if tg_id in self.config.TG_ADMINS:
-            self.config.TG_ADMINS.remove(tg_id)
+        await self.admin_registry.remove(tg_id)
+        await self.user_gateway.update_role(tg_id, UserRole.USER)
 
-        return self.config.TG_ADMINS
+        return self.admin_registry.list_admins()
@@ -1,8 +1,9 @@
-from typing import List
+from typing import List, Optional
 
-from core.exceptions import AccessDeniedError
-from domain.gateway import WorkplaceGateway
-from domain.dto.misc import CoworkingId
+from core.exceptions import AccessDeniedError, EntityNotFoundError
+from core.spatial import FloorPlanCache, SpatialGrid
+from domain.gateway import WorkplaceGateway, CoworkingGateway, HoldGateway
+from domain.dto.misc import TgId, CoworkingId, BookingStartTime, BookingEndTime, ClusterSize
 from domain.dto.workplace import WorkplaceUpsertDTO, WorkplaceDTO
 
 
@@ -23,5 +24,54 @@ class ListWorkplacesInteractor:
         self.workplace_gateway = workplace_gateway
 
     async def __call__(self, coworking_id: CoworkingId) -> List[WorkplaceDTO]:
-        workplaces_orm = await self.workplace_gateway.list_workplaces(coworking_id)
-        return [WorkplaceDTO.orm_to_dto(workplace).dict() for workplace in workplaces_orm]
+        return await self.workplace_gateway.list_workplaces_json(coworking_id)
+
+
+class ListAvailableWorkplacesInteractor:
+    def __init__(self, workplace_gateway: WorkplaceGateway, hold_gateway: HoldGateway):
+        self.workplace_gateway = workplace_gateway
+        self.hold_gateway = hold_gateway
+
+    async def __call__(self, coworking_id: CoworkingId, start_time: BookingStartTime, end_time: BookingEndTime,
+                       user_id: TgId, tags: Optional[List[str]] = None) -> List[WorkplaceDTO]:
+        if start_time >= end_time:
+            raise ValueError("start_time must be less than end_time")
+
+        workplaces_orm = await self.workplace_gateway.list_available_workplaces(coworking_id, start_time, end_time, tags)
+        held = await self.hold_gateway.list_held_workplaces([w.id for w in workplaces_orm], start_time, end_time,
+                                                            user_id)
+        return [WorkplaceDTO.orm_to_dto(workplace).dict() for workplace in workplaces_orm if workplace.id not in held]
+
+
+class FindWorkplaceClusterInteractor:
+    def __init__(self, workplace_gateway: WorkplaceGateway, coworking_gateway: CoworkingGateway,
+                 hold_gateway: HoldGateway, floor_plan_cache: FloorPlanCache):
+        self.workplace_gateway = workplace_gateway
+        self.coworking_gateway = coworking_gateway
+        self.hold_gateway = hold_gateway
+        self.floor_plan_cache = floor_plan_cache
+
+    async def __call__(self, coworking_id: CoworkingId, size: ClusterSize, start_time: BookingStartTime,
+                       end_time: BookingEndTime, user_id: TgId,
+                       tags: Optional[List[str]] = None) -> List[WorkplaceDTO]:
+        if start_time >= end_time:
+            raise ValueError("start_time must be less than end_time")
+
+        version = await self.coworking_gateway.get_floor_plan_version(coworking_id)
+        if version is None:
+            raise EntityNotFoundError("Coworking")
+
+        grid = self.floor_plan_cache.get(coworking_id, version)
+        if grid is None:
+            grid = SpatialGrid(await self.workplace_gateway.list_workplace_coordinates(coworking_id))
+            self.floor_plan_cache.put(coworking_id, version, grid)
+
+        available = {
+            workplace.id: workplace
+            for workplace in await self.workplace_gateway.list_available_workplaces(coworking_id, start_time,
+                                                                                    end_time, tags)
+        }
+        held = await self.hold_gateway.list_held_workplaces(list(available), start_time, end_time, user_id)
+
+        cluster = grid.find_cluster(set(available) - held, size)
+        return [WorkplaceDTO.orm_to_dto(available[workplace_id]).dict() for workplace_id in cluster]
@@ -0,0 +1,88 @@
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Awaitable, Callable, List, Optional
+
+from sqlalchemy import Column, DateTime, Integer, String, Table, inspect, insert, select, text
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from infrastructure.database.postgres.base import Base
+from . import (
+    m0001_initial,
+    m0002_hot_path_indexes,
+    m0003_booking_overlap_constraint,
+    m0004_booking_columns,
+    m0005_catalogue_columns,
+    m0006_waitlist_entries,
+    m0007_booking_indexes,
+)
+
+# произвольный ключ advisory-блокировки, общий для всех процессов
+MIGRATIONS_LOCK_KEY = 370001
+
+schema_migrations = Table(
+    "schema_migrations",
+    Base.metadata,
+    Column("version", Integer, primary_key=True),
+    Column("name", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False),
+)
+
+
+@dataclass(frozen=True)
+class Migration:
+    version: int
+    name: str
+    upgrade: Callable[[AsyncConnection], Awaitable[None]]
+
+
+MIGRATIONS: List[Migration] = [
+    Migration(1, "initial", m0001_initial.upgrade),
+    Migration(2, "hot_path_indexes", m0002_hot_path_indexes.upgrade),
+    Migration(3, "booking_overlap_constraint", m0003_booking_overlap_constraint.upgrade),
+    Migration(4, "booking_columns", m0004_booking_columns.upgrade),
+    Migration(5, "catalogue_columns", m0005_catalogue_columns.upgrade),
+    Migration(6, "waitlist_entries", m0006_waitlist_entries.upgrade),
+    Migration(7, "booking_indexes", m0007_booking_indexes.upgrade),
+]
+HEAD = MIGRATIONS[-1].version
+
+
+async def current_version(conn: AsyncConnection) -> int:
+    if not await conn.run_sync(lambda sync_conn: inspect(sync_conn).has_table(schema_migrations.name)):
+        return 0
+
+    version = await conn.scalar(select(schema_migrations.c.version).order_by(schema_migrations.c.version.desc()))
+    return version or 0
+
+
+async def migrate(engine: AsyncEngine, target: Optional[int] = None) -> List[Migration]:
+    applied = []
+    async with engine.begin() as conn:
+        # несколько процессов, запущенных одновременно, применяют миграции по очереди
+        await conn.execute(text("SELECT pg_advisory_xact_lock(:key)"), {"key": MIGRATIONS_LOCK_KEY})
+        await conn.run_sync(schema_migrations.create, checkfirst=True)
+
+        version = await current_version(conn)
+        for migration in MIGRATIONS:
+            if migration.version <= version or (target is not None and migration.version > target):
+                continue
+
+            await migration.upgrade(conn)
+            await conn.execute(
+                insert(schema_migrations).values(
+                    version=migration.version,
+                    name=migration.name,
+                    applied_at=datetime.now(),
+                )
+            )
+            applied.append(migration)
+
+    return applied
+
+
+async def verify_schema(engine: AsyncEngine) -> None:
+    async with engine.connect() as conn:
+        version = await current_version(conn)
+
+    if version != HEAD:
+        raise RuntimeError(f"Database schema is at version {version}, expected {HEAD}. Run migrations first")
@@ -0,0 +1,29 @@
+import argparse
+import asyncio
+from typing import Optional
+
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from core.config import PostgresConfig
+from infrastructure.database.postgres.session import database_uri
+from . import HEAD, current_version, migrate
+
+
+async def main(command: str, target: Optional[int] = None) -> None:
+    engine = create_async_engine(database_uri(PostgresConfig()))
+    try:
+        if command == "upgrade":
+            for migration in await migrate(engine, target):
+                print(f"Applied {migration.version:04d}_{migration.name}")
+        async with engine.connect() as conn:
+            print(f"Current version: {await current_version(conn)} (head: {HEAD})")
+    finally:
+        await engine.dispose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(prog="python -m infrastructure.database.postgres.migrations")
+    parser.add_argument("command", choices=["upgrade", "current"])
+    parser.add_argument("--target", type=int, default=None)
+    args = parser.parse_args()
+    asyncio.run(main(args.command, args.target))
@@ -0,0 +1,100 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# базовая схема в том виде, в каком её создавал create_all при старте до появления миграций;
+# на уже развёрнутых базах все объекты существуют, поэтому миграция для них ничего не меняет
+STATEMENTS = [
+    """
+    DO $$ BEGIN
+        CREATE TYPE userrole AS ENUM ('USER', 'ADMIN');
+    EXCEPTION WHEN duplicate_object THEN NULL;
+    END $$
+    """,
+    """
+    DO $$ BEGIN
+        CREATE TYPE workplacestatus AS ENUM ('FREE', 'BOOKED', 'INACTIVE');
+    EXCEPTION WHEN duplicate_object THEN NULL;
+    END $$
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS coworkings (
+        id UUID NOT NULL,
+        name VARCHAR NOT NULL,
+        address VARCHAR NOT NULL,
+        photo_url VARCHAR NOT NULL,
+        cover_url VARCHAR NOT NULL,
+        description VARCHAR,
+        created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        PRIMARY KEY (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id BIGSERIAL NOT NULL,
+        first_name VARCHAR NOT NULL,
+        last_name VARCHAR,
+        username VARCHAR NOT NULL,
+        photo_url VARCHAR,
+        balance INTEGER NOT NULL,
+        role userrole NOT NULL,
+        created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        PRIMARY KEY (id),
+        UNIQUE (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS bookings (
+        id UUID NOT NULL,
+        user_id BIGINT NOT NULL,
+        start_time TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        end_time TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        total_price INTEGER NOT NULL,
+        created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS coworking_tariffs (
+        id UUID NOT NULL,
+        coworking_id UUID NOT NULL,
+        name VARCHAR NOT NULL,
+        color VARCHAR NOT NULL,
+        price_per_hour INTEGER NOT NULL,
+        created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY (coworking_id) REFERENCES coworkings (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS workplaces (
+        id UUID NOT NULL,
+        coworking_id UUID NOT NULL,
+        tariff_id UUID NOT NULL,
+        number INTEGER NOT NULL,
+        name VARCHAR NOT NULL,
+        status workplacestatus NOT NULL,
+        tags VARCHAR[],
+        x_cor FLOAT NOT NULL,
+        y_cor FLOAT NOT NULL,
+        created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY (coworking_id) REFERENCES coworkings (id),
+        FOREIGN KEY (tariff_id) REFERENCES coworking_tariffs (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS booking_workplaces (
+        booking_id UUID NOT NULL,
+        workplace_id UUID NOT NULL,
+        PRIMARY KEY (booking_id, workplace_id),
+        FOREIGN KEY (booking_id) REFERENCES bookings (id),
+        FOREIGN KEY (workplace_id) REFERENCES workplaces (id)
+    )
+    """,
+]
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    for statement in STATEMENTS:
+        await conn.execute(text(statement))
@@ -0,0 +1,13 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_booking_workplaces_workplace_id ON booking_workplaces (workplace_id)",
+    "CREATE INDEX IF NOT EXISTS ix_workplaces_coworking_id ON workplaces (coworking_id)",
+    "CREATE INDEX IF NOT EXISTS ix_coworking_tariffs_coworking_id_name ON coworking_tariffs (coworking_id, name)",
+]
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    for index in INDEXES:
+        await conn.execute(text(index))
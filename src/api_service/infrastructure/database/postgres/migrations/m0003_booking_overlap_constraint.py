@@ -0,0 +1,50 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+# пересечения броней одного места запрещает сама база
+STATEMENTS = [
+    "CREATE EXTENSION IF NOT EXISTS btree_gist",
+    "ALTER TABLE booking_workplaces ADD COLUMN IF NOT EXISTS period TSRANGE",
+    """
+    UPDATE booking_workplaces
+    SET period = tsrange(bookings.start_time, bookings.end_time)
+    FROM bookings
+    WHERE bookings.id = booking_workplaces.booking_id AND booking_workplaces.period IS NULL
+    """,
+    "ALTER TABLE booking_workplaces ALTER COLUMN period SET NOT NULL",
+    """
+    ALTER TABLE booking_workplaces
+        DROP CONSTRAINT IF EXISTS booking_workplaces_booking_id_fkey,
+        ADD CONSTRAINT booking_workplaces_booking_id_fkey
+            FOREIGN KEY (booking_id) REFERENCES bookings (id) ON DELETE CASCADE
+    """,
+]
+
+# до ограничения пересекающиеся брони могли создаваться гонкой; какую из них оставить, решает администратор
+OVERLAPPING_BOOKINGS = """
+SELECT DISTINCT earlier.booking_id, later.booking_id
+FROM booking_workplaces AS earlier
+JOIN booking_workplaces AS later
+    ON later.workplace_id = earlier.workplace_id
+    AND later.booking_id > earlier.booking_id
+    AND later.period && earlier.period
+ORDER BY 1, 2
+"""
+
+NO_OVERLAP_CONSTRAINT = """
+ALTER TABLE booking_workplaces
+    DROP CONSTRAINT IF EXISTS booking_workplaces_no_overlap,
+    ADD CONSTRAINT booking_workplaces_no_overlap EXCLUDE USING gist (workplace_id WITH =, period WITH &&)
+"""
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    for statement in STATEMENTS:
+        await conn.execute(text(statement))
+
+    overlapping = (await conn.execute(text(OVERLAPPING_BOOKINGS))).all()
+    if overlapping:
+        pairs = ", ".join(f"{first} and {second}" for first, second in overlapping)
+        raise RuntimeError(f"Bookings overlap on the same workplace, cancel one of each pair and rerun: {pairs}")
+
+    await conn.execute(text(NO_OVERLAP_CONSTRAINT))
@@ -0,0 +1,60 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+STATEMENTS = [
+    # отметка об отправленном напоминании
+    "ALTER TABLE bookings ADD COLUMN IF NOT EXISTS notified_at TIMESTAMP WITHOUT TIME ZONE",
+    # повторяющиеся серии броней
+    """
+    CREATE TABLE IF NOT EXISTS booking_series (
+        id UUID NOT NULL,
+        user_id BIGINT NOT NULL,
+        workplace_ids UUID[] NOT NULL,
+        start_time TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        end_time TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        weekdays INTEGER[] NOT NULL,
+        interval INTEGER NOT NULL,
+        until TIMESTAMP WITHOUT TIME ZONE,
+        count INTEGER,
+        created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE
+    )
+    """,
+    """
+    ALTER TABLE bookings ADD COLUMN IF NOT EXISTS series_id UUID
+        REFERENCES booking_series (id) ON DELETE SET NULL
+    """,
+    # копия coworking_id мест брони; у старых броней берётся из их мест
+    """
+    ALTER TABLE bookings ADD COLUMN IF NOT EXISTS coworking_id UUID
+        REFERENCES coworkings (id) ON DELETE RESTRICT
+    """,
+    """
+    UPDATE bookings
+    SET coworking_id = (
+        SELECT workplaces.coworking_id
+        FROM booking_workplaces
+        JOIN workplaces ON workplaces.id = booking_workplaces.workplace_id
+        WHERE booking_workplaces.booking_id = bookings.id
+        ORDER BY workplaces.coworking_id
+        LIMIT 1
+    )
+    WHERE coworking_id IS NULL
+    """,
+]
+
+# брони без мест базовая схема допускала; коворкинг для них не определить
+ORPHAN_BOOKINGS = "SELECT id FROM bookings WHERE coworking_id IS NULL ORDER BY id"
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    for statement in STATEMENTS:
+        await conn.execute(text(statement))
+
+    orphans = (await conn.scalars(text(ORPHAN_BOOKINGS))).all()
+    if orphans:
+        booking_ids = ", ".join(str(booking_id) for booking_id in orphans)
+        raise RuntimeError(f"Bookings have no workplaces, delete them and rerun: {booking_ids}")
+
+    await conn.execute(text("ALTER TABLE bookings ALTER COLUMN coworking_id SET NOT NULL"))
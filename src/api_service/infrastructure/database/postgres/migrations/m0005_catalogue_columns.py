@@ -0,0 +1,12 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+STATEMENTS = [
+    "ALTER TABLE coworking_tariffs ADD COLUMN IF NOT EXISTS pricing_rules JSONB",
+    "ALTER TABLE coworkings ADD COLUMN IF NOT EXISTS floor_plan_version INTEGER NOT NULL DEFAULT 1",
+]
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    for statement in STATEMENTS:
+        await conn.execute(text(statement))
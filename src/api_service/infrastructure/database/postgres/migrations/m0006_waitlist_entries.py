@@ -0,0 +1,24 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+STATEMENTS = [
+    """
+    CREATE TABLE IF NOT EXISTS waitlist_entries (
+        id UUID NOT NULL,
+        user_id BIGINT NOT NULL,
+        workplace_id UUID NOT NULL,
+        start_time TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        end_time TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        period TSRANGE NOT NULL,
+        created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE,
+        FOREIGN KEY (workplace_id) REFERENCES workplaces (id) ON DELETE CASCADE
+    )
+    """,
+]
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    for statement in STATEMENTS:
+        await conn.execute(text(statement))
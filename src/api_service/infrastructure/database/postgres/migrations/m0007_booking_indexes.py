@@ -0,0 +1,19 @@
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+INDEXES = [
+    "CREATE INDEX IF NOT EXISTS ix_bookings_start_time_id ON bookings (start_time, id)",
+    "CREATE INDEX IF NOT EXISTS ix_bookings_user_id_start_time_id ON bookings (user_id, start_time, id)",
+    "CREATE INDEX IF NOT EXISTS ix_bookings_coworking_id_start_time_id ON bookings (coworking_id, start_time, id)",
+    "CREATE INDEX IF NOT EXISTS ix_bookings_end_time ON bookings (end_time)",
+    "CREATE INDEX IF NOT EXISTS ix_bookings_notified_at ON bookings (notified_at)",
+    "CREATE INDEX IF NOT EXISTS ix_bookings_start_time_not_notified ON bookings (start_time) WHERE notified_at IS NULL",
+    "CREATE INDEX IF NOT EXISTS ix_bookings_series_id ON bookings (series_id)",
+    "CREATE INDEX IF NOT EXISTS ix_waitlist_entries_workplace_id_period "
+    "ON waitlist_entries USING gist (workplace_id, period)",
+]
+
+
+async def upgrade(conn: AsyncConnection) -> None:
+    for index in INDEXES:
+        await conn.execute(text(index))
@@ -12,9 +12,15 @@ from sqlalchemy import (
     ForeignKey,
     Table,
     Column,
+    Index,
+    DDL,
+    event,
+    case,
+    func,
+    text,
 )
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.dialects.postgresql import UUID, ARRAY
+from sqlalchemy.dialects.postgresql import UUID, ARRAY, JSONB, TSRANGE, ExcludeConstraint
 from sqlalchemy.ext.mutable import MutableList
 from sqlalchemy.orm import mapped_column, relationship, Mapped
 
@@ -24,10 +30,21 @@ from domain.dto.misc import UserRole, WorkplaceStatus, BookingStatus
 booking_workplaces = Table(
     "booking_workplaces",
     Base.metadata,
-    Column("booking_id", UUID(as_uuid=True), ForeignKey("bookings.id"), primary_key=True),
+    Column("booking_id", UUID(as_uuid=True), ForeignKey("bookings.id", ondelete="CASCADE"), primary_key=True),
     Column("workplace_id", UUID(as_uuid=True), ForeignKey("workplaces.id"), primary_key=True),
+    Column("period", TSRANGE, nullable=False),
+    ExcludeConstraint(
+        ("workplace_id", "="),
+        ("period", "&&"),
+        name="booking_workplaces_no_overlap",
+        using="gist",
+    ),
+    Index("ix_booking_workplaces_workplace_id", "workplace_id"),
 )
 
+btree_gist = DDL("CREATE EXTENSION IF NOT EXISTS btree_gist")
+event.listen(booking_workplaces, "before_create", btree_gist)
+
 
 class UserORM(Base):
     __tablename__ = 'users'
@@ -54,6 +71,7 @@ class CoworkingORM(Base):
     photo_url: Mapped[str] = mapped_column(String, nullable=False)
     cover_url: Mapped[str] = mapped_column(String, nullable=False)
     description: Mapped[Optional[str]] = mapped_column(String, nullable=True)
+    floor_plan_version: Mapped[int] = mapped_column(Integer, nullable=False, default=1, server_default="1")
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now)
 
     tariffs: Mapped[List['CoworkingTariffORM']] = relationship("CoworkingTariffORM", back_populates="coworking",
@@ -64,12 +82,16 @@ class CoworkingORM(Base):
 
 class CoworkingTariffORM(Base):
     __tablename__ = 'coworking_tariffs'
+    __table_args__ = (
+        Index("ix_coworking_tariffs_coworking_id_name", "coworking_id", "name"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, nullable=False, default=uuid.uuid4)
     coworking_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("coworkings.id"), nullable=False)
     name: Mapped[str] = mapped_column(String, nullable=False)
     color: Mapped[str] = mapped_column(String, nullable=False)
     price_per_hour: Mapped[int] = mapped_column(Integer, nullable=False)
+    pricing_rules: Mapped[Optional[dict]] = mapped_column(JSONB, nullable=True)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now)
 
     coworking: Mapped['CoworkingORM'] = relationship("CoworkingORM", back_populates="tariffs")
@@ -78,6 +100,9 @@ class CoworkingTariffORM(Base):
 
 class WorkplaceORM(Base):
     __tablename__ = 'workplaces'
+    __table_args__ = (
+        Index("ix_workplaces_coworking_id", "coworking_id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, nullable=False, default=uuid.uuid4)
     coworking_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("coworkings.id"), nullable=False)
@@ -93,22 +118,56 @@ class WorkplaceORM(Base):
     tariff: Mapped['CoworkingTariffORM'] = relationship("CoworkingTariffORM", back_populates="workplaces")
     coworking: Mapped['CoworkingORM'] = relationship("CoworkingORM", back_populates="workplaces")
     bookings: Mapped[List['BookingORM']] = relationship("BookingORM", secondary=booking_workplaces,
-                                                        back_populates="workplaces")
+                                                        back_populates="workplaces", viewonly=True)
+
+
+class BookingSeriesORM(Base):
+    __tablename__ = 'booking_series'
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, nullable=False, default=uuid.uuid4)
+    user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    workplace_ids: Mapped[List[uuid.UUID]] = mapped_column(ARRAY(UUID(as_uuid=True)), nullable=False)
+    start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    end_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    weekdays: Mapped[List[int]] = mapped_column(ARRAY(Integer), nullable=False)
+    interval: Mapped[int] = mapped_column(Integer, nullable=False, default=1)
+    until: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now)
+
+    bookings: Mapped[List['BookingORM']] = relationship("BookingORM", back_populates="series", viewonly=True)
 
 
 class BookingORM(Base):
     __tablename__ = 'bookings'
+    __table_args__ = (
+        Index("ix_bookings_start_time_id", "start_time", "id"),
+        Index("ix_bookings_user_id_start_time_id", "user_id", "start_time", "id"),
+        Index("ix_bookings_end_time", "end_time"),
+        Index("ix_bookings_notified_at", "notified_at"),
+        Index("ix_bookings_start_time_not_notified", "start_time", postgresql_where=text("notified_at IS NULL")),
+        Index("ix_bookings_series_id", "series_id"),
+        Index("ix_bookings_coworking_id_start_time_id", "coworking_id", "start_time", "id"),
+    )
 
     id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, nullable=False, default=uuid.uuid4)
     user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.id"), nullable=False)
+    # копия coworking_id мест брони, чтобы календарь коворкинга читался по индексу без join
+    coworking_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("coworkings.id", ondelete="RESTRICT"),
+                                                    nullable=False)
     start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now)
     end_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
     total_price: Mapped[int] = mapped_column(Integer, nullable=False)
     created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now)
+    notified_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    series_id: Mapped[Optional[uuid.UUID]] = mapped_column(UUID(as_uuid=True),
+                                                           ForeignKey("booking_series.id", ondelete="SET NULL"),
+                                                           nullable=True)
 
     user: Mapped['UserORM'] = relationship("UserORM", back_populates="bookings")
+    series: Mapped[Optional['BookingSeriesORM']] = relationship("BookingSeriesORM", back_populates="bookings")
     workplaces: Mapped[List['WorkplaceORM']] = relationship("WorkplaceORM", secondary=booking_workplaces,
-                                                            back_populates="bookings")
+                                                            back_populates="bookings", viewonly=True)
 
     @hybrid_property
     def status(self) -> BookingStatus:
@@ -118,3 +177,34 @@ class BookingORM(Base):
             return BookingStatus.FINISHED
         else:
             return BookingStatus.PROCESSING
+
+    @status.inplace.expression
+    @classmethod
+    def _status_expression(cls):
+        now = func.localtimestamp()
+        return case(
+            (cls.start_time - timedelta(minutes=5) > now, BookingStatus.WAITING.value),
+            (cls.end_time < now, BookingStatus.FINISHED.value),
+            else_=BookingStatus.PROCESSING.value,
+        )
+
+
+class WaitlistEntryORM(Base):
+    __tablename__ = 'waitlist_entries'
+    __table_args__ = (
+        Index("ix_waitlist_entries_workplace_id_period", "workplace_id", "period", postgresql_using="gist"),
+    )
+
+    id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), primary_key=True, nullable=False, default=uuid.uuid4)
+    user_id: Mapped[int] = mapped_column(BigInteger, ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
+    workplace_id: Mapped[uuid.UUID] = mapped_column(UUID(as_uuid=True), ForeignKey("workplaces.id", ondelete="CASCADE"),
+                                                    nullable=False)
+    start_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    end_time: Mapped[datetime] = mapped_column(DateTime, nullable=False)
+    period = mapped_column(TSRANGE, nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime, nullable=False, default=datetime.now)
+
+    workplace: Mapped['WorkplaceORM'] = relationship("WorkplaceORM")
+
+
+event.listen(WaitlistEntryORM.__table__, "before_create", btree_gist)
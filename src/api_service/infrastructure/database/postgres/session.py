@@ -2,14 +2,30 @@ from collections.abc import AsyncIterable
 
 from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, create_async_engine
 
-from .base import Base
+from core.config import PostgresConfig
+from core.utils import is_valid_postgres_uri
+from .migrations import verify_schema
+
+
+def database_uri(config: PostgresConfig) -> str:
+    DB_URI = config.POSTGRES_DSN.replace("postgresql://", "postgresql+asyncpg://")
+    if not is_valid_postgres_uri(config.POSTGRES_DSN):
+        host = config.POSTGRES_HOST
+        port = config.POSTGRES_PORT
+        username = config.POSTGRES_USERNAME
+        password = config.POSTGRES_PASSWORD
+        db_name = config.POSTGRES_DATABASE
+
+        DB_URI = f"postgresql+asyncpg://{username}:{password}@{host}:{port}/{db_name}"
+
+    return DB_URI
 
 
 async def create_engine(DB_URI: str) -> AsyncIterable[AsyncSession]:
     engine = create_async_engine(url=DB_URI, echo=False, future=True)
 
-    async with engine.begin() as conn:
-        await conn.run_sync(Base.metadata.create_all)
+    # схему создают миграции, при старте только проверяем её версию
+    await verify_schema(engine)
 
     yield engine
     await engine.dispose()
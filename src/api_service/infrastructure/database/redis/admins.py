@@ -0,0 +1,58 @@
+from typing import Iterable, List, Set
+
+from redis.asyncio import Redis
+
+from domain.dto.misc import TgId
+from .bus import EventBus, TG_ADMIN_ADDED, TG_ADMIN_REMOVED, RESYNC
+
+ADMINS_KEY = "admins:tg"
+
+
+class AdminRegistry:
+    def __init__(self, redis: Redis, bus: EventBus, bootstrap: Iterable[int] = ()):
+        self.redis = redis
+        self.bus = bus
+        self.bootstrap = list(bootstrap)
+        self.admins: Set[int] = set()
+        self.generation = 0
+
+        # список хранится в Redis, а каждый воркер держит его копию и обновляет её по событиям
+        bus.subscribe(TG_ADMIN_ADDED, lambda payload: self._apply(payload["tg_id"], True))
+        bus.subscribe(TG_ADMIN_REMOVED, lambda payload: self._apply(payload["tg_id"], False))
+        bus.subscribe(RESYNC, lambda payload: self.load())
+
+    async def load(self) -> None:
+        # TG_ADMINS из конфига — только начальный список для пустого реестра
+        if self.bootstrap and not await self.redis.exists(ADMINS_KEY):
+            await self.redis.sadd(ADMINS_KEY, *self.bootstrap)
+
+        while True:
+            generation = self.generation
+            members = await self.redis.smembers(ADMINS_KEY)
+            # пока шёл запрос, могли прийти события — тогда перечитываем
+            if generation == self.generation:
+                self.admins = {int(tg_id) for tg_id in members}
+                return
+
+    def is_admin(self, tg_id: TgId) -> bool:
+        return tg_id in self.admins
+
+    def list_admins(self) -> List[int]:
+        return sorted(self.admins)
+
+    async def add(self, tg_id: TgId) -> None:
+        await self.redis.sadd(ADMINS_KEY, tg_id)
+        self._apply(tg_id, True)
+        await self.bus.publish(TG_ADMIN_ADDED, {"tg_id": tg_id})
+
+    async def remove(self, tg_id: TgId) -> None:
+        await self.redis.srem(ADMINS_KEY, tg_id)
+        self._apply(tg_id, False)
+        await self.bus.publish(TG_ADMIN_REMOVED, {"tg_id": tg_id})
+
+    def _apply(self, tg_id: TgId, is_admin: bool) -> None:
+        self.generation += 1
+        if is_admin:
+            self.admins.add(tg_id)
+        else:
+            self.admins.discard(tg_id)
@@ -0,0 +1,69 @@
+import asyncio
+import inspect
+import json
+import logging
+import uuid
+from typing import Any, Callable, Dict, List
+
+from redis.asyncio import Redis
+from redis.exceptions import ConnectionError, TimeoutError
+
+logger = logging.getLogger(__name__)
+
+EVENTS_CHANNEL = "events:invalidation"
+
+CATALOGUE_INVALIDATED = "catalogue.invalidated"
+TG_ADMIN_ADDED = "tg_admin.added"
+TG_ADMIN_REMOVED = "tg_admin.removed"
+TOKEN_REVOKED = "token.revoked"
+# рассылается локально после (пере)подписки: пока подписки не было, события могли потеряться
+RESYNC = "resync"
+
+Handler = Callable[[dict], Any]
+
+
+class EventBus:
+    def __init__(self, redis: Redis, channel: str = EVENTS_CHANNEL, retry_delay: float = 1.0):
+        self.redis = redis
+        self.channel = channel
+        self.retry_delay = retry_delay
+        self.origin = uuid.uuid4().hex
+        self.handlers: Dict[str, List[Handler]] = {}
+
+    def subscribe(self, event: str, handler: Handler) -> None:
+        self.handlers.setdefault(event, []).append(handler)
+
+    async def publish(self, event: str, payload: dict) -> None:
+        # свой воркер уже применил изменение, остальные получат его из канала
+        message = {"origin": self.origin, "event": event, "payload": payload}
+        await self.redis.publish(self.channel, json.dumps(message))
+
+    async def listen(self) -> None:
+        while True:
+            try:
+                async with self.redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    await self.dispatch(RESYNC, {})
+                    async for message in pubsub.listen():
+                        await self.handle(message)
+            except (ConnectionError, TimeoutError):
+                logger.warning("Event bus connection lost, resubscribing in %s s", self.retry_delay)
+                await asyncio.sleep(self.retry_delay)
+
+    async def handle(self, message: dict) -> None:
+        # битое сообщение не должно останавливать подписку
+        try:
+            event = json.loads(message["data"])
+            if event["origin"] != self.origin:
+                await self.dispatch(event["event"], event["payload"])
+        except Exception:
+            logger.exception("Event bus failed to handle message %r", message.get("data"))
+
+    async def dispatch(self, event: str, payload: dict) -> None:
+        for handler in self.handlers.get(event, []):
+            try:
+                result = handler(payload)
+                if inspect.isawaitable(result):
+                    await result
+            except Exception:
+                logger.exception("Event bus handler failed for %s", event)
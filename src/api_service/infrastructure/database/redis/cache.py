@@ -0,0 +1,145 @@
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Iterable, Optional, Tuple
+
+from prometheus_client import Counter
+from redis.asyncio import Redis
+
+from domain.dto.misc import CoworkingId
+from .bus import EventBus, CATALOGUE_INVALIDATED, RESYNC
+
+CATALOGUE_CACHE_REQUESTS = Counter(
+    "catalogue_cache_requests_total",
+    "Обращения к кэшу каталога коворкингов",
+    ["level", "result"],
+    registry=None,
+)
+
+MISSING = object()
+
+# пишет значение в L2, только если ключ не инвалидировали с момента чтения версии
+SET_IF_VERSION_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '0') ~= ARGV[1] then
+    return 0
+end
+redis.call('HSET', KEYS[1], ARGV[2], ARGV[3])
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return 1
+"""
+
+
+def coworkings_key() -> str:
+    return "catalogue:coworkings"
+
+
+def coworking_key(coworking_id: CoworkingId) -> str:
+    return f"catalogue:coworking:{coworking_id}"
+
+
+def tariffs_key(coworking_id: CoworkingId) -> str:
+    return f"catalogue:tariffs:{coworking_id}"
+
+
+def workplaces_key(coworking_id: CoworkingId) -> str:
+    return f"catalogue:workplaces:{coworking_id}"
+
+
+def version_key(key: str) -> str:
+    return f"{key}:version"
+
+
+class LocalCache:
+    def __init__(self, max_size: int = 1024, ttl: float = 600.0):
+        self.max_size = max_size
+        self.ttl = ttl
+        self.entries: "OrderedDict[Tuple[str, str], Tuple[float, Any]]" = OrderedDict()
+        self.generation = 0
+
+    def get(self, key: str, field: str) -> Any:
+        cached = self.entries.get((key, field))
+        if cached is None:
+            return MISSING
+
+        expires_at, value = cached
+        if expires_at <= time.monotonic():
+            del self.entries[(key, field)]
+            return MISSING
+
+        self.entries.move_to_end((key, field))
+        return value
+
+    def put(self, key: str, field: str, value: Any) -> None:
+        self.entries[(key, field)] = (time.monotonic() + self.ttl, value)
+        self.entries.move_to_end((key, field))
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def invalidate(self, key: str) -> None:
+        self.generation += 1
+        for entry in [entry for entry in self.entries if entry[0] == key]:
+            del self.entries[entry]
+
+    def clear(self) -> None:
+        self.generation += 1
+        self.entries.clear()
+
+
+class CatalogueCache:
+    def __init__(self, redis: Redis, bus: EventBus, local: Optional[LocalCache] = None, ttl: int = 3600):
+        self.redis = redis
+        self.bus = bus
+        self.local = local or LocalCache()
+        self.ttl = ttl
+        self.set_if_version_script = redis.register_script(SET_IF_VERSION_SCRIPT)
+
+        # L1 соседних воркеров сбрасывается через шину событий
+        bus.subscribe(CATALOGUE_INVALIDATED, lambda payload: self._invalidate_local(payload["keys"]))
+        bus.subscribe(RESYNC, lambda payload: self.local.clear())
+
+    async def get_or_load(self, key: str, field: str, load: Callable[[], Awaitable[Any]]) -> Any:
+        value = self.local.get(key, field)
+        if value is not MISSING:
+            CATALOGUE_CACHE_REQUESTS.labels("l1", "hit").inc()
+            return value
+        CATALOGUE_CACHE_REQUESTS.labels("l1", "miss").inc()
+
+        generation = self.local.generation
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hget(key, field)
+            pipe.get(version_key(key))
+            stored, version = await pipe.execute()
+
+        if stored is not None:
+            CATALOGUE_CACHE_REQUESTS.labels("l2", "hit").inc()
+            value = json.loads(stored)
+        else:
+            CATALOGUE_CACHE_REQUESTS.labels("l2", "miss").inc()
+            # None тоже кладётся в кэш, чтобы повторные 404 не ходили в Postgres
+            value = await load()
+            # за время чтения любой воркер мог инвалидировать ключ, тогда прочитанное значение уже устарело
+            if not await self.set_if_version_script(
+                keys=[key, version_key(key)],
+                args=[version or "0", field, json.dumps(value), self.ttl],
+            ):
+                return value
+
+        if self.local.generation == generation:
+            self.local.put(key, field, value)
+        return value
+
+    async def invalidate(self, *keys: str) -> None:
+        if not keys:
+            return
+
+        self._invalidate_local(keys)
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.delete(*keys)
+            for key in keys:
+                pipe.incr(version_key(key))
+            await pipe.execute()
+        await self.bus.publish(CATALOGUE_INVALIDATED, {"keys": list(keys)})
+
+    def _invalidate_local(self, keys: Iterable[str]) -> None:
+        for key in keys:
+            self.local.invalidate(key)
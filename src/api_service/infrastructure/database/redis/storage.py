@@ -2,10 +2,42 @@ from typing import Any, List
 
 from redis.asyncio import Redis
 
+# возвращает уже сохранённое значение или сохраняет переданное — за один запрос к Redis
+GET_OR_SET_SCRIPT = """
+local existing = redis.call('GET', KEYS[1])
+if existing then
+    return existing
+end
+redis.call('SET', KEYS[1], ARGV[1], 'EX', ARGV[2])
+return ARGV[1]
+"""
+
+# удаляет ключ, только если в нём лежит переданное значение
+DELETE_IF_EQUALS_SCRIPT = """
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+"""
+
+# переносит элементы в список обработки и возвращает всё, что там ещё не подтверждено
+CLAIM_FROM_LIST_SCRIPT = """
+local count = tonumber(ARGV[1])
+for _ = redis.call('LLEN', KEYS[2]) + 1, count do
+    if not redis.call('LMOVE', KEYS[1], KEYS[2], 'LEFT', 'RIGHT') then
+        break
+    end
+end
+return redis.call('LRANGE', KEYS[2], 0, count - 1)
+"""
+
 
 class RedisStorage:
     def __init__(self, redis: Redis):
         self.redis = redis
+        self.get_or_set_script = redis.register_script(GET_OR_SET_SCRIPT)
+        self.delete_if_equals_script = redis.register_script(DELETE_IF_EQUALS_SCRIPT)
+        self.claim_from_list_script = redis.register_script(CLAIM_FROM_LIST_SCRIPT)
 
     async def set(self, key: str, value: str, ex=None) -> None:
         await self.redis.set(key, value, ex=ex)
@@ -13,8 +45,29 @@ class RedisStorage:
     async def get(self, key: str, default=None) -> Any:
         return await self.redis.get(key) or default
 
+    async def get_or_set(self, key: str, value: str, ex: int) -> str:
+        return await self.get_or_set_script(keys=[key], args=[value, ex])
+
+    async def set_if_absent(self, key: str, value: str, ex=None) -> bool:
+        return bool(await self.redis.set(key, value, ex=ex, nx=True))
+
+    async def delete(self, key: str) -> None:
+        await self.redis.delete(key)
+
+    async def delete_if_equals(self, key: str, value: str) -> bool:
+        return bool(await self.delete_if_equals_script(keys=[key], args=[value]))
+
     async def add_to_list(self, key: str, value: str) -> None:
         await self.redis.rpush(key, value)
 
     async def get_list(self, key: str) -> List[str]:
         return await self.redis.lrange(key, 0, -1)
+
+    async def claim_from_list(self, key: str, processing_key: str, count: int) -> List[str]:
+        return await self.claim_from_list_script(keys=[key, processing_key], args=[count])
+
+    async def remove_from_list(self, key: str, values: List[str]) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for value in values:
+                pipe.lrem(key, 1, value)
+            await pipe.execute()
@@ -1,5 +1,6 @@
 from .user import UserRepository
-from .coworking import CoworkingRepository
-from .workplace import WorkplaceRepository
+from .coworking import CoworkingRepository, CachedCoworkingRepository
+from .workplace import WorkplaceRepository, CachedWorkplaceRepository
 from .booking import BookingRepository
 from .stats import StatsRepository
+from .hold import HoldRepository
@@ -1,15 +1,119 @@
-from typing import List
-from datetime import timedelta
+import uuid
+from typing import Dict, List, Optional, Tuple, AsyncIterator
+from datetime import datetime, timedelta
 
-from sqlalchemy import select, and_
+from sqlalchemy import (
+    ColumnElement,
+    Row,
+    Select,
+    Integer,
+    DateTime,
+    select,
+    update,
+    delete,
+    and_,
+    func,
+    true,
+    exists,
+    tuple_,
+    values,
+    column,
+)
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.orm import selectinload
+from sqlalchemy.orm.attributes import set_committed_value
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import UUID, Range, insert
 
 from core.exceptions import EntityNotFoundError, AccessDeniedError
-from domain.dto.booking import BookingCreateDTO, BookingUpdateDTO
-from domain.dto.misc import TgId, BookingId, BookingStatus, CoworkingId
+from core.pricing import quote_price
+from domain.dto.booking import (
+    BookingCreateDTO,
+    BookingUpdateDTO,
+    BookingFilterDTO,
+    BookingSeriesCreateDTO,
+    WaitlistEntryCreateDTO,
+)
+from domain.dto.misc import (
+    TgId,
+    BookingId,
+    BookingStatus,
+    BulkBookingStatus,
+    CoworkingId,
+    SeriesId,
+    WaitlistEntryId,
+)
 from domain.gateway.booking import BookingGateway
-from infrastructure.database.postgres.models import CoworkingORM, WorkplaceORM, BookingORM, booking_workplaces
+from infrastructure.database.postgres.models import (
+    CoworkingORM,
+    WorkplaceORM,
+    BookingORM,
+    BookingSeriesORM,
+    WaitlistEntryORM,
+    booking_workplaces,
+)
+from .projections import booking_json
+
+EXCLUSION_VIOLATION = "23P01"
+
+
+def is_booking_conflict(exc: IntegrityError) -> bool:
+    return getattr(exc.orig, "sqlstate", None) == EXCLUSION_VIOLATION
+
+
+def with_workplaces(query: Select) -> Select:
+    return query.options(selectinload(BookingORM.workplaces).selectinload(WorkplaceORM.tariff))
+
+
+def status_clause(status: BookingStatus, now: datetime) -> ColumnElement[bool]:
+    # те же границы, что и в BookingORM.status, но в виде диапазонов по индексируемым колонкам
+    starts_at = now + timedelta(minutes=5)
+    if status == BookingStatus.WAITING:
+        return BookingORM.start_time > starts_at
+    if status == BookingStatus.FINISHED:
+        return and_(BookingORM.start_time <= starts_at, BookingORM.end_time < now)
+    return and_(BookingORM.start_time <= starts_at, BookingORM.end_time >= now)
+
+
+def apply_filters(query: Select, filters: Optional[BookingFilterDTO]) -> Select:
+    if filters is None:
+        return query
+
+    if filters.status is not None:
+        query = query.where(status_clause(filters.status, datetime.now()))
+    if filters.start_time is not None:
+        query = query.where(BookingORM.end_time > filters.start_time)
+    if filters.end_time is not None:
+        query = query.where(BookingORM.start_time < filters.end_time)
+
+    return query
+
+
+def overlaps(first: BookingCreateDTO, second: BookingCreateDTO) -> bool:
+    return first.start_time < second.end_time and second.start_time < first.end_time
+
+
+def booking_coworking(workplaces: List[WorkplaceORM]) -> uuid.UUID:
+    coworking_ids = {w.coworking_id for w in workplaces}
+    if len(coworking_ids) > 1:
+        raise ValueError("Workplaces must belong to one coworking")
+    return coworking_ids.pop()
+
+
+def booking_price(workplaces: List[WorkplaceORM], start_time: datetime, end_time: datetime) -> int:
+    return quote_price([(w.tariff.price_per_hour, w.tariff.pricing_rules) for w in workplaces], start_time, end_time)
+
+
+def booking_rows() -> Select:
+    # колонки ключа страницы и готовый JSON брони
+    return select(BookingORM.start_time, BookingORM.id, booking_json().label("data"))
+
+
+def keyset_page(query: Select, limit: int, after: Optional[Tuple[datetime, uuid.UUID]]) -> Select:
+    if after is not None:
+        query = query.where(tuple_(BookingORM.start_time, BookingORM.id) > tuple_(*after))
+
+    return query.order_by(BookingORM.start_time, BookingORM.id).limit(limit)
 
 
 class BookingRepository(BookingGateway):
@@ -17,7 +121,7 @@ class BookingRepository(BookingGateway):
         self.db_session = db_session
 
     async def get_booking(self, booking_id: BookingId) -> BookingORM:
-        query = select(BookingORM).options(selectinload(BookingORM.workplaces)).where(BookingORM.id == booking_id)
+        query = with_workplaces(select(BookingORM)).where(BookingORM.id == booking_id)
         result = await self.db_session.execute(query)
         booking = result.scalars().one_or_none()
         if not booking:
@@ -25,37 +129,64 @@ class BookingRepository(BookingGateway):
 
         return booking
 
-    async def list_user_bookings(self, tg_id: TgId) -> List[BookingORM]:
-        query = select(BookingORM).options(selectinload(BookingORM.workplaces)).where(BookingORM.user_id == tg_id)
-        result = await self.db_session.execute(query)
-        bookings = result.scalars().all()
+    async def list_user_bookings(self, tg_id: TgId, limit: int,
+                                 after: Optional[Tuple[datetime, uuid.UUID]] = None,
+                                 filters: Optional[BookingFilterDTO] = None) -> List[Row]:
+        query = booking_rows().where(BookingORM.user_id == tg_id)
+        result = await self.db_session.execute(keyset_page(apply_filters(query, filters), limit, after))
+        return result.all()
 
-        return bookings
-
-    async def list_coworking_bookings(self, coworking_id: CoworkingId) -> List[BookingORM]:
+    async def list_coworking_bookings(self, coworking_id: CoworkingId, limit: int,
+                                      after: Optional[Tuple[datetime, uuid.UUID]] = None,
+                                      filters: Optional[BookingFilterDTO] = None) -> List[Row]:
         coworking_query = select(CoworkingORM).where(CoworkingORM.id == coworking_id)
         coworking_result = await self.db_session.execute(coworking_query)
         coworking = coworking_result.scalars().one_or_none()
         if not coworking:
             raise EntityNotFoundError("Coworking")
 
+        query = booking_rows().where(BookingORM.coworking_id == coworking_id)
+        result = await self.db_session.execute(keyset_page(apply_filters(query, filters), limit, after))
+        return result.all()
+
+    async def list_all_bookings(self, limit: int,
+                                after: Optional[Tuple[datetime, uuid.UUID]] = None,
+                                filters: Optional[BookingFilterDTO] = None) -> List[Row]:
+        result = await self.db_session.execute(keyset_page(apply_filters(booking_rows(), filters), limit, after))
+        return result.all()
+
+    async def stream_bookings(self) -> AsyncIterator[Row]:
+        workplace_ids = (
+            select(func.array_agg(booking_workplaces.c.workplace_id))
+            .where(booking_workplaces.c.booking_id == BookingORM.id)
+            .scalar_subquery()
+        )
         query = (
-            select(BookingORM)
-            .options(selectinload(BookingORM.workplaces).selectinload(WorkplaceORM.tariff))
-            .join(booking_workplaces)
-            .join(WorkplaceORM)
-            .where(WorkplaceORM.coworking_id == coworking_id)
+            select(
+                BookingORM.id,
+                BookingORM.user_id,
+                workplace_ids.label("workplaces"),
+                BookingORM.start_time,
+                BookingORM.end_time,
+                BookingORM.status.label("status"),
+                BookingORM.total_price,
+                BookingORM.created_at,
+            )
+            .order_by(BookingORM.start_time, BookingORM.id)
+            .execution_options(yield_per=1000)
         )
-        result = await self.db_session.execute(query)
-        bookings = result.scalars().all()
-        return bookings
+        result = await self.db_session.stream(query)
+        async for row in result:
+            yield row
 
-    async def list_all_bookings(self) -> List[BookingORM]:
-        query = select(BookingORM).options(selectinload(BookingORM.workplaces))
-        result = await self.db_session.execute(query)
-        bookings = result.scalars().all()
-
-        return bookings
+    async def is_booked(self, workplaces: List[uuid.UUID], start_time: datetime, end_time: datetime) -> bool:
+        query = select(
+            exists().where(
+                booking_workplaces.c.workplace_id.in_(workplaces),
+                booking_workplaces.c.period.overlaps(func.tsrange(start_time, end_time)),
+            )
+        )
+        return await self.db_session.scalar(query)
 
     async def add_booking(self, booking: BookingCreateDTO, user_id: TgId) -> BookingORM:
         query = (
@@ -66,42 +197,269 @@ class BookingRepository(BookingGateway):
         result = await self.db_session.execute(query)
         workplaces = result.scalars().all()
 
-        if not workplaces:
+        # бронь создаётся только целиком: без части мест она была бы дешевле и не той, что просили
+        if len(workplaces) != len(set(booking.workplaces)):
             raise EntityNotFoundError("Workplaces")
 
-        conflict_query = (
-            select(BookingORM)
-            .join(booking_workplaces)
-            .where(
-                booking_workplaces.c.workplace_id.in_(booking.workplaces),
-                BookingORM.start_time < booking.end_time,
-                BookingORM.end_time > booking.start_time,
+        new_booking = BookingORM(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            coworking_id=booking_coworking(workplaces),
+            start_time=booking.start_time,
+            end_time=booking.end_time,
+            total_price=booking_price(workplaces, booking.start_time, booking.end_time),
+            created_at=datetime.now(),
+        )
+
+        # бронь и её места вставляются одним запросом, пересечения отсекает exclusion constraint
+        booking_cte = (
+            insert(BookingORM)
+            .values(
+                id=new_booking.id,
+                user_id=new_booking.user_id,
+                coworking_id=new_booking.coworking_id,
+                start_time=new_booking.start_time,
+                end_time=new_booking.end_time,
+                total_price=new_booking.total_price,
+                created_at=new_booking.created_at,
             )
+            .returning(BookingORM.id)
+            .cte("new_booking")
+        )
+        query = insert(booking_workplaces).from_select(
+            ["booking_id", "workplace_id", "period"],
+            select(
+                booking_cte.c.id,
+                WorkplaceORM.id,
+                func.tsrange(booking.start_time, booking.end_time),
+            )
+            .select_from(booking_cte.join(WorkplaceORM, true()))
+            .where(WorkplaceORM.id.in_([w.id for w in workplaces])),
         )
-        conflict_result = await self.db_session.execute(conflict_query)
-        conflict = conflict_result.scalars().one_or_none()
-        if conflict:
-            raise AccessDeniedError("Workplace is already booked")
 
-        duration_hours = (booking.end_time - booking.start_time).total_seconds() / 3600
-        total_price = sum(w.tariff.price_per_hour * duration_hours for w in workplaces)
+        try:
+            await self.db_session.execute(query)
+            await self.db_session.commit()
+        except IntegrityError as exc:
+            await self.db_session.rollback()
+            if is_booking_conflict(exc):
+                raise AccessDeniedError("Workplace is already booked")
+            raise
 
-        new_booking = BookingORM(
+        set_committed_value(new_booking, "workplaces", list(workplaces))
+        return new_booking
+
+    async def add_bookings(self, bookings: List[BookingCreateDTO], user_id: TgId,
+                           atomic: bool) -> List[Tuple[BulkBookingStatus, Optional[BookingORM]]]:
+        return await self._add_bookings_retrying(bookings, user_id, atomic)
+
+    async def add_booking_series(self, series: BookingSeriesCreateDTO, bookings: List[BookingCreateDTO],
+                                 user_id: TgId) -> BookingSeriesORM:
+        series_orm = BookingSeriesORM(
+            id=uuid.uuid4(),
             user_id=user_id,
-            start_time=booking.start_time,
-            end_time=booking.end_time,
-            total_price=total_price,
+            workplace_ids=series.workplaces,
+            start_time=series.start_time,
+            end_time=series.end_time,
+            weekdays=series.weekdays,
+            interval=series.interval,
+            until=series.until,
+            count=series.count,
+            created_at=datetime.now(),
+        )
+        outcomes = await self._add_bookings_retrying(bookings, user_id, atomic=True, series=series_orm)
+
+        for booking, (status, _) in zip(bookings, outcomes):
+            if status == BulkBookingStatus.NOT_FOUND:
+                raise EntityNotFoundError("Workplaces")
+            if status == BulkBookingStatus.CONFLICT:
+                raise AccessDeniedError(f"Workplace is already booked on {booking.start_time.date()}")
+
+        set_committed_value(series_orm, "bookings", [booking_orm for _, booking_orm in outcomes])
+        return series_orm
+
+    async def delete_booking_series(self, series_id: SeriesId, user_id: TgId) -> None:
+        query = select(BookingSeriesORM).where(
+            BookingSeriesORM.id == series_id,
+            BookingSeriesORM.user_id == user_id,
         )
-        new_booking.workplaces = workplaces
+        result = await self.db_session.execute(query)
+        series_orm = result.scalars().one_or_none()
+        if not series_orm:
+            raise EntityNotFoundError("Series")
 
-        self.db_session.add(new_booking)
+        # прошедшие брони остаются в истории, будущие снимаются вместе с серией
+        await self.db_session.execute(
+            delete(BookingORM).where(
+                BookingORM.series_id == series_id,
+                BookingORM.start_time > datetime.now(),
+            )
+        )
+        await self.db_session.delete(series_orm)
         await self.db_session.commit()
 
-        return new_booking
+    async def _add_bookings_retrying(self, bookings: List[BookingCreateDTO], user_id: TgId, atomic: bool,
+                                     series: Optional[BookingSeriesORM] = None
+                                     ) -> List[Tuple[BulkBookingStatus, Optional[BookingORM]]]:
+        try:
+            return await self._add_bookings(bookings, user_id, atomic, series)
+        except IntegrityError as exc:
+            await self.db_session.rollback()
+            if not is_booking_conflict(exc):
+                raise
+
+        # параллельная бронь успела занять место между проверкой и вставкой — пересчитываем один раз;
+        # без atomic каждый элемент вставляется в своём savepoint и новая гонка отменяет только его
+        try:
+            return await self._add_bookings(bookings, user_id, atomic, series, per_item=not atomic)
+        except IntegrityError as exc:
+            await self.db_session.rollback()
+            if is_booking_conflict(exc):
+                raise AccessDeniedError("Workplace is already booked")
+            raise
+
+    async def _add_bookings(self, bookings: List[BookingCreateDTO], user_id: TgId, atomic: bool,
+                            series: Optional[BookingSeriesORM] = None, per_item: bool = False
+                            ) -> List[Tuple[BulkBookingStatus, Optional[BookingORM]]]:
+        query = (
+            select(WorkplaceORM)
+            .options(selectinload(WorkplaceORM.tariff))
+            .where(WorkplaceORM.id.in_({w for booking in bookings for w in booking.workplaces}))
+        )
+        result = await self.db_session.execute(query)
+        workplaces = {w.id: w for w in result.scalars().all()}
+
+        statuses = [
+            BulkBookingStatus.CREATED
+            if booking.workplaces and all(w in workplaces for w in booking.workplaces)
+            else BulkBookingStatus.NOT_FOUND
+            for booking in bookings
+        ]
+        for idx in await self._find_conflicts(bookings, statuses):
+            statuses[idx] = BulkBookingStatus.CONFLICT
+
+        # пересечения внутри самого запроса: выигрывает более ранний элемент
+        accepted = {}
+        for idx, booking in enumerate(bookings):
+            if statuses[idx] != BulkBookingStatus.CREATED:
+                continue
+            if any(overlaps(booking, other) for w in booking.workplaces for other in accepted.get(w, [])):
+                statuses[idx] = BulkBookingStatus.CONFLICT
+                continue
+            for w in booking.workplaces:
+                accepted.setdefault(w, []).append(booking)
+
+        if atomic and any(status != BulkBookingStatus.CREATED for status in statuses):
+            return [
+                (BulkBookingStatus.SKIPPED if status == BulkBookingStatus.CREATED else status, None)
+                for status in statuses
+            ]
+
+        now = datetime.now()
+        new_bookings = {}
+        for idx, booking in enumerate(bookings):
+            if statuses[idx] != BulkBookingStatus.CREATED:
+                continue
+            booking_workplaces_orm = [workplaces[w] for w in booking.workplaces]
+            new_bookings[idx] = BookingORM(
+                id=uuid.uuid4(),
+                user_id=user_id,
+                coworking_id=booking_coworking(booking_workplaces_orm),
+                start_time=booking.start_time,
+                end_time=booking.end_time,
+                total_price=booking_price(booking_workplaces_orm, booking.start_time, booking.end_time),
+                created_at=now,
+                series_id=series.id if series is not None else None,
+            )
+
+        if new_bookings:
+            if series is not None:
+                self.db_session.add(series)
+                await self.db_session.flush()
+            if per_item:
+                for idx, new_booking in list(new_bookings.items()):
+                    try:
+                        async with self.db_session.begin_nested():
+                            await self._insert_bookings({idx: new_booking}, bookings)
+                    except IntegrityError as exc:
+                        if not is_booking_conflict(exc):
+                            raise
+                        statuses[idx] = BulkBookingStatus.CONFLICT
+                        del new_bookings[idx]
+            else:
+                await self._insert_bookings(new_bookings, bookings)
+            await self.db_session.commit()
+
+        outcomes = []
+        for idx, status in enumerate(statuses):
+            new_booking = new_bookings.get(idx)
+            if new_booking is not None:
+                set_committed_value(new_booking, "workplaces", [workplaces[w] for w in bookings[idx].workplaces])
+            outcomes.append((status, new_booking))
+
+        return outcomes
+
+    async def _insert_bookings(self, new_bookings: Dict[int, BookingORM], bookings: List[BookingCreateDTO]) -> None:
+        await self.db_session.execute(
+            insert(BookingORM).values([
+                {
+                    "id": booking.id,
+                    "user_id": booking.user_id,
+                    "coworking_id": booking.coworking_id,
+                    "start_time": booking.start_time,
+                    "end_time": booking.end_time,
+                    "total_price": booking.total_price,
+                    "created_at": booking.created_at,
+                    "series_id": booking.series_id,
+                }
+                for booking in new_bookings.values()
+            ])
+        )
+        await self.db_session.execute(
+            insert(booking_workplaces).values([
+                {
+                    "booking_id": booking.id,
+                    "workplace_id": w,
+                    "period": func.tsrange(booking.start_time, booking.end_time),
+                }
+                for idx, booking in new_bookings.items()
+                for w in bookings[idx].workplaces
+            ])
+        )
+
+    async def _find_conflicts(self, bookings: List[BookingCreateDTO], statuses: List[BulkBookingStatus]) -> List[int]:
+        rows = [
+            (idx, w, booking.start_time, booking.end_time)
+            for idx, booking in enumerate(bookings)
+            if statuses[idx] == BulkBookingStatus.CREATED
+            for w in booking.workplaces
+        ]
+        if not rows:
+            return []
+
+        requested = values(
+            column("idx", Integer),
+            column("workplace_id", UUID(as_uuid=True)),
+            column("start_time", DateTime),
+            column("end_time", DateTime),
+            name="requested",
+        ).data(rows)
+        query = (
+            select(requested.c.idx)
+            .distinct()
+            .where(
+                exists().where(
+                    booking_workplaces.c.workplace_id == requested.c.workplace_id,
+                    booking_workplaces.c.period.overlaps(func.tsrange(requested.c.start_time, requested.c.end_time)),
+                )
+            )
+        )
+        result = await self.db_session.execute(query)
+        return result.scalars().all()
 
     async def update_booking(self, booking: BookingUpdateDTO, booking_id: BookingId, user_id: TgId) -> BookingORM:
         query = (
-            select(BookingORM)
+            with_workplaces(select(BookingORM))
             .where(
                 and_(
                     BookingORM.id == booking_id,
@@ -122,17 +480,29 @@ class BookingRepository(BookingGateway):
         if booking.end_time is not None:
             booking_orm.end_time = booking.end_time
 
-        duration_hours = (booking.end_time - booking.start_time).total_seconds() / 3600
-        booking_orm.total_price = sum(w.tariff.price_per_hour * duration_hours for w in booking_orm.workplaces)
+        booking_orm.total_price = booking_price(booking_orm.workplaces, booking_orm.start_time, booking_orm.end_time)
 
-        await self.db_session.commit()
-        await self.db_session.refresh(booking_orm)
+        period_query = (
+            update(booking_workplaces)
+            .where(booking_workplaces.c.booking_id == booking_orm.id)
+            .values(period=func.tsrange(booking_orm.start_time, booking_orm.end_time))
+        )
+
+        try:
+            await self.db_session.flush()
+            await self.db_session.execute(period_query)
+            await self.db_session.commit()
+        except IntegrityError as exc:
+            await self.db_session.rollback()
+            if is_booking_conflict(exc):
+                raise AccessDeniedError("Workplace is already booked")
+            raise
 
         return booking_orm
 
-    async def delete_booking(self, booking_id: BookingId, user_id: TgId) -> None:
+    async def delete_booking(self, booking_id: BookingId, user_id: TgId) -> List[BookingORM]:
         query = (
-            select(BookingORM)
+            with_workplaces(select(BookingORM))
             .where(
                 and_(
                     BookingORM.id == booking_id,
@@ -145,8 +515,103 @@ class BookingRepository(BookingGateway):
         if not booking_orm:
             raise EntityNotFoundError("Booking")
 
+        workplaces = [w.id for w in booking_orm.workplaces]
         await self.db_session.delete(booking_orm)
+        await self.db_session.flush()
+
+        # освободившиеся места отдаются ожидающим в той же транзакции, что и отмена
+        promoted = await self._promote_waitlist(workplaces, booking_orm.start_time, booking_orm.end_time)
         await self.db_session.commit()
+        return promoted
+
+    async def add_waitlist_entry(self, entry: WaitlistEntryCreateDTO, user_id: TgId) -> WaitlistEntryORM:
+        workplace = await self.db_session.get(WorkplaceORM, entry.workplace_id)
+        if not workplace:
+            raise EntityNotFoundError("Workplace")
+
+        entry_orm = WaitlistEntryORM(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            workplace_id=entry.workplace_id,
+            start_time=entry.start_time,
+            end_time=entry.end_time,
+            period=Range(entry.start_time, entry.end_time),
+            created_at=datetime.now(),
+        )
+        self.db_session.add(entry_orm)
+        await self.db_session.commit()
+        return entry_orm
+
+    async def delete_waitlist_entry(self, entry_id: WaitlistEntryId, user_id: TgId) -> None:
+        query = delete(WaitlistEntryORM).where(
+            WaitlistEntryORM.id == entry_id,
+            WaitlistEntryORM.user_id == user_id,
+        )
+        result = await self.db_session.execute(query)
+        if not result.rowcount:
+            raise EntityNotFoundError("Waitlist entry")
+
+        await self.db_session.commit()
+
+    async def _promote_waitlist(self, workplaces: List[uuid.UUID], start_time: datetime,
+                                end_time: datetime) -> List[BookingORM]:
+        now = datetime.now()
+        query = (
+            select(WaitlistEntryORM)
+            .options(selectinload(WaitlistEntryORM.workplace).selectinload(WorkplaceORM.tariff))
+            .where(
+                WaitlistEntryORM.workplace_id.in_(workplaces),
+                WaitlistEntryORM.period.overlaps(func.tsrange(start_time, end_time)),
+                WaitlistEntryORM.start_time > now,
+            )
+            .order_by(WaitlistEntryORM.created_at, WaitlistEntryORM.id)
+            .with_for_update(of=WaitlistEntryORM, skip_locked=True)
+        )
+        result = await self.db_session.execute(query)
+
+        promoted = []
+        for entry in result.scalars().all():
+            new_booking = BookingORM(
+                id=uuid.uuid4(),
+                user_id=entry.user_id,
+                coworking_id=entry.workplace.coworking_id,
+                start_time=entry.start_time,
+                end_time=entry.end_time,
+                total_price=booking_price([entry.workplace], entry.start_time, entry.end_time),
+                created_at=now,
+            )
+
+            # каждый ожидающий в своём savepoint: если его слот всё ещё занят, переходим к следующему
+            try:
+                async with self.db_session.begin_nested():
+                    await self.db_session.execute(
+                        insert(BookingORM).values(
+                            id=new_booking.id,
+                            user_id=new_booking.user_id,
+                            coworking_id=new_booking.coworking_id,
+                            start_time=new_booking.start_time,
+                            end_time=new_booking.end_time,
+                            total_price=new_booking.total_price,
+                            created_at=new_booking.created_at,
+                        )
+                    )
+                    await self.db_session.execute(
+                        insert(booking_workplaces).values(
+                            booking_id=new_booking.id,
+                            workplace_id=entry.workplace_id,
+                            period=func.tsrange(entry.start_time, entry.end_time),
+                        )
+                    )
+            except IntegrityError as exc:
+                if is_booking_conflict(exc):
+                    continue
+                raise
+
+            await self.db_session.delete(entry)
+            set_committed_value(new_booking, "workplaces", [entry.workplace])
+            promoted.append(new_booking)
+
+        return promoted
 
     async def activate_booking(self, booking_id: BookingId, user_id: TgId) -> None:
         query = select(BookingORM).where(
@@ -160,11 +625,34 @@ class BookingRepository(BookingGateway):
         if not booking:
             raise EntityNotFoundError("Booking")
 
-        if BookingORM.status != BookingStatus.PROCESSING:
+        if booking.status != BookingStatus.PROCESSING:
             raise AccessDeniedError
 
-    async def pending_bookings(self) -> List[BookingORM]:
-        # остался час до начала
-        query = select(BookingORM).where(BookingORM.start_time - timedelta(seconds=3600) < BookingORM.end_time)
+    async def pending_bookings(self, window: timedelta, since: Optional[datetime] = None) -> List[BookingORM]:
+        # помечаем брони, до начала которых осталось меньше window, и отдаём всё, что помечено после since
+        now = datetime.now()
+        claim_query = (
+            update(BookingORM)
+            .where(
+                BookingORM.notified_at.is_(None),
+                BookingORM.start_time > now,
+                BookingORM.start_time <= now + window,
+            )
+            .values(notified_at=now)
+            .returning(BookingORM)
+            .options(selectinload(BookingORM.workplaces).selectinload(WorkplaceORM.tariff))
+        )
+        claimed = (await self.db_session.execute(claim_query)).scalars().all()
+        await self.db_session.commit()
+
+        if since is None:
+            # помеченные этим запросом брони приходят сразу из RETURNING
+            return sorted(claimed, key=lambda booking: (booking.start_time, booking.id))
+
+        query = (
+            with_workplaces(select(BookingORM))
+            .where(BookingORM.notified_at > since)
+            .order_by(BookingORM.notified_at, BookingORM.start_time, BookingORM.id)
+        )
         result = await self.db_session.execute(query)
         return result.scalars().all()
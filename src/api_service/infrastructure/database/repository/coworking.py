@@ -1,18 +1,34 @@
-from typing import Optional, List
+from datetime import datetime
+from functools import partial
+from typing import Optional, List, Tuple
 
-from sqlalchemy import select, update
+from sqlalchemy import JSON, select, update, and_, func, exists
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import insert
 
-from core.exceptions import EntityNotFoundError
+from core.exceptions import ConflictError, EntityNotFoundError
 from domain.gateway.coworking import CoworkingGateway
 from domain.dto.coworking import (
     CoworkingCreateDTO,
     CoworkingUpdateDTO,
     CoworkingTariffCreateDTO,
 )
-from domain.dto.misc import CoworkingId
-from infrastructure.database.postgres.models import CoworkingORM, CoworkingTariffORM
+from domain.dto.misc import CoworkingId, WorkplaceId
+from infrastructure.database.postgres.models import (
+    BookingORM,
+    CoworkingORM,
+    CoworkingTariffORM,
+    WorkplaceORM,
+    booking_workplaces,
+)
+from infrastructure.database.redis.cache import (
+    CatalogueCache,
+    coworkings_key,
+    coworking_key,
+    tariffs_key,
+    workplaces_key,
+)
+from .projections import coworking_json, tariff_json
 
 
 class CoworkingRepository(CoworkingGateway):
@@ -24,8 +40,16 @@ class CoworkingRepository(CoworkingGateway):
         result = await self.db_session.execute(query)
         return result.scalars().one_or_none()
 
-    async def list_coworkings(self, offset: int, limit: int) -> List[CoworkingORM]:
-        query = select(CoworkingORM).offset(offset).limit(limit)
+    async def get_coworking_json(self, coworking_id: CoworkingId) -> Optional[dict]:
+        query = select(coworking_json()).where(CoworkingORM.id == coworking_id)
+        return await self.db_session.scalar(query)
+
+    async def get_floor_plan_version(self, coworking_id: CoworkingId) -> Optional[int]:
+        query = select(CoworkingORM.floor_plan_version).where(CoworkingORM.id == coworking_id)
+        return await self.db_session.scalar(query)
+
+    async def list_coworkings(self, offset: int, limit: int) -> List[dict]:
+        query = select(coworking_json()).offset(offset).limit(limit)
         result = await self.db_session.execute(query)
         return result.scalars().all()
 
@@ -64,6 +88,10 @@ class CoworkingRepository(CoworkingGateway):
         if not coworking_orm:
             raise EntityNotFoundError("Coworking")
 
+        # история броней не удаляется вместе с коворкингом
+        if await self.db_session.scalar(select(exists().where(BookingORM.coworking_id == coworking_id))):
+            raise ConflictError("Coworking has bookings")
+
         await self.db_session.delete(coworking_orm)
         await self.db_session.commit()
 
@@ -106,7 +134,70 @@ class CoworkingRepository(CoworkingGateway):
         await self.db_session.commit()
         return result_rows
 
-    async def list_tariffs(self, coworking_id: CoworkingId) -> List[CoworkingTariffORM]:
-        query = select(CoworkingTariffORM).where(CoworkingTariffORM.coworking_id == coworking_id)
+    async def list_tariffs(self, coworking_id: CoworkingId) -> List[dict]:
+        query = select(func.json_strip_nulls(tariff_json(), type_=JSON)).where(
+            CoworkingTariffORM.coworking_id == coworking_id)
         result = await self.db_session.execute(query)
         return result.scalars().all()
+
+    async def list_workplace_occupancy(self, coworking_id: CoworkingId, start_time: datetime,
+                                       end_time: datetime) -> List[Tuple[WorkplaceId, Optional[datetime], Optional[datetime]]]:
+        query = (
+            select(
+                WorkplaceORM.id,
+                func.lower(booking_workplaces.c.period),
+                func.upper(booking_workplaces.c.period),
+            )
+            .outerjoin(
+                booking_workplaces,
+                and_(
+                    booking_workplaces.c.workplace_id == WorkplaceORM.id,
+                    booking_workplaces.c.period.overlaps(func.tsrange(start_time, end_time)),
+                ),
+            )
+            .where(WorkplaceORM.coworking_id == coworking_id)
+            .order_by(WorkplaceORM.number)
+        )
+        result = await self.db_session.execute(query)
+        return result.all()
+
+
+class CachedCoworkingRepository(CoworkingRepository):
+    def __init__(self, db_session: AsyncSession, cache: CatalogueCache):
+        super().__init__(db_session)
+        self.cache = cache
+
+    async def get_coworking_json(self, coworking_id: CoworkingId) -> Optional[dict]:
+        return await self.cache.get_or_load(
+            coworking_key(coworking_id), "", partial(super().get_coworking_json, coworking_id))
+
+    async def list_coworkings(self, offset: int, limit: int) -> List[dict]:
+        return await self.cache.get_or_load(
+            coworkings_key(), f"{offset}:{limit}", partial(super().list_coworkings, offset, limit))
+
+    async def list_tariffs(self, coworking_id: CoworkingId) -> List[dict]:
+        return await self.cache.get_or_load(
+            tariffs_key(coworking_id), "", partial(super().list_tariffs, coworking_id))
+
+    async def add_coworking(self, coworking: CoworkingCreateDTO) -> CoworkingORM:
+        coworking_orm = await super().add_coworking(coworking)
+        await self.cache.invalidate(coworkings_key(), coworking_key(coworking_orm.id))
+        return coworking_orm
+
+    async def update_coworking(self, coworking: CoworkingUpdateDTO, coworking_id: CoworkingId) -> CoworkingORM:
+        coworking_orm = await super().update_coworking(coworking, coworking_id)
+        await self.cache.invalidate(coworkings_key(), coworking_key(coworking_id))
+        return coworking_orm
+
+    async def delete_coworking(self, coworking_id):
+        await super().delete_coworking(coworking_id)
+        await self.cache.invalidate(coworkings_key(), coworking_key(coworking_id), tariffs_key(coworking_id),
+                                    workplaces_key(coworking_id))
+
+    async def add_tariffs(self, tariffs: List[CoworkingTariffCreateDTO]) -> List[CoworkingTariffORM]:
+        tariffs_orm = await super().add_tariffs(tariffs)
+        # места отдаются вместе с тарифом, поэтому их списки тоже устаревают
+        coworking_ids = {tariff.coworking_id for tariff in tariffs}
+        await self.cache.invalidate(*(key for coworking_id in coworking_ids
+                                      for key in (tariffs_key(coworking_id), workplaces_key(coworking_id))))
+        return tariffs_orm
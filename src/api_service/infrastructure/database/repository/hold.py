@@ -0,0 +1,141 @@
+import json
+import uuid
+from datetime import datetime, timedelta
+from typing import List, Set, Tuple
+
+from redis.asyncio import Redis
+
+from core.exceptions import EntityNotFoundError, AccessDeniedError
+from domain.dto.booking import HoldDTO
+from domain.dto.misc import TgId, HoldId
+from domain.gateway.hold import HoldGateway
+
+# проверка пересечений и постановка холда на все места одной атомарной операцией
+ADD_HOLD_SCRIPT = """
+local now, expires_at, member, user_id = ARGV[1], ARGV[2], ARGV[3], ARGV[4]
+local start_ts, end_ts = tonumber(ARGV[5]), tonumber(ARGV[6])
+for _, key in ipairs(KEYS) do
+    redis.call('ZREMRANGEBYSCORE', key, '-inf', now)
+    for _, held in ipairs(redis.call('ZRANGE', key, 0, -1)) do
+        local _, held_user, held_start, held_end = string.match(held, '([^|]+)|([^|]+)|([^|]+)|([^|]+)')
+        if held_user ~= user_id and tonumber(held_start) < end_ts and tonumber(held_end) > start_ts then
+            return 0
+        end
+    end
+end
+for _, key in ipairs(KEYS) do
+    redis.call('ZADD', key, expires_at, member)
+    redis.call('EXPIREAT', key, math.ceil(tonumber(expires_at)))
+end
+return 1
+"""
+
+
+def workplace_key(workplace_id: uuid.UUID) -> str:
+    return f"holds:workplace:{workplace_id}"
+
+
+def hold_key(hold_id: uuid.UUID) -> str:
+    return f"holds:hold:{hold_id}"
+
+
+def parse_member(member: str) -> Tuple[str, int, float, float]:
+    hold_id, user_id, start_ts, end_ts = member.split("|")
+    return hold_id, int(user_id), float(start_ts), float(end_ts)
+
+
+class HoldRepository(HoldGateway):
+    def __init__(self, redis: Redis):
+        self.redis = redis
+        self.add_hold_script = redis.register_script(ADD_HOLD_SCRIPT)
+
+    async def add_hold(self, user_id: TgId, workplaces: List[uuid.UUID], start_time: datetime, end_time: datetime,
+                       ttl: int) -> HoldDTO:
+        now = datetime.now()
+        hold = HoldDTO(
+            id=uuid.uuid4(),
+            user_id=user_id,
+            workplaces=workplaces,
+            start_time=start_time,
+            end_time=end_time,
+            expires_at=now + timedelta(seconds=ttl),
+        )
+        member = f"{hold.id}|{user_id}|{start_time.timestamp()}|{end_time.timestamp()}"
+
+        added = await self.add_hold_script(
+            keys=[workplace_key(workplace_id) for workplace_id in workplaces],
+            args=[now.timestamp(), hold.expires_at.timestamp(), member, user_id,
+                  start_time.timestamp(), end_time.timestamp()],
+        )
+        if not added:
+            raise AccessDeniedError("Workplace is held by another user")
+
+        await self.redis.set(hold_key(hold.id), json.dumps({"member": member, **hold.dict()}), ex=ttl)
+        return hold
+
+    async def delete_hold(self, hold_id: HoldId, user_id: TgId) -> None:
+        stored = await self.redis.get(hold_key(hold_id))
+        if not stored:
+            raise EntityNotFoundError("Hold")
+
+        hold = json.loads(stored)
+        if hold["user_id"] != user_id:
+            raise EntityNotFoundError("Hold")
+
+        await self._remove_holds([hold])
+
+    async def list_held_workplaces(self, workplaces: List[uuid.UUID], start_time: datetime, end_time: datetime,
+                                   user_id: TgId) -> Set[uuid.UUID]:
+        held_periods = await self.list_held_periods(workplaces, start_time, end_time, user_id)
+        return {workplace_id for workplace_id, _, _ in held_periods}
+
+    async def list_held_periods(self, workplaces: List[uuid.UUID], start_time: datetime, end_time: datetime,
+                                user_id: TgId) -> List[Tuple[uuid.UUID, datetime, datetime]]:
+        held_periods = []
+        for workplace_id, _, held_user, member in await self._overlapping(workplaces, start_time, end_time):
+            if held_user != user_id:
+                _, _, start_ts, end_ts = parse_member(member)
+                held_periods.append((workplace_id, datetime.fromtimestamp(start_ts), datetime.fromtimestamp(end_ts)))
+
+        return held_periods
+
+    async def release_holds(self, user_id: TgId, workplaces: List[uuid.UUID], start_time: datetime,
+                            end_time: datetime) -> None:
+        hold_ids = {
+            hold_id
+            for _, hold_id, held_user, _ in await self._overlapping(workplaces, start_time, end_time)
+            if held_user == user_id
+        }
+        if not hold_ids:
+            return
+
+        stored = await self.redis.mget([hold_key(hold_id) for hold_id in hold_ids])
+        await self._remove_holds([json.loads(hold) for hold in stored if hold])
+
+    async def _overlapping(self, workplaces: List[uuid.UUID], start_time: datetime,
+                           end_time: datetime) -> List[Tuple[uuid.UUID, str, int, str]]:
+        if not workplaces:
+            return []
+
+        now = datetime.now().timestamp()
+        async with self.redis.pipeline(transaction=False) as pipe:
+            for workplace_id in workplaces:
+                pipe.zrangebyscore(workplace_key(workplace_id), now, "+inf")
+            results = await pipe.execute()
+
+        overlapping = []
+        for workplace_id, members in zip(workplaces, results):
+            for member in members:
+                hold_id, held_user, start_ts, end_ts = parse_member(member)
+                if start_ts < end_time.timestamp() and end_ts > start_time.timestamp():
+                    overlapping.append((workplace_id, hold_id, held_user, member))
+
+        return overlapping
+
+    async def _remove_holds(self, holds: List[dict]) -> None:
+        async with self.redis.pipeline(transaction=True) as pipe:
+            for hold in holds:
+                for workplace_id in hold["workplaces"]:
+                    pipe.zrem(workplace_key(workplace_id), hold["member"])
+                pipe.delete(hold_key(hold["id"]))
+            await pipe.execute()
@@ -0,0 +1,83 @@
+from sqlalchemy import JSON, ColumnElement, case, func, literal, select
+
+from infrastructure.database.postgres.models import (
+    CoworkingORM,
+    CoworkingTariffORM,
+    WorkplaceORM,
+    BookingORM,
+    booking_workplaces,
+)
+
+# JSON собирается в Postgres в том же виде, что отдают DTO, и уходит в ответ без ORM и валидации
+
+
+def iso_timestamp(column) -> ColumnElement:
+    # как у pydantic: микросекунды выводятся, только если они есть
+    return func.to_char(column, 'YYYY-MM-DD"T"HH24:MI:SS') + case(
+        (func.date_trunc("second", column) != column, func.to_char(column, ".US")),
+        else_=literal(""),
+    )
+
+
+def tariff_json() -> ColumnElement:
+    return func.json_build_object(
+        "id", CoworkingTariffORM.id,
+        "name", CoworkingTariffORM.name,
+        "color", CoworkingTariffORM.color,
+        "price_per_hour", CoworkingTariffORM.price_per_hour,
+        "pricing_rules", CoworkingTariffORM.pricing_rules,
+        # CoworkingTariffDTO отдаёт created_at как UTC-время с точностью до секунды
+        "created_at", func.to_char(CoworkingTariffORM.created_at, 'YYYY-MM-DD"T"HH24:MI:SS"Z"'),
+    )
+
+
+def workplace_json() -> ColumnElement:
+    return func.json_build_object(
+        "id", WorkplaceORM.id,
+        "number", WorkplaceORM.number,
+        "name", WorkplaceORM.name,
+        "status", WorkplaceORM.status,
+        "x_cor", WorkplaceORM.x_cor,
+        "y_cor", WorkplaceORM.y_cor,
+        "tariff", tariff_json(),
+        "created_at", iso_timestamp(WorkplaceORM.created_at),
+    )
+
+
+def coworking_json() -> ColumnElement:
+    return func.json_strip_nulls(
+        func.json_build_object(
+            "id", CoworkingORM.id,
+            "name", CoworkingORM.name,
+            "address", CoworkingORM.address,
+            "photo_url", CoworkingORM.photo_url,
+            "cover_url", CoworkingORM.cover_url,
+            "description", CoworkingORM.description,
+            "created_at", iso_timestamp(CoworkingORM.created_at),
+        ),
+        type_=JSON,
+    )
+
+
+def booking_json() -> ColumnElement:
+    workplaces = (
+        select(func.coalesce(func.json_agg(workplace_json()), func.json_build_array()))
+        .select_from(booking_workplaces)
+        .join(WorkplaceORM, WorkplaceORM.id == booking_workplaces.c.workplace_id)
+        .join(CoworkingTariffORM, CoworkingTariffORM.id == WorkplaceORM.tariff_id)
+        .where(booking_workplaces.c.booking_id == BookingORM.id)
+        .scalar_subquery()
+    )
+    return func.json_strip_nulls(
+        func.json_build_object(
+            "id", BookingORM.id,
+            "user_id", BookingORM.user_id,
+            "workplaces", workplaces,
+            "start_time", iso_timestamp(BookingORM.start_time),
+            "end_time", iso_timestamp(BookingORM.end_time),
+            "status", BookingORM.status,
+            "total_price", BookingORM.total_price,
+            "created_at", iso_timestamp(BookingORM.created_at),
+        ),
+        type_=JSON,
+    )
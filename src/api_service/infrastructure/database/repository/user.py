@@ -1,21 +1,22 @@
 from typing import Optional, List
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.dialects.postgresql import insert
 
 from core.exceptions import EntityNotFoundError
-from core.config import SecurityConfig
 from domain.gateway import UserGateway
 from domain.dto.user import TelegramAuthDTO
 from domain.dto.misc import TgId, UserRole
 from infrastructure.database.postgres.models import UserORM, BookingORM
+from infrastructure.database.redis.admins import AdminRegistry
 
 
 class UserRepository(UserGateway):
-    def __init__(self, db_session: AsyncSession, config: SecurityConfig):
+    def __init__(self, db_session: AsyncSession, admin_registry: AdminRegistry):
         self.db_session = db_session
-        self.config = config
+        self.admin_registry = admin_registry
 
     async def get_user(self, tg_id: TgId) -> Optional[UserORM]:
         query = select(UserORM).where(UserORM.id == tg_id)
@@ -28,28 +29,31 @@ class UserRepository(UserGateway):
         return result.scalars().all()
 
     async def add_user(self, user: TelegramAuthDTO) -> None:
-        exist_user = await self.get_user(user.id)
+        role = UserRole.ADMIN if self.admin_registry.is_admin(user.id) else UserRole.USER
+        user_orm = user.dto_to_orm(role=role)
 
-        # role = UserRole.ADMIN if user.id in self.config.TG_ADMINS else UserRole.USER
-        role = UserRole.ADMIN
-        if exist_user:
-            exist_user.id = user.id
-            exist_user.first_name = user.first_name
-            exist_user.last_name = user.last_name
-            exist_user.username = user.username
-            exist_user.photo_url = user.photo_url
-            exist_user.role = role
-
-            await self.db_session.commit()
-            await self.db_session.refresh(exist_user)
-
-            return
-
-        new_user = user.dto_to_orm(role=role)
+        # вставка или обновление профиля одним запросом, баланс и дата регистрации не меняются
+        query = insert(UserORM).values(**{
+            column.name: getattr(user_orm, column.name)
+            for column in UserORM.__table__.columns
+            if getattr(user_orm, column.name) is not None
+        })
+        query = query.on_conflict_do_update(
+            index_elements=["id"],
+            set_={
+                "first_name": query.excluded.first_name,
+                "last_name": query.excluded.last_name,
+                "username": query.excluded.username,
+                "photo_url": query.excluded.photo_url,
+                "role": query.excluded.role,
+            },
+        )
+        await self.db_session.execute(query)
+        await self.db_session.commit()
 
-        self.db_session.add(new_user)
+    async def update_role(self, tg_id: TgId, role: UserRole) -> None:
+        await self.db_session.execute(update(UserORM).where(UserORM.id == tg_id).values(role=role))
         await self.db_session.commit()
-        await self.db_session.refresh(new_user)
 
     async def delete_user(self, tg_id: TgId) -> None:
         user = await self.get_user(tg_id)
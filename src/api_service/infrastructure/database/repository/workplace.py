@@ -1,14 +1,22 @@
-from typing import List
+from functools import partial
+from typing import List, Optional, Tuple
 
-from sqlalchemy import select
+from sqlalchemy import JSON, select, update, exists, func
 from sqlalchemy.orm import selectinload
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.dialects.postgresql import insert
 
 from domain.dto.workplace import WorkplaceUpsertDTO
 from domain.gateway.workplace import WorkplaceGateway
-from domain.dto.misc import CoworkingId
-from infrastructure.database.postgres.models import WorkplaceORM
+from domain.dto.misc import CoworkingId, WorkplaceId, WorkplaceStatus, BookingStartTime, BookingEndTime
+from infrastructure.database.postgres.models import (
+    CoworkingORM,
+    CoworkingTariffORM,
+    WorkplaceORM,
+    booking_workplaces,
+)
+from infrastructure.database.redis.cache import CatalogueCache, workplaces_key
+from .projections import workplace_json
 
 
 class WorkplaceRepository(WorkplaceGateway):
@@ -20,10 +28,11 @@ class WorkplaceRepository(WorkplaceGateway):
 
         query = insert(WorkplaceORM).values(workplaces_data)
 
+        # обновляются только переданные колонки: status и прочие поля со значением по умолчанию не сбрасываются
         update_columns = {
-            c.name: getattr(query.excluded, c.name)
-            for c in WorkplaceORM.__table__.columns
-            if c.name not in ("id", "created_at")
+            name: getattr(query.excluded, name)
+            for name in workplaces_data[0]
+            if name not in ("id", "created_at")
         }
 
         query = query.on_conflict_do_update(
@@ -32,10 +41,17 @@ class WorkplaceRepository(WorkplaceGateway):
         ).returning(WorkplaceORM)
 
         result = await self.db_session.execute(query)
-        await self.db_session.commit()
-
         workplaces_result = result.scalars().all()
 
+        # координаты могли поменяться — кэшированные сетки планировки по старой версии больше не используются
+        coworking_ids = {workplace.coworking_id for workplace in workplaces_result}
+        await self.db_session.execute(
+            update(CoworkingORM)
+            .where(CoworkingORM.id.in_(coworking_ids))
+            .values(floor_plan_version=CoworkingORM.floor_plan_version + 1)
+        )
+        await self.db_session.commit()
+
         workplace_ids = [workplace.id for workplace in workplaces_result]
 
         query = select(WorkplaceORM).where(WorkplaceORM.id.in_(workplace_ids)).options(
@@ -45,8 +61,69 @@ class WorkplaceRepository(WorkplaceGateway):
 
         return workplaces_with_tariff
 
+    async def get_workplaces(self, workplace_ids: List[WorkplaceId]) -> List[WorkplaceORM]:
+        query = select(WorkplaceORM).options(selectinload(WorkplaceORM.tariff)).where(
+            WorkplaceORM.id.in_(workplace_ids))
+        result = await self.db_session.execute(query)
+        return result.scalars().all()
+
     async def list_workplaces(self, coworking_id: CoworkingId) -> List[WorkplaceORM]:
         query = select(WorkplaceORM).options(selectinload(WorkplaceORM.tariff)).where(
             WorkplaceORM.coworking_id == coworking_id)
         result = await self.db_session.execute(query)
         return result.scalars().all()
+
+    async def list_workplaces_json(self, coworking_id: CoworkingId) -> List[dict]:
+        query = (
+            select(func.json_strip_nulls(workplace_json(), type_=JSON))
+            .join(CoworkingTariffORM, CoworkingTariffORM.id == WorkplaceORM.tariff_id)
+            .where(WorkplaceORM.coworking_id == coworking_id)
+        )
+        result = await self.db_session.execute(query)
+        return result.scalars().all()
+
+    async def list_workplace_coordinates(self, coworking_id: CoworkingId) -> List[Tuple[WorkplaceId, float, float]]:
+        query = select(WorkplaceORM.id, WorkplaceORM.x_cor, WorkplaceORM.y_cor).where(
+            WorkplaceORM.coworking_id == coworking_id)
+        result = await self.db_session.execute(query)
+        return result.all()
+
+    async def list_available_workplaces(self, coworking_id: CoworkingId, start_time: BookingStartTime,
+                                        end_time: BookingEndTime, tags: Optional[List[str]]) -> List[WorkplaceORM]:
+        overlapping_bookings = (
+            select(booking_workplaces.c.workplace_id)
+            .where(
+                booking_workplaces.c.workplace_id == WorkplaceORM.id,
+                booking_workplaces.c.period.overlaps(func.tsrange(start_time, end_time)),
+            )
+        )
+        query = (
+            select(WorkplaceORM)
+            .options(selectinload(WorkplaceORM.tariff))
+            .where(
+                WorkplaceORM.coworking_id == coworking_id,
+                WorkplaceORM.status != WorkplaceStatus.INACTIVE,
+                ~exists(overlapping_bookings),
+            )
+        )
+        if tags:
+            query = query.where(WorkplaceORM.tags.contains(tags))
+
+        result = await self.db_session.execute(query)
+        return result.scalars().all()
+
+
+class CachedWorkplaceRepository(WorkplaceRepository):
+    def __init__(self, db_session: AsyncSession, cache: CatalogueCache):
+        super().__init__(db_session)
+        self.cache = cache
+
+    async def list_workplaces_json(self, coworking_id: CoworkingId) -> List[dict]:
+        return await self.cache.get_or_load(
+            workplaces_key(coworking_id), "", partial(super().list_workplaces_json, coworking_id))
+
+    async def upsert_workplaces(self, workplaces: List[WorkplaceUpsertDTO]) -> List[WorkplaceORM]:
+        workplaces_orm = await super().upsert_workplaces(workplaces)
+        coworking_ids = {workplace.coworking_id for workplace in workplaces_orm}
+        await self.cache.invalidate(*(workplaces_key(coworking_id) for coworking_id in coworking_ids))
+        return workplaces_orm
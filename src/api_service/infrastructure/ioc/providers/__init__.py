@@ -2,6 +2,8 @@ from .config import ConfigProvider
 from .interactor import InteractorProvider
 from .repository import RepositoryProvider
 from .auth import AuthProvider
+from .cache import CacheProvider
+from .events import EventProvider
 from .connect import (
     PostgresProvider,
     RedisProvider,
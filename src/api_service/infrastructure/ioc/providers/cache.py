@@ -0,0 +1,32 @@
+from dishka import Provider, Scope, provide
+from redis.asyncio import Redis
+
+from core.config import SecurityConfig
+from core.security import VerifiedTokenCache
+from core.spatial import FloorPlanCache
+from infrastructure.database.redis.admins import AdminRegistry
+from infrastructure.database.redis.bus import EventBus, TOKEN_REVOKED, RESYNC
+from infrastructure.database.redis.cache import CatalogueCache
+
+
+class CacheProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    def provide_floor_plan_cache(self) -> FloorPlanCache:
+        return FloorPlanCache()
+
+    @provide
+    def provide_catalogue_cache(self, redis: Redis, bus: EventBus) -> CatalogueCache:
+        return CatalogueCache(redis, bus)
+
+    @provide
+    def provide_verified_token_cache(self, bus: EventBus) -> VerifiedTokenCache:
+        cache = VerifiedTokenCache()
+        bus.subscribe(TOKEN_REVOKED, lambda payload: cache.revoke(payload["tg_id"]))
+        bus.subscribe(RESYNC, lambda payload: cache.clear())
+        return cache
+
+    @provide
+    def provide_admin_registry(self, redis: Redis, bus: EventBus, config: SecurityConfig) -> AdminRegistry:
+        return AdminRegistry(redis, bus, bootstrap=config.TG_ADMINS)
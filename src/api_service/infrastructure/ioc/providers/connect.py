@@ -8,8 +8,7 @@ from core.config import (
     PostgresConfig,
     RedisConfig,
 )
-from core.utils import is_valid_postgres_uri
-from infrastructure.database.postgres.session import create_engine
+from infrastructure.database.postgres.session import create_engine, database_uri
 from infrastructure.database.redis.session import get_redis
 
 
@@ -18,17 +17,7 @@ class PostgresProvider(Provider):
 
     @provide
     async def create_db_engine(self, config: PostgresConfig) -> AsyncIterable[AsyncEngine]:
-        DB_URI = config.POSTGRES_DSN.replace("postgresql://", "postgresql+asyncpg://")
-        if not is_valid_postgres_uri(config.POSTGRES_DSN):
-            host = config.POSTGRES_HOST
-            port = config.POSTGRES_PORT
-            username = config.POSTGRES_USERNAME
-            password = config.POSTGRES_PASSWORD
-            db_name = config.POSTGRES_DATABASE
-
-            DB_URI = f"postgresql+asyncpg://{username}:{password}@{host}:{port}/{db_name}"
-
-        async for engine in create_engine(DB_URI=DB_URI):
+        async for engine in create_engine(DB_URI=database_uri(config)):
             yield engine
 
 
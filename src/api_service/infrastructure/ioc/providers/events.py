@@ -0,0 +1,12 @@
+from dishka import Provider, Scope, provide
+from redis.asyncio import Redis
+
+from infrastructure.database.redis.bus import EventBus
+
+
+class EventProvider(Provider):
+    scope = Scope.APP
+
+    @provide
+    def provide_event_bus(self, redis: Redis) -> EventBus:
+        return EventBus(redis)
@@ -3,6 +3,7 @@ from dishka import Provider, Scope, provide_all
 from domain.interactors.auth import (
     GenerateAccessTokenInteractor,
     OAuth2PasswordBearerInteractor,
+    RevokeAccessTokenInteractor,
 )
 from domain.interactors.user import (
     GetUserInteractor,
@@ -17,19 +18,34 @@ from domain.interactors.coworking import (
     DeleteCoworkingInteractor,
     AddCoworkingTariffsInteractor,
     ListCoworkingTariffsInteractor,
+    GetCoworkingTimelineInteractor,
 )
 from domain.interactors.workplace import (
     UpsertWorkplacesInteractor,
     ListWorkplacesInteractor,
+    ListAvailableWorkplacesInteractor,
+    FindWorkplaceClusterInteractor,
 )
 from domain.interactors.booking import (
     GetBookingInteractor,
     ListUserBookingsInteractor,
     ListCoworkingBookingsInteractor,
     ListAllBookingsInteractor,
+    ExportBookingsInteractor,
+    AddHoldInteractor,
+    DeleteHoldInteractor,
+    SuggestBookingSlotsInteractor,
     AddBookingInteractor,
+    AddBookingsBulkInteractor,
+    QuoteBookingsInteractor,
+    AddBookingSeriesInteractor,
+    DeleteBookingSeriesInteractor,
     UpdateBookingInteractor,
     DeleteBookingInteractor,
+    AddWaitlistEntryInteractor,
+    DeleteWaitlistEntryInteractor,
+    PromotedBookingsInteractor,
+    AckPromotedBookingsInteractor,
     ActivateBookingInteractor,
     PendingBookingsInteractor,
 )
@@ -55,6 +71,7 @@ class InteractorProvider(Provider):
     auth_interactor = provide_all(
         GenerateAccessTokenInteractor,
         OAuth2PasswordBearerInteractor,
+        RevokeAccessTokenInteractor,
     )
 
     user_interactor = provide_all(
@@ -71,11 +88,14 @@ class InteractorProvider(Provider):
         DeleteCoworkingInteractor,
         AddCoworkingTariffsInteractor,
         ListCoworkingTariffsInteractor,
+        GetCoworkingTimelineInteractor,
     )
 
     workplace_interactor = provide_all(
         UpsertWorkplacesInteractor,
         ListWorkplacesInteractor,
+        ListAvailableWorkplacesInteractor,
+        FindWorkplaceClusterInteractor,
     )
 
     booking_interactor = provide_all(
@@ -83,9 +103,21 @@ class InteractorProvider(Provider):
         ListUserBookingsInteractor,
         ListCoworkingBookingsInteractor,
         ListAllBookingsInteractor,
+        ExportBookingsInteractor,
+        AddHoldInteractor,
+        DeleteHoldInteractor,
+        SuggestBookingSlotsInteractor,
         AddBookingInteractor,
+        AddBookingsBulkInteractor,
+        QuoteBookingsInteractor,
+        AddBookingSeriesInteractor,
+        DeleteBookingSeriesInteractor,
         UpdateBookingInteractor,
         DeleteBookingInteractor,
+        AddWaitlistEntryInteractor,
+        DeleteWaitlistEntryInteractor,
+        PromotedBookingsInteractor,
+        AckPromotedBookingsInteractor,
         ActivateBookingInteractor,
         PendingBookingsInteractor,
     )
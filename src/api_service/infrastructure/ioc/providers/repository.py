@@ -6,10 +6,11 @@ from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession
 from infrastructure.database.postgres.session import get_db
 from infrastructure.database.repository import (
     UserRepository,
-    CoworkingRepository,
-    WorkplaceRepository,
+    CachedCoworkingRepository,
+    CachedWorkplaceRepository,
     BookingRepository,
     StatsRepository,
+    HoldRepository,
 )
 from domain.gateway import (
     UserGateway,
@@ -17,6 +18,7 @@ from domain.gateway import (
     WorkplaceGateway,
     BookingGateway,
     StatsGateway,
+    HoldGateway,
 )
 
 
@@ -29,7 +31,8 @@ class RepositoryProvider(Provider):
             yield db_session
 
     user_gateway = provide(UserRepository, provides=UserGateway)
-    coworking_gateway = provide(CoworkingRepository, provides=CoworkingGateway)
-    workplace_gateway = provide(WorkplaceRepository, provides=WorkplaceGateway)
+    coworking_gateway = provide(CachedCoworkingRepository, provides=CoworkingGateway)
+    workplace_gateway = provide(CachedWorkplaceRepository, provides=WorkplaceGateway)
     booking_gateway = provide(BookingRepository, provides=BookingGateway)
     stats_gateway = provide(StatsRepository, provides=StatsGateway)
+    hold_gateway = provide(HoldRepository, provides=HoldGateway)
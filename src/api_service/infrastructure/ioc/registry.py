@@ -8,6 +8,8 @@ from .providers import (
     RedisProvider,
     InteractorProvider,
     AuthProvider,
+    CacheProvider,
+    EventProvider,
     RepositoryProvider,
 )
 
@@ -19,5 +21,7 @@ def get_providers() -> Iterable[Provider]:
         RedisProvider(),
         InteractorProvider(),
         AuthProvider(),
+        CacheProvider(),
+        EventProvider(),
         RepositoryProvider(),
     )
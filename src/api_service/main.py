@@ -1,3 +1,4 @@
+import asyncio
 import contextlib
 
 import sentry_sdk
@@ -8,22 +9,37 @@ from fastapi import APIRouter, FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.openapi.utils import get_openapi
 from sentry_sdk.integrations.asgi import SentryAsgiMiddleware
+from sqlalchemy.ext.asyncio import AsyncEngine
 
 from api.v1 import root_router
 from core.build import create_async_container
 from core.config import Config, create_config
 from core.exceptions import setup_exception_handlers
+from core.responses import FastJSONResponse
+from infrastructure.database.redis.admins import AdminRegistry
+from infrastructure.database.redis.bus import EventBus
+from infrastructure.database.redis.cache import CATALOGUE_CACHE_REQUESTS
 from infrastructure.ioc.registry import get_providers
 
 
 @contextlib.asynccontextmanager
 async def lifespan(app: FastAPI):
+    # движок создаётся при старте, чтобы несовпадение версии схемы остановило приложение сразу
+    await app.state.dishka_container.get(AsyncEngine)
+    # список админов загружается до первого запроса, дальше он обновляется по событиям
+    await (await app.state.dishka_container.get(AdminRegistry)).load()
+    bus = await app.state.dishka_container.get(EventBus)
+    listener = asyncio.create_task(bus.listen())
     yield
+    listener.cancel()
+    with contextlib.suppress(asyncio.CancelledError):
+        await listener
     await app.state.dishka_container.close()
 
 
 def create_app() -> FastAPI:
     metrics_config = MetricsConfig(app_name="PROD_API", include_trace_exemplar=True)
+    metrics_config.registry.register(CATALOGUE_CACHE_REQUESTS)
 
     sentry_sdk.init(
         dsn="https://e609472d95c9f3e3de39ae25c98baadb@o4508853327888384.ingest.de.sentry.io/4508904557117520",
@@ -33,6 +49,7 @@ def create_app() -> FastAPI:
 
     app = FastAPI(
         lifespan=lifespan,
+        default_response_class=FastJSONResponse,
         root_path="/api",
         root_path_in_servers=True,
         servers=[
@@ -13,6 +13,8 @@ from api.v1 import root_router
 from core.config import create_config
 from main import create_app, configure_app
 from infrastructure.database.postgres.base import Base
+from infrastructure.database.postgres.migrations import migrate
+from infrastructure.database.redis.bus import EVENTS_CHANNEL
 
 
 @pytest.fixture(scope="session")
@@ -76,7 +78,7 @@ async def setup_db() -> None:
 
     async with engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
-        await conn.run_sync(Base.metadata.create_all)
+    await migrate(engine)
 
     yield
 
@@ -107,6 +109,34 @@ async def async_client(app: FastAPI):
         yield ac
 
 
+@pytest.fixture
+async def worker_app(app: FastAPI, redis: Redis) -> FastAPI:
+    """
+    Поднимает второй экземпляр приложения со своим контейнером и кэшами, как отдельный воркер,
+    и ждёт, пока он подпишется на шину событий.
+    """
+    worker = create_app()
+    configure_app(worker, root_router, config=create_config())
+    async with LifespanManager(worker):
+        for _ in range(100):
+            if (await redis.pubsub_numsub(EVENTS_CHANNEL))[0][1] >= 2:
+                break
+            await asyncio.sleep(0.02)
+        yield worker
+
+
+@pytest.fixture
+async def worker_client(worker_app: FastAPI):
+    """
+    httpx.AsyncClient для запросов ко второму воркеру.
+    """
+    async with AsyncClient(
+            base_url="http://test",
+            transport=ASGITransport(app=worker_app)
+    ) as ac:
+        yield ac
+
+
 def pytest_generate_tests(metafunc):
     """
     Автоматически подхватываем маркер @pytest.mark.datafile("<path>").
@@ -1,3 +1,5 @@
+import asyncio
+
 import pytest
 
 
@@ -41,3 +43,114 @@ async def test_list_users(async_client, request_data, expected_status, jwt_token
     assert response.status_code == expected_status
     data = response.json()
     assert isinstance(data, list)
+
+
+@pytest.mark.anyio
+async def test_logout_revokes_token_on_all_workers(async_client, worker_client):
+    """
+    Проверяет выход через эндпоинт /v1/user/logout: токен, уже проверенный и закэшированный
+    вторым воркером, после отзыва перестаёт приниматься обоими воркерами.
+    """
+    user = {"id": 700000001, "first_name": "Выход", "username": "logout_user", "auth_date": 1742720967,
+            "hash": "0" * 64}
+    response = await async_client.post("/v1/user/auth", json=user)
+    assert response.status_code == 201, response.text
+    headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+    for _ in range(2):
+        response = await worker_client.get("/v1/user/profile", headers=headers)
+        assert response.status_code == 200, response.text
+
+    response = await async_client.post("/v1/user/logout", headers=headers)
+    assert response.status_code == 204, response.text
+    response = await async_client.get("/v1/user/profile", headers=headers)
+    assert response.status_code == 401
+
+    for _ in range(100):
+        response = await worker_client.get("/v1/user/profile", headers=headers)
+        if response.status_code == 401:
+            break
+        await asyncio.sleep(0.02)
+    assert response.status_code == 401
+
+
+@pytest.mark.anyio
+async def test_admin_registry_shared_between_workers(async_client, worker_client, jwt_tokens, redis):
+    """
+    Проверяет, что права админа берутся из общего реестра: новый пользователь получает 403
+    на админском эндпоинте, а после /v1/external/tg_admin/add — доступ на обоих воркерах.
+    """
+    user = {"id": 700000002, "first_name": "Админ", "username": "future_admin", "auth_date": 1742720967,
+            "hash": "0" * 64}
+    response = await async_client.post("/v1/user/auth", json=user)
+    headers = {"Authorization": f"Bearer {response.json()['token']}"}
+    response = await worker_client.get("/v1/bookings/list/all", headers=headers)
+    assert response.status_code == 403, response.text
+
+    admin_headers = {"Authorization": f"Bearer {jwt_tokens['jwt']}"}
+    response = await async_client.post("/v1/external/tg_admin/add", params={"tg_id": user["id"]},
+                                       headers=admin_headers)
+    assert user["id"] in response.json()
+    assert await redis.sismember("admins:tg", user["id"])
+    response = await async_client.get("/v1/user/profile", headers=headers)
+    assert response.json()["role"] == "ADMIN"
+
+    for _ in range(100):
+        response = await worker_client.get("/v1/bookings/list/all", headers=headers)
+        if response.status_code == 200:
+            break
+        await asyncio.sleep(0.02)
+    assert response.status_code == 200, response.text
+
+    response = await async_client.delete("/v1/external/tg_admin/remove", params={"tg_id": user["id"]},
+                                         headers=admin_headers)
+    assert user["id"] not in response.json()
+    response = await async_client.get("/v1/bookings/list/all", headers=headers)
+    assert response.status_code == 403
+
+
+@pytest.mark.anyio
+async def test_tg_admin_requires_admin(async_client, redis):
+    """
+    Проверяет, что /v1/external/tg_admin/add и /v1/external/tg_admin/remove
+    отклоняют запросы без токена (401) и от пользователя без прав админа (403).
+    """
+    user = {"id": 700000004, "first_name": "Пользователь", "username": "not_admin", "auth_date": 1742720967,
+            "hash": "0" * 64}
+    response = await async_client.post("/v1/user/auth", json=user)
+    headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+    response = await async_client.post("/v1/external/tg_admin/add", params={"tg_id": user["id"]})
+    assert response.status_code == 401, response.text
+    response = await async_client.post("/v1/external/tg_admin/add", params={"tg_id": user["id"]}, headers=headers)
+    assert response.status_code == 403, response.text
+    assert not await redis.sismember("admins:tg", user["id"])
+
+    response = await async_client.delete("/v1/external/tg_admin/remove", params={"tg_id": 1522105862})
+    assert response.status_code == 401, response.text
+    response = await async_client.delete("/v1/external/tg_admin/remove", params={"tg_id": 1522105862},
+                                         headers=headers)
+    assert response.status_code == 403, response.text
+    assert await redis.sismember("admins:tg", 1522105862)
+
+
+@pytest.mark.anyio
+async def test_auth_user_upsert(async_client):
+    """
+    Проверяет повторную авторизацию через /v1/user/auth: профиль обновляется,
+    баланс сохраняется, а выданный ранее токен возвращается повторно.
+    """
+    user = {"id": 700000003, "first_name": "Первый", "username": "upsert_user", "auth_date": 1742720967,
+            "hash": "0" * 64}
+    first = await async_client.post("/v1/user/auth", json=user)
+    assert first.status_code == 201, first.text
+    headers = {"Authorization": f"Bearer {first.json()['token']}"}
+    profile = (await async_client.get("/v1/user/profile", headers=headers)).json()
+
+    second = await async_client.post("/v1/user/auth", json=dict(user, first_name="Второй"))
+    assert second.status_code == 201, second.text
+    assert second.json()["token"] == first.json()["token"]
+    updated = (await async_client.get("/v1/user/profile", headers=headers)).json()
+    assert updated["first_name"] == "Второй"
+    assert updated["balance"] == profile["balance"]
+    assert updated["created_at"] == profile["created_at"]
@@ -1,5 +1,10 @@
+import asyncio
+
 import pytest
 
+from infrastructure.database.redis.bus import EVENTS_CHANNEL, EventBus
+from infrastructure.database.redis.cache import CatalogueCache
+
 
 @pytest.mark.datafile("tests/e2e/components/coworking/add_coworking_data.json")
 @pytest.mark.anyio
@@ -48,3 +53,108 @@ async def test_list_coworkings(async_client, request_data, expected_status, jwt_
     assert response.status_code == expected_status
     data = response.json()
     assert isinstance(data, list)
+
+
+@pytest.mark.anyio
+async def test_coworking_cache_invalidation(async_client, jwt_tokens):
+    """
+    Проверяет, что кэш каталога сбрасывается при изменении коворкинга и его тарифов,
+    запоминает 404 для удалённого коворкинга и отдаёт метрики попаданий через /metrics.
+    """
+    headers = {"Authorization": f"Bearer {jwt_tokens['jwt']}"}
+    payload = {
+        "name": "Коворкинг для кэша",
+        "address": "г. Москва, ул. Тверская, 1",
+        "photo_url": "https://example.com/photo.jpg",
+        "cover_url": "https://example.com/cover.jpg",
+    }
+    response = await async_client.post("/v1/coworking/add", json=payload, headers=headers)
+    assert response.status_code == 201, response.text
+    coworking_id = response.json()["id"]
+
+    for _ in range(2):
+        response = await async_client.get(f"/v1/coworking/{coworking_id}/get", headers=headers)
+        assert response.json()["name"] == payload["name"]
+
+    response = await async_client.patch(f"/v1/coworking/{coworking_id}/update", json={"name": "Новое имя"},
+                                        headers=headers)
+    assert response.status_code == 200, response.text
+    response = await async_client.get(f"/v1/coworking/{coworking_id}/get", headers=headers)
+    assert response.json()["name"] == "Новое имя"
+    response = await async_client.get("/v1/coworking/list", params={"limit": 100}, headers=headers)
+    assert {"id": coworking_id, "name": "Новое имя"}.items() <= next(
+        coworking for coworking in response.json() if coworking["id"] == coworking_id).items()
+
+    response = await async_client.get(f"/v1/coworking/{coworking_id}/tariffs/list", headers=headers)
+    assert response.json() == []
+    tariff = {"coworking_id": coworking_id, "name": "Базовый", "color": "#000000", "price_per_hour": 100}
+    response = await async_client.post("/v1/coworking/tariffs/add", json=[tariff], headers=headers)
+    assert response.status_code == 201, response.text
+    added = response.json()
+    response = await async_client.get(f"/v1/coworking/{coworking_id}/tariffs/list", headers=headers)
+    assert response.json() == added
+
+    response = await async_client.delete(f"/v1/coworking/{coworking_id}/delete", headers=headers)
+    assert response.status_code == 204, response.text
+    for _ in range(2):
+        response = await async_client.get(f"/v1/coworking/{coworking_id}/get", headers=headers)
+        assert response.status_code == 404
+
+    metrics = (await async_client.get("/metrics")).text
+    assert 'catalogue_cache_requests_total{level="l1",result="hit"}' in metrics
+
+
+async def wait_until(predicate, timeout=2.0):
+    for _ in range(int(timeout / 0.02)):
+        if await predicate():
+            return True
+        await asyncio.sleep(0.02)
+    return False
+
+
+@pytest.mark.anyio
+async def test_invalidation_across_workers(async_client, worker_client, jwt_tokens, redis):
+    """
+    Проверяет, что второй воркер со своим L1-кэшем видит изменение коворкинга, сделанное первым,
+    благодаря шине событий в Redis, даже если до этого в канал пришли битые сообщения.
+    """
+    headers = {"Authorization": f"Bearer {jwt_tokens['jwt']}"}
+    coworking_id = await redis.hget("tokens", "coworking_id")
+    url = f"/v1/coworking/{coworking_id}/get"
+
+    name = (await worker_client.get(url, headers=headers)).json()["name"]
+    await redis.publish(EVENTS_CHANNEL, "not json")
+    await redis.publish(EVENTS_CHANNEL, '{"event": "catalogue.invalidated"}')
+    response = await async_client.patch(f"/v1/coworking/{coworking_id}/update", json={"name": "Переименован"},
+                                        headers=headers)
+    assert response.status_code == 200, response.text
+
+    async def renamed():
+        return (await worker_client.get(url, headers=headers)).json()["name"] == "Переименован"
+    assert await wait_until(renamed)
+
+    await async_client.patch(f"/v1/coworking/{coworking_id}/update", json={"name": name}, headers=headers)
+
+
+@pytest.mark.anyio
+async def test_catalogue_cache_skips_stale_write(redis):
+    """
+    Проверяет, что значение, прочитанное до инвалидации на другом воркере,
+    не попадает в общий L2-кэш и следующее чтение идёт в источник заново.
+    """
+    key = "catalogue:test:stale"
+    cache, other_worker = CatalogueCache(redis, EventBus(redis)), CatalogueCache(redis, EventBus(redis))
+    loads = []
+
+    async def load():
+        loads.append(len(loads))
+        if len(loads) == 1:
+            await other_worker.invalidate(key)
+            return "stale"
+        return "fresh"
+
+    assert await cache.get_or_load(key, "", load) == "stale"
+    assert await redis.hget(key, "") is None
+    assert await other_worker.get_or_load(key, "", load) == "fresh"
+    assert await cache.get_or_load(key, "", load) == "fresh"
+    assert len(loads) == 2
@@ -1,6 +1,16 @@
+import asyncio
+import base64
+import csv
+import io
+import json
+from datetime import datetime, timedelta
+
 import pytest
 from uuid import UUID
 
+from infrastructure.database.repository.booking import BookingRepository
+from infrastructure.database.redis.storage import RedisStorage
+
 
 @pytest.mark.datafile("tests/e2e/components/booking/add_booking_data.json")
 @pytest.mark.anyio
@@ -22,14 +32,211 @@ async def test_add_booking(async_client, request_data, expected_status, jwt_toke
     await redis.hset("tokens", "booking_id", booking_id)
 
 
-@pytest.mark.skip(reason="Lazy-loading issue: MissingGreenlet encountered in get_booking")
+@pytest.mark.anyio
+async def test_add_booking_concurrently(async_client, jwt_tokens, redis):
+    """
+    Проверяет, что при сотнях параллельных запросов /v1/bookings/add
+    на одно и то же место и время успешно создаётся ровно одно бронирование,
+    а остальные получают 403 из-за пересечения.
+    """
+    token = jwt_tokens.get("jwt")
+    workplace_id = await redis.hget("tokens", "workplace_id")
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    request_data = {
+        "workplaces": [workplace_id],
+        "start_time": "2025-03-05T09:00:00",
+        "end_time": "2025-03-05T10:00:00",
+    }
+
+    responses = await asyncio.gather(*[
+        async_client.post("/v1/bookings/add", json=request_data, headers=headers)
+        for _ in range(200)
+    ])
+
+    status_codes = [response.status_code for response in responses]
+    assert status_codes.count(201) == 1, status_codes
+    assert status_codes.count(403) == len(status_codes) - 1, status_codes
+
+
+@pytest.mark.anyio
+async def test_add_booking_missing_workplace(async_client, jwt_tokens, redis):
+    """
+    Проверяет, что /v1/bookings/add отвечает 404, если хотя бы одного из мест нет,
+    а не создаёт бронь только на найденные места.
+    """
+    workplace_id = await redis.hget("tokens", "workplace_id")
+    headers = {"Authorization": f"Bearer {jwt_tokens['jwt']}"}
+    request_data = {
+        "workplaces": [workplace_id, "f3047cd8-56e6-46e4-ac2d-757550c1f62a"],
+        "start_time": "2025-03-06T09:00:00",
+        "end_time": "2025-03-06T10:00:00",
+    }
+    response = await async_client.post("/v1/bookings/add", json=request_data, headers=headers)
+    assert response.status_code == 404, response.text
+
+
+@pytest.mark.datafile("tests/e2e/components/workplace/list_available_workplace_data.json")
+@pytest.mark.anyio
+async def test_list_available_workplaces(async_client, request_data, expected_status, jwt_tokens, redis):
+    """
+    Проверяет поиск свободных рабочих мест через endpoint /v1/workplace/available:
+    место, забронированное в test_add_booking, не возвращается для пересекающегося окна
+    и возвращается для соседнего.
+    """
+    token = jwt_tokens.get("jwt")
+    coworking_id = await redis.hget("tokens", "coworking_id")
+    workplace_id = await redis.hget("tokens", "workplace_id")
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    params = {
+        "coworking_id": coworking_id,
+        "start": request_data["start"],
+        "end": request_data["end"],
+    }
+    response = await async_client.get("/v1/workplace/available", params=params, headers=headers)
+    assert response.status_code == expected_status, response.text
+    data = response.json()
+    assert isinstance(data, list)
+    assert (workplace_id in [workplace["id"] for workplace in data]) is request_data["is_free"]
+
+
+@pytest.mark.anyio
+async def test_get_coworking_timeline(async_client, jwt_tokens, redis):
+    """
+    Проверяет сетку занятости через endpoint /v1/coworking/{coworking_id}/timeline:
+    бронь с 9:00 до 10:00 из test_add_booking занимает слоты 18 и 19 при шаге 30 минут.
+    """
+    token = jwt_tokens.get("jwt")
+    coworking_id = await redis.hget("tokens", "coworking_id")
+    workplace_id = await redis.hget("tokens", "workplace_id")
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    url = f"/v1/coworking/{coworking_id}/timeline"
+    response = await async_client.get(url, params={"date": "2025-03-04", "slot_minutes": 30}, headers=headers)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["slots"] == 48
+    timeline = {workplace["workplace_id"]: workplace["occupancy"] for workplace in data["workplaces"]}
+    mask = int.from_bytes(base64.b64decode(timeline[workplace_id]), "little")
+    assert [i for i in range(data["slots"]) if mask >> i & 1] == [18, 19]
+
+
+async def fetch_all_pages(async_client, url, params, headers, expected_status):
+    items, cursor = [], None
+    while True:
+        page_params = dict(params, cursor=cursor) if cursor else params
+        response = await async_client.get(url, params=page_params, headers=headers)
+        assert response.status_code == expected_status, response.text
+        data = response.json()
+        assert len(data["items"]) <= params["limit"]
+        items.extend(data["items"])
+        cursor = data.get("next_cursor")
+        if not cursor:
+            return items
+
+
+@pytest.mark.datafile("tests/e2e/components/booking/list_user_booking_data.json")
+@pytest.mark.anyio
+async def test_list_user_bookings(async_client, request_data, expected_status, jwt_tokens):
+    """
+    Проверяет постраничный обход бронирований пользователя через endpoint /v1/bookings/list/user:
+    страницы идут по (start_time, id) без повторов и пропусков.
+    """
+    token = jwt_tokens.get("jwt")
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    items = await fetch_all_pages(async_client, "/v1/bookings/list/user", request_data, headers, expected_status)
+    assert len(items) == 2
+    assert len({item["id"] for item in items}) == len(items)
+    assert [item["start_time"] for item in items] == sorted(item["start_time"] for item in items)
+
+
+@pytest.mark.datafile("tests/e2e/components/booking/list_all_booking_data.json")
+@pytest.mark.anyio
+async def test_list_all_bookings(async_client, request_data, expected_status, jwt_tokens, redis):
+    """
+    Проверяет постраничный обход всех бронирований и бронирований коворкинга
+    через endpoints /v1/bookings/list/all и /v1/bookings/list/coworking.
+    """
+    token = jwt_tokens.get("jwt")
+    coworking_id = await redis.hget("tokens", "coworking_id")
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    all_items = await fetch_all_pages(async_client, "/v1/bookings/list/all", request_data, headers, expected_status)
+    coworking_items = await fetch_all_pages(async_client, "/v1/bookings/list/coworking",
+                                            dict(request_data, coworking_id=coworking_id), headers, expected_status)
+    assert [item["id"] for item in all_items] == [item["id"] for item in coworking_items]
+    assert len(all_items) == 2
+
+
+@pytest.mark.anyio
+async def test_list_bookings_filters(async_client, jwt_tokens):
+    """
+    Проверяет фильтрацию бронирований по статусу и временному интервалу
+    через endpoint /v1/bookings/list/all.
+    """
+    token = jwt_tokens.get("jwt")
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    cases = [
+        ({"status": "FINISHED"}, 2),
+        ({"status": "WAITING"}, 0),
+        ({"status": "PROCESSING"}, 0),
+        ({"start": "2025-03-05T00:00:00"}, 1),
+        ({"start": "2025-03-04T09:30:00", "end": "2025-03-05T09:30:00"}, 2),
+        ({"start": "2025-03-04T10:00:00", "end": "2025-03-05T09:00:00"}, 0),
+        ({"status": "FINISHED", "end": "2025-03-05T00:00:00"}, 1),
+    ]
+    for params, expected_count in cases:
+        items = await fetch_all_pages(async_client, "/v1/bookings/list/all", dict(params, limit=1), headers, 200)
+        assert len(items) == expected_count, params
+        if "status" in params:
+            assert all(item["status"] == params["status"] for item in items)
+
+    response = await async_client.get(
+        "/v1/bookings/list/all",
+        params={"start": "2025-03-05T10:00:00", "end": "2025-03-05T09:00:00"},
+        headers=headers,
+    )
+    assert response.status_code == 422, response.text
+
+
+@pytest.mark.anyio
+async def test_list_bookings_invalid_cursor(async_client, jwt_tokens):
+    """
+    Проверяет, что некорректный курсор отклоняется с кодом 422.
+    """
+    token = jwt_tokens.get("jwt")
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    response = await async_client.get("/v1/bookings/list/all", params={"cursor": "broken"}, headers=headers)
+    assert response.status_code == 422
+
+
+@pytest.mark.anyio
+async def test_export_bookings(async_client, jwt_tokens):
+    """
+    Проверяет потоковую выгрузку бронирований через endpoint /v1/bookings/export
+    в форматах NDJSON и CSV: обе выгрузки содержат одни и те же бронирования.
+    """
+    token = jwt_tokens.get("jwt")
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+
+    response = await async_client.get("/v1/bookings/export", params={"format": "ndjson"}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    ndjson_rows = [json.loads(line) for line in response.text.splitlines()]
+
+    response = await async_client.get("/v1/bookings/export", params={"format": "csv"}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.headers["content-type"].startswith("text/csv")
+    csv_rows = list(csv.DictReader(io.StringIO(response.text)))
+
+    assert len(ndjson_rows) == 2
+    assert [row["id"] for row in ndjson_rows] == [row["id"] for row in csv_rows]
+    assert [";".join(row["workplaces"]) for row in ndjson_rows] == [row["workplaces"] for row in csv_rows]
+
+
 @pytest.mark.datafile("tests/e2e/components/booking/get_booking_data.json")
 @pytest.mark.anyio
 async def test_get_booking(async_client, request_data, expected_status, jwt_tokens, redis):
     """
     Проверяет получение бронирования через endpoint /v1/bookings/get,
     используя id бронирования, сохранённый в Redis.
-    (Пропущен из-за проблемы lazy-loading.)
     """
     token = jwt_tokens.get("jwt")
     booking_id = await redis.hget("tokens", "booking_id")
@@ -41,6 +248,21 @@ async def test_get_booking(async_client, request_data, expected_status, jwt_toke
     assert data.get("id") == booking_id
 
 
+@pytest.mark.anyio
+async def test_list_bookings_match_get(async_client, jwt_tokens):
+    """
+    Проверяет, что элементы /v1/bookings/list/user, собранные в JSON на стороне Postgres,
+    совпадают с ответом /v1/bookings/get для тех же бронирований.
+    """
+    headers = {"Authorization": f"Bearer {jwt_tokens['jwt']}"}
+    items = await fetch_all_pages(async_client, "/v1/bookings/list/user", {"limit": 10}, headers, 200)
+    assert items
+    for item in items:
+        response = await async_client.get("/v1/bookings/get", params={"booking_id": item["id"]}, headers=headers)
+        assert response.status_code == 200, response.text
+        assert response.json() == item
+
+
 @pytest.mark.datafile("tests/e2e/components/booking/update_booking_data.json")
 @pytest.mark.anyio
 async def test_update_booking(async_client, request_data, expected_status, jwt_tokens, redis):
@@ -62,6 +284,542 @@ async def test_update_booking(async_client, request_data, expected_status, jwt_t
     assert response.status_code == expected_status
 
 
+@pytest.mark.anyio
+async def test_pending_bookings(async_client, jwt_tokens, redis):
+    """
+    Проверяет endpoint /v1/bookings/pending: бронирование, которое начнётся
+    в ближайшие minutes минут, отдаётся один раз, а повторный запрос с курсором
+    since возвращает только новые бронирования. Забирать брони может только администратор.
+    """
+    token = jwt_tokens.get("jwt")
+    workplace_id = await redis.hget("tokens", "workplace_id")
+    headers = {"Authorization": f"Bearer {token}"} if token else {}
+    start_time = (datetime.now() + timedelta(minutes=30)).replace(microsecond=0)
+    request_data = {
+        "workplaces": [workplace_id],
+        "start_time": start_time.isoformat(),
+        "end_time": (start_time + timedelta(hours=1)).isoformat(),
+    }
+    response = await async_client.post("/v1/bookings/add", json=request_data, headers=headers)
+    assert response.status_code == 201, response.text
+    booking_id = response.json()["id"]
+
+    response = await async_client.post("/v1/bookings/pending", params={"minutes": 60})
+    assert response.status_code == 401, response.text
+    response = await async_client.post("/v1/user/auth", json={
+        "id": 700000005, "first_name": "Пользователь", "username": "pending_user", "auth_date": 1742720967,
+        "hash": "0" * 64,
+    })
+    assert response.status_code == 201, response.text
+    response = await async_client.post("/v1/bookings/pending", params={"minutes": 60},
+                                       headers={"Authorization": f"Bearer {response.json()['token']}"})
+    assert response.status_code == 403, response.text
+
+    response = await async_client.post("/v1/bookings/pending", params={"minutes": 10}, headers=headers)
+    assert response.status_code == 200, response.text
+    assert booking_id not in [item["id"] for item in response.json()["items"]]
+
+    response = await async_client.post("/v1/bookings/pending", params={"minutes": 60}, headers=headers)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert [item["id"] for item in data["items"]] == [booking_id]
+
+    response = await async_client.post("/v1/bookings/pending", params={"minutes": 60, "since": data["since"]},
+                                       headers=headers)
+    assert response.status_code == 200, response.text
+    assert response.json()["items"] == []
+    assert response.json()["since"] == data["since"]
+
+
+@pytest.mark.anyio
+async def test_add_booking_idempotency(async_client, jwt_tokens, redis):
+    """
+    Проверяет, что параллельные и повторные запросы /v1/bookings/add
+    с одинаковым Idempotency-Key создают одно бронирование и получают один и тот же ответ,
+    а тот же ключ с другим телом запроса отклоняется с 409.
+    """
+    token = jwt_tokens.get("jwt")
+    workplace_id = await redis.hget("tokens", "workplace_id")
+    headers = {"Authorization": f"Bearer {token}", "Idempotency-Key": "test-add-booking-idempotency"}
+    request_data = {
+        "workplaces": [workplace_id],
+        "start_time": "2025-03-06T09:00:00",
+        "end_time": "2025-03-06T10:00:00",
+    }
+
+    responses = await asyncio.gather(*[
+        async_client.post("/v1/bookings/add", json=request_data, headers=headers)
+        for _ in range(20)
+    ])
+    assert all(response.status_code == 201 for response in responses), [r.text for r in responses]
+    assert len({response.json()["id"] for response in responses}) == 1
+
+    response = await async_client.post("/v1/bookings/add", json=request_data, headers=headers)
+    assert response.status_code == 201, response.text
+    assert response.json() == responses[0].json()
+
+    response = await async_client.post("/v1/bookings/add", json=dict(request_data, end_time="2025-03-06T11:00:00"),
+                                       headers=headers)
+    assert response.status_code == 409, response.text
+
+
+@pytest.mark.anyio
+async def test_idempotency_lock_not_released_by_other_request(redis):
+    """
+    Проверяет, что запрос, чья блокировка Idempotency-Key истекла, не снимает
+    блокировку, которую уже взял другой запрос с тем же ключом.
+    """
+    storage = RedisStorage(redis)
+    await redis.set("idempotency:test:lock", "other-request")
+    assert not await storage.delete_if_equals("idempotency:test:lock", "expired-request")
+    assert await redis.get("idempotency:test:lock") == "other-request"
+    assert await storage.delete_if_equals("idempotency:test:lock", "other-request")
+    assert await redis.get("idempotency:test:lock") is None
+
+
+@pytest.mark.anyio
+async def test_hold_workplace(async_client, jwt_tokens, redis):
+    """
+    Проверяет холды через endpoints /v1/bookings/hold: пока место удерживается
+    одним пользователем, другой не может его удержать, забронировать
+    и не видит его в /v1/workplace/available. После снятия холда место снова доступно.
+    """
+    token = jwt_tokens.get("jwt")
+    workplace_id = await redis.hget("tokens", "workplace_id")
+    coworking_id = await redis.hget("tokens", "coworking_id")
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await async_client.post("/v1/user/auth", json={
+        "id": 1000000001,
+        "first_name": "Анна",
+        "last_name": "Петрова",
+        "username": "anna_petrova",
+        "photo_url": "https://t.me/i/userpic/320/anna_petrova.svg",
+        "auth_date": 1742720967,
+        "hash": "035da2b6954c0e8dfd8de9a10b6644152a66c03aadda72205fec89806e0fc9b3",
+    })
+    assert response.status_code == 201, response.text
+    other_headers = {"Authorization": f"Bearer {response.json()['token']}"}
+    request_data = {
+        "workplaces": [workplace_id],
+        "start_time": "2025-03-07T09:00:00",
+        "end_time": "2025-03-07T10:00:00",
+    }
+    available_params = {"coworking_id": coworking_id, "start": "2025-03-07T09:30:00", "end": "2025-03-07T11:00:00"}
+
+    response = await async_client.post("/v1/bookings/hold", json=request_data, headers=headers)
+    assert response.status_code == 201, response.text
+    hold_id = response.json()["id"]
+
+    response = await async_client.post("/v1/bookings/hold", json=request_data, headers=other_headers)
+    assert response.status_code == 403, response.text
+    response = await async_client.post("/v1/bookings/add", json=request_data, headers=other_headers)
+    assert response.status_code == 403, response.text
+
+    response = await async_client.get("/v1/workplace/available", params=available_params, headers=other_headers)
+    assert workplace_id not in [w["id"] for w in response.json()]
+    response = await async_client.get("/v1/workplace/available", params=available_params, headers=headers)
+    assert workplace_id in [w["id"] for w in response.json()]
+
+    response = await async_client.delete("/v1/bookings/hold", params={"hold_id": hold_id}, headers=other_headers)
+    assert response.status_code == 404, response.text
+    response = await async_client.delete("/v1/bookings/hold", params={"hold_id": hold_id}, headers=headers)
+    assert response.status_code == 204, response.text
+
+    response = await async_client.post("/v1/bookings/hold", json=request_data, headers=other_headers)
+    assert response.status_code == 201, response.text
+    response = await async_client.delete("/v1/bookings/hold", params={"hold_id": response.json()["id"]},
+                                         headers=other_headers)
+    assert response.status_code == 204, response.text
+
+
+@pytest.mark.anyio
+async def test_hold_validates_workplaces(async_client, jwt_tokens, redis):
+    """
+    Проверяет, что холд на несуществующее место возвращает 404,
+    а холд без мест — 422, и в Redis не остаётся наборов холдов.
+    """
+    headers = {"Authorization": f"Bearer {jwt_tokens['jwt']}"}
+    missing_id = "3f2b6c1e-8a4d-4b7e-9c1a-5d6e7f8a9b0c"
+    request_data = {"workplaces": [missing_id], "start_time": "2030-05-01T09:00:00",
+                    "end_time": "2030-05-01T10:00:00"}
+    response = await async_client.post("/v1/bookings/hold", json=request_data, headers=headers)
+    assert response.status_code == 404, response.text
+    assert not await redis.exists(f"holds:workplace:{missing_id}")
+
+    response = await async_client.post("/v1/bookings/hold", json=dict(request_data, workplaces=[]), headers=headers)
+    assert response.status_code == 422, response.text
+
+
+@pytest.mark.anyio
+async def test_add_bookings_bulk(async_client, jwt_tokens, redis):
+    """
+    Проверяет пакетное создание бронирований через endpoint /v1/bookings/bulk
+    в режимах «всё или ничего» и частичного успеха с результатом по каждому элементу.
+    """
+    token = jwt_tokens.get("jwt")
+    workplace_id = await redis.hget("tokens", "workplace_id")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    def item(start_time, end_time, workplaces=None):
+        return {"workplaces": workplaces or [workplace_id], "start_time": start_time, "end_time": end_time}
+
+    response = await async_client.post("/v1/bookings/bulk", headers=headers, json={"items": [
+        item("2025-03-04T09:00:00", "2025-03-04T10:00:00"),
+        item("2025-03-10T09:00:00", "2025-03-10T10:00:00"),
+    ]})
+    assert response.status_code == 200, response.text
+    assert [i["status"] for i in response.json()["items"]] == ["CONFLICT", "SKIPPED"]
+
+    response = await async_client.post("/v1/bookings/bulk", headers=headers, json={"atomic": False, "items": [
+        item("2025-03-10T09:00:00", "2025-03-10T10:00:00"),
+        item("2025-03-10T09:30:00", "2025-03-10T10:30:00"),
+        item("2025-03-04T09:00:00", "2025-03-04T10:00:00"),
+        item("2025-03-10T12:00:00", "2025-03-10T13:00:00", ["f3047cd8-56e6-46e4-ac2d-757550c1f62a"]),
+    ]})
+    assert response.status_code == 200, response.text
+    items = response.json()["items"]
+    assert [i["status"] for i in items] == ["CREATED", "CONFLICT", "CONFLICT", "NOT_FOUND"]
+    assert items[0]["booking"]["workplaces"][0]["id"] == workplace_id
+
+    response = await async_client.post("/v1/bookings/bulk", headers=headers, json={"items": [
+        item(f"2025-03-{day}T09:00:00", f"2025-03-{day}T10:00:00") for day in range(11, 16)
+    ]})
+    assert response.status_code == 200, response.text
+    items = response.json()["items"]
+    assert [i["status"] for i in items] == ["CREATED"] * 5
+    assert len({i["booking"]["id"] for i in items}) == 5
+
+    response = await async_client.post("/v1/bookings/bulk", headers=headers, json={"items": [
+        item("2025-03-16T09:00:00", "2025-03-16T10:00:00", [workplace_id, workplace_id]),
+    ]})
+    assert response.status_code == 422, response.text
+
+
+@pytest.mark.anyio
+async def test_add_bookings_bulk_race(async_client, jwt_tokens, redis, monkeypatch):
+    """
+    Проверяет, что если место заняли между проверкой и вставкой, /v1/bookings/bulk без atomic
+    помечает конфликтный элемент CONFLICT и создаёт остальные, а в режиме atomic отвечает 403.
+    """
+    token = jwt_tokens.get("jwt")
+    workplace_id = await redis.hget("tokens", "workplace_id")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    async def no_conflicts(self, bookings, statuses):
+        return []
+
+    # проверка пересечений ничего не находит, как при гонке с параллельной бронью
+    monkeypatch.setattr(BookingRepository, "_find_conflicts", no_conflicts)
+
+    def item(start_time, end_time):
+        return {"workplaces": [workplace_id], "start_time": start_time, "end_time": end_time}
+
+    response = await async_client.post("/v1/bookings/bulk", headers=headers, json={"atomic": False, "items": [
+        item("2025-03-17T09:00:00", "2025-03-17T10:00:00"),
+        item("2025-03-04T09:00:00", "2025-03-04T10:00:00"),
+        item("2025-03-18T09:00:00", "2025-03-18T10:00:00"),
+    ]})
+    assert response.status_code == 200, response.text
+    items = response.json()["items"]
+    assert [i["status"] for i in items] == ["CREATED", "CONFLICT", "CREATED"]
+
+    response = await async_client.post("/v1/bookings/bulk", headers=headers, json={"items": [
+        item("2025-03-19T09:00:00", "2025-03-19T10:00:00"),
+        item("2025-03-17T09:00:00", "2025-03-17T10:00:00"),
+    ]})
+    assert response.status_code == 403, response.text
+
+    response = await async_client.get("/v1/bookings/get", params={"booking_id": items[0]["booking"]["id"]},
+                                      headers=headers)
+    assert response.status_code == 200, response.text
+
+
+@pytest.mark.anyio
+async def test_quote_bookings(async_client, jwt_tokens, redis):
+    """
+    Проверяет расчёт цен для нескольких вариантов брони через endpoint /v1/bookings/quote
+    и то, что расчёт не создаёт бронирований.
+    """
+    token = jwt_tokens.get("jwt")
+    workplace_id = await redis.hget("tokens", "workplace_id")
+    booking_id = await redis.hget("tokens", "booking_id")
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await async_client.get("/v1/bookings/get", params={"booking_id": booking_id}, headers=headers)
+    price_per_hour = response.json()["workplaces"][0]["tariff"]["price_per_hour"]
+    params = {"limit": 200}
+    bookings_before = await fetch_all_pages(async_client, "/v1/bookings/list/user", params, headers, 200)
+
+    response = await async_client.post("/v1/bookings/quote", headers=headers, json={"items": [
+        {"workplaces": [workplace_id], "start_time": "2025-03-04T09:00:00", "end_time": "2025-03-04T10:00:00"},
+        {"workplaces": [workplace_id], "start_time": "2025-03-20T09:00:00", "end_time": "2025-03-20T11:30:00"},
+        {"workplaces": ["f3047cd8-56e6-46e4-ac2d-757550c1f62a"],
+         "start_time": "2025-03-20T09:00:00", "end_time": "2025-03-20T10:00:00"},
+    ]})
+    assert response.status_code == 200, response.text
+    items = response.json()["items"]
+    assert [item.get("total_price") for item in items] == [price_per_hour, price_per_hour * 5 // 2, None]
+    assert items[2]["detail"] == "Workplaces not found"
+
+    bookings_after = await fetch_all_pages(async_client, "/v1/bookings/list/user", params, headers, 200)
+    assert len(bookings_after) == len(bookings_before)
+
+    response = await async_client.post("/v1/bookings/quote", headers=headers, json={"items": []})
+    assert response.status_code == 422, response.text
+
+
+@pytest.mark.anyio
+async def test_booking_series(async_client, jwt_tokens, redis):
+    """
+    Проверяет создание повторяющейся серии бронирований через endpoint /v1/bookings/series:
+    серия разворачивается в отдельные брони, пересечение любого вхождения отклоняет всю серию,
+    а удаление серии снимает её будущие брони.
+    """
+    token = jwt_tokens.get("jwt")
+    workplace_id = await redis.hget("tokens", "workplace_id")
+    headers = {"Authorization": f"Bearer {token}"}
+    start_time = (datetime.now() + timedelta(days=30)).replace(hour=9, minute=0, second=0, microsecond=0)
+    request_data = {
+        "workplaces": [workplace_id],
+        "start_time": start_time.isoformat(),
+        "end_time": (start_time + timedelta(hours=2)).isoformat(),
+        "weekdays": [0, 1, 2, 3, 4],
+        "count": 15,
+    }
+
+    response = await async_client.post("/v1/bookings/series", json=request_data, headers=headers)
+    assert response.status_code == 201, response.text
+    series = response.json()
+    assert len(series["bookings"]) == 15
+    assert all(datetime.fromisoformat(b["start_time"]).weekday() < 5 for b in series["bookings"])
+
+    response = await async_client.post("/v1/bookings/series", json=dict(request_data, count=3), headers=headers)
+    assert response.status_code == 403, response.text
+
+    response = await async_client.delete("/v1/bookings/series", params={"series_id": series["id"]}, headers=headers)
+    assert response.status_code == 204, response.text
+    response = await async_client.get("/v1/bookings/get", params={"booking_id": series["bookings"][0]["id"]},
+                                      headers=headers)
+    assert response.status_code == 404, response.text
+
+    response = await async_client.post("/v1/bookings/series", json=dict(request_data, count=3), headers=headers)
+    assert response.status_code == 201, response.text
+
+    # до until не попадает ни одного выбранного дня недели
+    empty_series = dict(request_data, weekdays=[(start_time.weekday() + 6) % 7], count=None,
+                        until=(start_time + timedelta(days=1)).isoformat())
+    response = await async_client.post("/v1/bookings/series", json=empty_series, headers=headers)
+    assert response.status_code == 422, response.text
+    assert response.json()["detail"] == "Series has no occurrences"
+
+
+@pytest.mark.anyio
+async def test_suggest_booking_slots(async_client, jwt_tokens, redis):
+    """
+    Проверяет endpoint /v1/bookings/suggest: для занятого места предлагаются
+    ближайшие свободные интервалы той же длины и свободные места того же тарифа.
+    """
+    token = jwt_tokens.get("jwt")
+    workplace_id = await redis.hget("tokens", "workplace_id")
+    coworking_id = await redis.hget("tokens", "coworking_id")
+    headers = {"Authorization": f"Bearer {token}"}
+
+    response = await async_client.get("/v1/workplace/list", params={"coworking_id": coworking_id}, headers=headers)
+    assert response.status_code == 200, response.text
+    tariff_id = response.json()[0]["tariff"]["id"]
+    response = await async_client.post("/v1/workplace/upsert", headers=headers, json=[{
+        "coworking_id": coworking_id,
+        "tariff_id": tariff_id,
+        "number": 15,
+        "name": "Стол 15",
+        "tags": [],
+        "x_cor": 38.21,
+        "y_cor": 55.75,
+    }])
+    assert response.status_code == 201, response.text
+    alternative_id = response.json()[0]["id"]
+
+    params = {"workplaces": [workplace_id], "start": "2025-03-04T09:00:00", "end": "2025-03-04T10:00:00", "limit": 2}
+    response = await async_client.get("/v1/bookings/suggest", params=params, headers=headers)
+    assert response.status_code == 200, response.text
+    data = response.json()
+    assert data["slots"] == [
+        {"start_time": "2025-03-04T08:00:00", "end_time": "2025-03-04T09:00:00"},
+        {"start_time": "2025-03-04T10:00:00", "end_time": "2025-03-04T11:00:00"},
+    ]
+    assert [w["id"] for w in data["alternatives"]] == [alternative_id]
+
+    params["workplaces"] = ["f3047cd8-56e6-46e4-ac2d-757550c1f62a"]
+    response = await async_client.get("/v1/bookings/suggest", params=params, headers=headers)
+    assert response.status_code == 404, response.text
+
+
+@pytest.mark.anyio
+async def test_find_workplace_cluster(async_client, jwt_tokens, redis):
+    """
+    Проверяет подбор группы соседних свободных мест через endpoint /v1/workplace/cluster
+    и то, что после изменения планировки поиск учитывает новые места.
+    """
+    token = jwt_tokens.get("jwt")
+    workplace_id = await redis.hget("tokens", "workplace_id")
+    coworking_id = await redis.hget("tokens", "coworking_id")
+    headers = {"Authorization": f"Bearer {token}"}
+    params = {"coworking_id": coworking_id, "start": "2025-04-01T09:00:00", "end": "2025-04-01T10:00:00"}
+
+    response = await async_client.get("/v1/workplace/cluster", params=dict(params, size=2), headers=headers)
+    assert response.status_code == 200, response.text
+    pair = response.json()
+    assert len(pair) == 2 and workplace_id in [w["id"] for w in pair]
+
+    response = await async_client.post("/v1/workplace/upsert", headers=headers, json=[{
+        "coworking_id": coworking_id,
+        "tariff_id": pair[0]["tariff"]["id"],
+        "number": 16,
+        "name": "Стол 16",
+        "tags": [],
+        "x_cor": 90.0,
+        "y_cor": 10.0,
+    }])
+    assert response.status_code == 201, response.text
+    far_id = response.json()[0]["id"]
+
+    response = await async_client.get("/v1/workplace/cluster", params=dict(params, size=2), headers=headers)
+    assert sorted(w["id"] for w in response.json()) == sorted(w["id"] for w in pair)
+    response = await async_client.get("/v1/workplace/cluster", params=dict(params, size=3), headers=headers)
+    assert far_id in [w["id"] for w in response.json()]
+    response = await async_client.get("/v1/workplace/cluster", params=dict(params, size=4), headers=headers)
+    assert response.json() == []
+
+    response = await async_client.get("/v1/workplace/cluster", headers=headers, params=dict(
+        params, size=2, coworking_id="f3047cd8-56e6-46e4-ac2d-757550c1f62a"))
+    assert response.status_code == 404, response.text
+
+
+@pytest.mark.anyio
+async def test_list_coworking_multi_seat_booking(async_client, jwt_tokens, redis):
+    """
+    Проверяет, что бронь на несколько мест попадает в календарь коворкинга
+    /v1/bookings/list/coworking ровно один раз.
+    """
+    token = jwt_tokens.get("jwt")
+    coworking_id = await redis.hget("tokens", "coworking_id")
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await async_client.get("/v1/workplace/list", params={"coworking_id": coworking_id}, headers=headers)
+    assert response.status_code == 200, response.text
+    workplaces = [w["id"] for w in response.json()][:2]
+
+    response = await async_client.post("/v1/bookings/add", headers=headers, json={
+        "workplaces": workplaces,
+        "start_time": "2030-06-03T09:00:00",
+        "end_time": "2030-06-03T10:00:00",
+    })
+    assert response.status_code == 201, response.text
+    booking_id = response.json()["id"]
+
+    params = {"coworking_id": coworking_id, "limit": 200, "start": "2030-06-03T00:00:00", "end": "2030-06-04T00:00:00"}
+    items = await fetch_all_pages(async_client, "/v1/bookings/list/coworking", params, headers, 200)
+    assert [item["id"] for item in items] == [booking_id]
+    assert len(items[0]["workplaces"]) == 2
+
+
+@pytest.mark.anyio
+async def test_booking_waitlist(async_client, jwt_tokens, redis):
+    """
+    Проверяет лист ожидания через endpoints /v1/bookings/waitlist: после отмены брони
+    место достаётся первому ожидающему, чей слот освободился, а бронь попадает
+    в /v1/bookings/waitlist/promoted для уведомления.
+    """
+    token = jwt_tokens.get("jwt")
+    workplace_id = await redis.hget("tokens", "workplace_id")
+    headers = {"Authorization": f"Bearer {token}"}
+    response = await async_client.post("/v1/user/auth", json={
+        "id": 1000000001,
+        "first_name": "Анна",
+        "last_name": "Петрова",
+        "username": "anna_petrova",
+        "photo_url": "https://t.me/i/userpic/320/anna_petrova.svg",
+        "auth_date": 1742720967,
+        "hash": "035da2b6954c0e8dfd8de9a10b6644152a66c03aadda72205fec89806e0fc9b3",
+    })
+    assert response.status_code == 201, response.text
+    other_headers = {"Authorization": f"Bearer {response.json()['token']}"}
+
+    response = await async_client.post("/v1/bookings/add", headers=headers, json={
+        "workplaces": [workplace_id],
+        "start_time": "2030-05-06T09:00:00",
+        "end_time": "2030-05-06T11:00:00",
+    })
+    assert response.status_code == 201, response.text
+    booking_id = response.json()["id"]
+
+    response = await async_client.post("/v1/bookings/waitlist", headers=other_headers, json={
+        "workplace_id": workplace_id,
+        "start_time": "2030-05-07T09:00:00",
+        "end_time": "2030-05-07T10:00:00",
+    })
+    assert response.status_code == 403, response.text
+
+    response = await async_client.post("/v1/bookings/waitlist", headers=other_headers, json={
+        "workplace_id": workplace_id,
+        "start_time": "2030-05-06T09:00:00",
+        "end_time": "2030-05-06T10:00:00",
+    })
+    assert response.status_code == 201, response.text
+    first_entry_id = response.json()["id"]
+    response = await async_client.post("/v1/bookings/waitlist", headers=headers, json={
+        "workplace_id": workplace_id,
+        "start_time": "2030-05-06T09:00:00",
+        "end_time": "2030-05-06T11:00:00",
+    })
+    assert response.status_code == 201, response.text
+    second_entry_id = response.json()["id"]
+
+    response = await async_client.get("/v1/bookings/waitlist/promoted", headers=headers)
+    if response.json():
+        await async_client.delete("/v1/bookings/waitlist/promoted", headers=headers,
+                                  params={"booking_id": [b["id"] for b in response.json()]})
+    response = await async_client.delete("/v1/bookings/delete", params={"booking_id": booking_id}, headers=headers)
+    assert response.status_code == 204, response.text
+
+    response = await async_client.get("/v1/bookings/waitlist/promoted")
+    assert response.status_code == 401, response.text
+    response = await async_client.get("/v1/bookings/waitlist/promoted", headers=other_headers)
+    assert response.status_code == 403, response.text
+
+    response = await async_client.get("/v1/bookings/waitlist/promoted", headers=headers)
+    assert response.status_code == 200, response.text
+    promoted = response.json()
+    assert [(b["user_id"], b["start_time"], b["end_time"]) for b in promoted] == [
+        (1000000001, "2030-05-06T09:00:00", "2030-05-06T10:00:00")
+    ]
+
+    # без подтверждения доставки уведомление выдаётся повторно
+    response = await async_client.get("/v1/bookings/waitlist/promoted", headers=headers)
+    assert [b["id"] for b in response.json()] == [promoted[0]["id"]]
+    response = await async_client.delete("/v1/bookings/waitlist/promoted", params={"booking_id": promoted[0]["id"]},
+                                         headers=other_headers)
+    assert response.status_code == 403, response.text
+    response = await async_client.delete("/v1/bookings/waitlist/promoted", params={"booking_id": promoted[0]["id"]},
+                                         headers=headers)
+    assert response.status_code == 204, response.text
+    response = await async_client.get("/v1/bookings/waitlist/promoted", headers=headers)
+    assert response.json() == []
+
+    response = await async_client.get("/v1/bookings/get", params={"booking_id": promoted[0]["id"]},
+                                      headers=other_headers)
+    assert response.status_code == 200, response.text
+
+    # первая запись исполнена, вторая пересекается с новой бронью и остаётся в очереди
+    response = await async_client.delete("/v1/bookings/waitlist", params={"entry_id": first_entry_id},
+                                         headers=other_headers)
+    assert response.status_code == 404, response.text
+    response = await async_client.delete("/v1/bookings/waitlist", params={"entry_id": second_entry_id},
+                                         headers=other_headers)
+    assert response.status_code == 404, response.text
+    response = await async_client.delete("/v1/bookings/waitlist", params={"entry_id": second_entry_id},
+                                         headers=headers)
+    assert response.status_code == 204, response.text
+
+
 @pytest.mark.datafile("tests/e2e/components/booking/delete_booking_data.json")
 @pytest.mark.anyio
 async def test_delete_booking(async_client, request_data, expected_status, jwt_tokens, redis):
@@ -75,3 +833,23 @@ async def test_delete_booking(async_client, request_data, expected_status, jwt_t
     url = f"/v1/bookings/delete?booking_id={booking_id}"
     response = await async_client.delete(url, headers=headers)
     assert response.status_code == expected_status
+
+
+@pytest.mark.anyio
+async def test_delete_coworking_with_bookings(async_client, jwt_tokens, redis):
+    """
+    Проверяет, что коворкинг с бронями не удаляется через /v1/coworking/{id}/delete:
+    возвращается 409, а история броней сохраняется.
+    """
+    headers = {"Authorization": f"Bearer {jwt_tokens['jwt']}"}
+    coworking_id = await redis.hget("tokens", "coworking_id")
+    params = {"coworking_id": coworking_id, "limit": 1}
+    bookings = (await async_client.get("/v1/bookings/list/coworking", params=params, headers=headers)).json()
+    assert bookings["items"]
+
+    response = await async_client.delete(f"/v1/coworking/{coworking_id}/delete", headers=headers)
+    assert response.status_code == 409, response.text
+    assert response.json()["detail"] == "Coworking has bookings"
+    response = await async_client.get("/v1/bookings/get", params={"booking_id": bookings["items"][0]["id"]},
+                                      headers=headers)
+    assert response.status_code == 200, response.text
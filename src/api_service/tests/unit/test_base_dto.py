@@ -1,5 +1,9 @@
 import datetime
+import json
+import uuid
+
 import pytest
+from core.responses import FastJSONResponse
 from domain.dto.base import BaseDTO
 
 
@@ -47,3 +51,30 @@ def test_validate_fields_failure():
     earlier = now - datetime.timedelta(hours=1)
     with pytest.raises(ValueError, match="start_time must be less than end_time"):
         DummyBookingDTO(start_time=now, end_time=earlier)
+
+
+def test_base_dto_dict_matches_json_round_trip():
+    """
+    Проверяет, что dict() отдаёт то же, что и прежний путь json.loads(dto.json()):
+    даты и UUID строками, вложенные None исключены, а FastJSONResponse кодирует это без потерь.
+    """
+
+    class NestedDTO(BaseDTO):
+        id: uuid.UUID
+        note: str = None
+
+    class DummyDTO(BaseDTO):
+        id: uuid.UUID
+        name: str
+        created_at: datetime.datetime
+        items: list[NestedDTO]
+
+    instance = DummyDTO(
+        id=uuid.UUID("f3047cd8-56e6-46e4-ac2d-757550c1f62a"),
+        name="Стол 14",
+        created_at=datetime.datetime(2025, 3, 4, 9, 0, 0),
+        items=[NestedDTO(id=uuid.UUID("57f25aa0-ea44-4aa6-892f-1c3ebf1cab1b"))],
+    )
+    expected = json.loads(instance.model_dump_json(exclude_none=True))
+    assert instance.dict() == expected
+    assert json.loads(FastJSONResponse(instance.dict()).body) == expected
@@ -27,6 +27,7 @@ def test_booking_dto_orm_conversion():
             name="VIP",
             color="#4CA50F",
             price_per_hour=750,
+            pricing_rules=None,
             created_at=datetime.datetime(2025, 3, 4, 9, 0, 0)
         ),
         created_at=datetime.datetime(2025, 3, 4, 9, 0, 0)
@@ -74,3 +75,15 @@ def test_booking_update_dto():
     """
     dto = BookingUpdateDTO(start_time=None, end_time=None)
     assert dto.start_time is None and dto.end_time is None
+
+
+def test_booking_create_dto_rejects_duplicate_workplaces():
+    """
+    Проверяет, что BookingCreateDTO не принимает одно и то же место дважды.
+    """
+    with pytest.raises(ValueError, match="workplaces must not contain duplicates"):
+        BookingCreateDTO(
+            workplaces=["57f25aa0-ea44-4aa6-892f-1c3ebf1cab1b", "57f25aa0-ea44-4aa6-892f-1c3ebf1cab1b"],
+            start_time=datetime.datetime(2025, 3, 4, 9, 0, 0),
+            end_time=datetime.datetime(2025, 3, 4, 10, 0, 0),
+        )
@@ -0,0 +1,24 @@
+from infrastructure.database.redis.cache import LocalCache, MISSING
+
+
+def test_local_cache_ttl_and_eviction(monkeypatch):
+    """
+    Проверяет, что L1-кэш отдаёт запись до истечения TTL, вытесняет самые старые записи
+    и сбрасывает все поля ключа при инвалидации.
+    """
+    now = [100.0]
+    monkeypatch.setattr("infrastructure.database.redis.cache.time.monotonic", lambda: now[0])
+    cache = LocalCache(max_size=2, ttl=5.0)
+    cache.put("coworkings", "0:10", [1])
+    cache.put("coworkings", "10:10", [2])
+    assert cache.get("coworkings", "0:10") == [1]
+
+    cache.put("tariffs", "", None)
+    assert cache.get("coworkings", "10:10") is MISSING
+    assert cache.get("tariffs", "") is None
+
+    cache.invalidate("coworkings")
+    assert cache.get("coworkings", "0:10") is MISSING
+
+    now[0] += 5.0
+    assert cache.get("tariffs", "") is MISSING
@@ -35,6 +35,7 @@ def test_coworking_tariff_dto_orm_conversion():
         name="VIP",
         color="#4CA50F",
         price_per_hour=750,
+        pricing_rules=None,
         created_at=datetime.datetime(2025, 3, 4, 9, 0, 0)
     )
     dto = CoworkingTariffDTO.orm_to_dto(dummy_orm)
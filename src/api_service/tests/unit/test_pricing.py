@@ -0,0 +1,52 @@
+import datetime
+
+from core.pricing import quote_price
+
+
+RULES = {
+    "peak_start": 9,
+    "peak_end": 18,
+    "peak_percent": 150,
+    "off_peak_percent": 80,
+    "weekend_percent": 50,
+}
+
+
+def test_quote_price_flat_tariff():
+    """
+    Проверяет, что без правил цена считается как price_per_hour * часы по всем местам
+    и округляется вниз только один раз, по итоговой сумме.
+    """
+    start = datetime.datetime(2025, 3, 5, 9, 0)
+    assert quote_price([(100, None), (200, None)], start, start + datetime.timedelta(hours=2)) == 600
+    assert quote_price([(100, None)], start, start + datetime.timedelta(minutes=20)) == 33
+    assert quote_price([(100, None)] * 3, start, start + datetime.timedelta(minutes=20)) == 100
+
+
+def test_quote_price_peak_and_weekend():
+    """
+    Проверяет пиковые и непиковые часы в будни, выходной тариф и бронь,
+    захватывающую несколько суток.
+    """
+    wednesday = datetime.datetime(2025, 3, 5, 8, 0)
+    # час вне пика по 80 и час в пике по 150
+    assert quote_price([(100, RULES)], wednesday, wednesday + datetime.timedelta(hours=2)) == 230
+
+    saturday = datetime.datetime(2025, 3, 8, 10, 0)
+    assert quote_price([(100, RULES)], saturday, saturday + datetime.timedelta(hours=3)) == 150
+
+    # пятница 18:00 - понедельник 09:00: 6 часов вне пика, двое суток выходных, 9 часов вне пика
+    friday = datetime.datetime(2025, 3, 7, 18, 0)
+    monday = datetime.datetime(2025, 3, 10, 9, 0)
+    assert quote_price([(100, RULES)], friday, monday) == 15 * 80 + 48 * 50
+
+
+def test_quote_price_min_block_and_seat_discount():
+    """
+    Проверяет минимальный оплачиваемый блок и скидку за количество мест.
+    """
+    rules = {"min_minutes": 60, "seat_discounts": [{"min_seats": 2, "percent": 10}, {"min_seats": 4, "percent": 25}]}
+    start = datetime.datetime(2025, 3, 5, 9, 0)
+    assert quote_price([(100, rules)], start, start + datetime.timedelta(minutes=15)) == 100
+    assert quote_price([(100, rules)] * 2, start, start + datetime.timedelta(hours=1)) == 180
+    assert quote_price([(100, rules)] * 4, start, start + datetime.timedelta(hours=1)) == 300
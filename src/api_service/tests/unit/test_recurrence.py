@@ -0,0 +1,42 @@
+import datetime
+
+import pytest
+
+from core.recurrence import expand_weekly
+
+
+START = datetime.datetime(2025, 3, 5, 9, 0)  # среда
+END = datetime.datetime(2025, 3, 5, 10, 0)
+
+
+def test_expand_weekly_by_count():
+    """
+    Проверяет разворачивание серии по будним дням с ограничением по количеству:
+    первое вхождение не раньше начала серии, длительность сохраняется.
+    """
+    occurrences = expand_weekly(START, END, weekdays=[0, 1, 2, 3, 4], interval=1, count=4)
+    assert [start.date().isoformat() for start, _ in occurrences] == [
+        "2025-03-05", "2025-03-06", "2025-03-07", "2025-03-10",
+    ]
+    assert all(end - start == datetime.timedelta(hours=1) for start, end in occurrences)
+
+
+def test_expand_weekly_by_until_with_interval():
+    """
+    Проверяет серию раз в две недели по понедельникам и средам до указанной даты включительно.
+    """
+    occurrences = expand_weekly(START, END, weekdays=[2, 0], interval=2,
+                                until=datetime.datetime(2025, 4, 2, 9, 0))
+    assert [start.date().isoformat() for start, _ in occurrences] == [
+        "2025-03-05", "2025-03-17", "2025-03-19", "2025-03-31", "2025-04-02",
+    ]
+
+
+def test_expand_weekly_limits():
+    """
+    Проверяет, что серия без until и count и слишком длинная серия отклоняются.
+    """
+    with pytest.raises(ValueError):
+        expand_weekly(START, END, weekdays=[2], interval=1)
+    with pytest.raises(ValueError):
+        expand_weekly(START, END, weekdays=[0, 1, 2, 3, 4, 5, 6], interval=1, count=10, max_occurrences=5)
@@ -0,0 +1,29 @@
+from core.security import VerifiedTokenCache
+
+
+def test_verified_token_cache_expiry_and_revocation(monkeypatch):
+    """
+    Проверяет, что запись о проверенном токене живёт не дольше exp токена и TTL кэша,
+    а отзыв по tg_id убирает все токены пользователя.
+    """
+    now = [1000.0]
+    monkeypatch.setattr("core.security.time.time", lambda: now[0])
+    cache = VerifiedTokenCache(max_size=2, ttl=60.0)
+    cache.put("a", 1, exp=1010)
+    cache.put("b", 1, exp=2000)
+    assert cache.get("a") == 1
+
+    now[0] = 1010.0
+    assert cache.get("a") is None
+    assert cache.get("b") == 1
+
+    now[0] = 1060.0
+    assert cache.get("b") is None
+
+    cache.put("c", 2, exp=2000)
+    cache.put("d", 2, exp=2000)
+    cache.put("e", 3, exp=2000)
+    assert cache.get("c") is None
+    cache.revoke(2)
+    assert cache.get("d") is None
+    assert cache.get("e") == 3
@@ -0,0 +1,50 @@
+import random
+
+from core.spatial import SpatialGrid, FloorPlanCache
+
+
+def brute_force_nearest(points, x, y, k, allowed):
+    distances = sorted(((px - x) ** 2 + (py - y) ** 2, point_id) for point_id, px, py in points if point_id in allowed)
+    return [point_id for _, point_id in distances[:k]]
+
+
+def test_nearest_matches_brute_force():
+    """
+    Проверяет, что поиск ближайших соседей по сетке совпадает с полным перебором
+    на случайной планировке, включая фильтр по свободным местам.
+    """
+    rng = random.Random(37)
+    points = [(i, rng.uniform(0, 100), rng.uniform(0, 60)) for i in range(2000)]
+    allowed = {i for i in range(2000) if i % 3}
+    grid = SpatialGrid(points)
+    for _ in range(50):
+        x, y = rng.uniform(0, 100), rng.uniform(0, 60)
+        assert [point_id for _, point_id in grid.nearest(x, y, 5, allowed)] == brute_force_nearest(points, x, y, 5, allowed)
+
+
+def test_find_cluster_picks_tight_group():
+    """
+    Проверяет, что для группы из трёх мест выбираются три стоящих рядом свободных места,
+    а при нехватке свободных мест возвращается пустой список.
+    """
+    points = [(1, 0, 0), (2, 50, 50), (3, 51, 50), (4, 50, 51), (5, 100, 0), (6, 10, 10)]
+    grid = SpatialGrid(points)
+    assert sorted(grid.find_cluster({1, 2, 3, 4, 5, 6}, 3)) == [2, 3, 4]
+    assert sorted(grid.find_cluster({1, 2, 5, 6}, 3)) == [1, 2, 6]
+    assert grid.find_cluster({1, 2}, 3) == []
+
+
+def test_floor_plan_cache_versions():
+    """
+    Проверяет, что кэш планировок отдаёт сетку только для актуальной версии
+    и вытесняет самые старые записи.
+    """
+    cache = FloorPlanCache(max_size=2)
+    grid = SpatialGrid([(1, 0, 0)])
+    cache.put("a", 1, grid)
+    assert cache.get("a", 1) is grid
+    assert cache.get("a", 2) is None
+    cache.put("b", 1, grid)
+    cache.put("c", 1, grid)
+    assert cache.get("a", 1) is None
+    assert cache.get("c", 1) is grid
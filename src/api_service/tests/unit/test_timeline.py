@@ -0,0 +1,85 @@
+import base64
+import datetime
+
+from core.timeline import slots_per_day, occupancy_bitmap, encode_bitmap, free_intervals, nearest_free_slots
+
+
+DAY_START = datetime.datetime(2025, 3, 4)
+
+
+def test_slots_per_day():
+    """
+    Проверяет количество слотов в сутках, в том числе когда длина слота не делит сутки нацело.
+    """
+    assert slots_per_day(30) == 48
+    assert slots_per_day(60) == 24
+    assert slots_per_day(7) == 206
+
+
+def test_occupancy_bitmap_marks_overlapping_slots():
+    """
+    Проверяет, что бронь с 9:00 до 10:00 занимает слоты 18 и 19 при шаге 30 минут,
+    а бронь, частично задевающая слот, помечает его занятым.
+    """
+    intervals = [
+        (datetime.datetime(2025, 3, 4, 9, 0), datetime.datetime(2025, 3, 4, 10, 0)),
+        (datetime.datetime(2025, 3, 4, 12, 10), datetime.datetime(2025, 3, 4, 12, 20)),
+    ]
+    mask = occupancy_bitmap(intervals, DAY_START, 30, 48)
+    assert [i for i in range(48) if mask >> i & 1] == [18, 19, 24]
+
+
+def test_occupancy_bitmap_clips_to_day():
+    """
+    Проверяет, что интервалы, выходящие за границы суток, обрезаются по первому и последнему слоту.
+    """
+    intervals = [
+        (datetime.datetime(2025, 3, 3, 22, 0), datetime.datetime(2025, 3, 4, 1, 0)),
+        (datetime.datetime(2025, 3, 4, 23, 0), datetime.datetime(2025, 3, 5, 2, 0)),
+    ]
+    mask = occupancy_bitmap(intervals, DAY_START, 60, 24)
+    assert [i for i in range(24) if mask >> i & 1] == [0, 23]
+
+
+def test_encode_bitmap():
+    """
+    Проверяет кодирование маски в base64: младший бит первого байта соответствует первому слоту.
+    """
+    encoded = encode_bitmap(0b1 | 0b1 << 9, 48)
+    raw = base64.b64decode(encoded)
+    assert len(raw) == 6
+    assert raw[0] == 0b1 and raw[1] == 0b10
+
+
+def test_free_intervals_merges_overlapping_bookings():
+    """
+    Проверяет, что пересекающиеся и стыкующиеся брони склеиваются,
+    а свободные окна считаются только внутри заданного диапазона.
+    """
+    busy = [
+        (datetime.datetime(2025, 3, 4, 9, 0), datetime.datetime(2025, 3, 4, 10, 0)),
+        (datetime.datetime(2025, 3, 4, 9, 30), datetime.datetime(2025, 3, 4, 11, 0)),
+        (datetime.datetime(2025, 3, 4, 11, 0), datetime.datetime(2025, 3, 4, 12, 0)),
+        (datetime.datetime(2025, 3, 4, 23, 0), datetime.datetime(2025, 3, 5, 1, 0)),
+    ]
+    gaps = free_intervals(busy, DAY_START, DAY_START + datetime.timedelta(days=1))
+    assert gaps == [
+        (DAY_START, datetime.datetime(2025, 3, 4, 9, 0)),
+        (datetime.datetime(2025, 3, 4, 12, 0), datetime.datetime(2025, 3, 4, 23, 0)),
+    ]
+
+
+def test_nearest_free_slots():
+    """
+    Проверяет подбор ближайших к желаемому времени свободных слотов той же длины.
+    """
+    busy = [
+        (datetime.datetime(2025, 3, 4, 8, 30), datetime.datetime(2025, 3, 4, 10, 0)),
+        (datetime.datetime(2025, 3, 4, 10, 30), datetime.datetime(2025, 3, 4, 12, 0)),
+    ]
+    slots = nearest_free_slots(busy, DAY_START, DAY_START + datetime.timedelta(days=1),
+                               datetime.timedelta(hours=1), datetime.datetime(2025, 3, 4, 9, 0), limit=2)
+    assert slots == [
+        (datetime.datetime(2025, 3, 4, 7, 30), datetime.datetime(2025, 3, 4, 8, 30)),
+        (datetime.datetime(2025, 3, 4, 12, 0), datetime.datetime(2025, 3, 4, 13, 0)),
+    ]
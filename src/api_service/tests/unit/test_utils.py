@@ -1,4 +1,9 @@
-from core.utils import is_valid_postgres_uri
+import uuid
+import datetime
+
+import pytest
+
+from core.utils import is_valid_postgres_uri, encode_cursor, decode_cursor
 
 
 def test_is_valid_postgres_uri():
@@ -23,3 +28,19 @@ def test_is_valid_postgres_uri():
 
     for uri in invalid_uri_values:
         assert is_valid_postgres_uri(uri) is False
+
+
+def test_cursor_round_trip():
+    start_time = datetime.datetime(2025, 3, 4, 9, 0, 0, 123456)
+    booking_id = uuid.UUID("f3047cd8-56e6-46e4-ac2d-757550c1f62a")
+
+    cursor = encode_cursor(start_time, booking_id)
+
+    assert "=" not in cursor
+    assert decode_cursor(cursor) == (start_time, booking_id)
+
+
+@pytest.mark.parametrize("cursor", ["broken", "", "!!!", encode_cursor(datetime.datetime(2025, 3, 4), uuid.uuid4())[:-4]])
+def test_decode_invalid_cursor(cursor):
+    with pytest.raises(ValueError, match="Invalid cursor"):
+        decode_cursor(cursor)
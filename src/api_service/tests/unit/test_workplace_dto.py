@@ -18,6 +18,7 @@ def test_workplace_dto_orm_conversion():
         name="VIP",
         color="#4CA50F",
         price_per_hour=750,
+        pricing_rules=None,
         created_at=datetime.datetime(2025, 3, 4, 9, 0, 0)
     )
     dummy_orm = DummyORM(
@@ -4,24 +4,44 @@ from datetime import datetime
 
 import aiohttp
 
-sent_bookings = set()
-
 
 async def send_request():
     url = "https://prod-team-37-ajc3mefd.REDACTED/api/v1/bookings/pending"
+    since = None
+
+    # забирать напоминания и уведомления листа ожидания может только администратор
+    headers = {"Authorization": f"Bearer {os.getenv('API_TOKEN')}"}
 
     async with aiohttp.ClientSession() as session:
         while True:
-            async with session.get(url) as response:
+            params = {"since": since} if since else {}
+            async with session.post(url, params=params, headers=headers) as response:
                 if response.status == 200:
                     data = await response.json()
 
-                    for booking in data:
+                    for booking in data["items"]:
                         booking_id = booking["id"]
-                        if booking_id not in sent_bookings:
-                            print(f"Уведомление для booking_id {booking_id} отправлено")
-                            async with session.post(
-                                    f"https://api.telegram.org/bot{os.getenv('BOT_TOKEN')}/sendMessage?user_id={booking['user_id']}&text=У вас забронировано место в коворкинге на сегодня в {datetime.fromisoformat(booking['start_time']).strftime('%H:%M')}") as r:
-                                sent_bookings.add(booking_id)
+                        print(f"Уведомление для booking_id {booking_id} отправлено")
+                        async with session.post(
+                                f"https://api.telegram.org/bot{os.getenv('BOT_TOKEN')}/sendMessage?user_id={booking['user_id']}&text=У вас забронировано место в коворкинге на сегодня в {datetime.fromisoformat(booking['start_time']).strftime('%H:%M')}") as r:
+                            pass
+
+                    # сервер уже пометил эти брони, дальше запрашиваем только новые
+                    since = data["since"]
+
+            async with session.get(f"{url.rsplit('/', 1)[0]}/waitlist/promoted", headers=headers) as response:
+                if response.status == 200:
+                    delivered = []
+                    for booking in await response.json():
+                        async with session.post(
+                                f"https://api.telegram.org/bot{os.getenv('BOT_TOKEN')}/sendMessage?user_id={booking['user_id']}&text=Место освободилось: вы записаны в коворкинг на {datetime.fromisoformat(booking['start_time']).strftime('%d.%m %H:%M')}") as r:
+                            if r.status == 200:
+                                delivered.append(booking["id"])
+
+                    # неподтверждённые уведомления сервер выдаст снова при следующем опросе
+                    if delivered:
+                        async with session.delete(f"{url.rsplit('/', 1)[0]}/waitlist/promoted", headers=headers,
+                                                  params=[("booking_id", booking_id) for booking_id in delivered]):
+                            pass
 
             await asyncio.sleep(10)